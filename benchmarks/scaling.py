@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling benchmark of the :class:`~tabledataextractor.table.table.Table` construction.
+
+Synthetic tables of increasing size are analyzed, and the time of the construction of the table, which runs all steps
+of the analysis, is reported together with the time per cell and the empirical exponent of the growth in time,
+between subsequent sizes. An exponent close to 1 means that the construction scales linearly with the number of
+cells. From the root of the repository, the package does not have to be installed::
+
+    python benchmarks/scaling.py --max-cells 1000000 --columns 10
+
+The synthetic tables have a title row, a column header with spanning group labels, a row header with a category
+column and a unique sample column, and numeric data with 5% empty cells.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# the benchmark runs from a source checkout, without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabledataextractor import Table
+
+
+def synthetic_table(n_rows, n_columns, seed=0):
+    """
+    Returns a synthetic table with a header of three rows and a row header of two columns, around a data region of
+    `n_rows` by `n_columns`.
+
+    :param n_rows: Number of data rows
+    :type n_rows: int
+    :param n_columns: Number of data columns
+    :type n_columns: int
+    :param seed: Seed of the random data
+    :type seed: int
+    :return: numpy.array
+    """
+    random = np.random.RandomState(seed)
+    table = np.full((n_rows + 3, n_columns + 2), '', dtype='<U60')
+    table[0, 0] = 'Table 1. Synthetic data'
+    table[1, 2::4] = ['Group {}'.format(group) for group in range(len(table[1, 2::4]))]
+    table[2, :2] = ['Category', 'Sample']
+    table[2, 2:] = ['Property {}'.format(column % 4) for column in range(n_columns)]
+    table[3::10, 0] = ['Category {}'.format(category) for category in range(len(table[3::10, 0]))]
+    table[3:, 1] = ['S{}'.format(row) for row in range(n_rows)]
+    data = np.char.mod('%.3f', random.rand(n_rows, n_columns))
+    data[random.rand(n_rows, n_columns) < 0.05] = ''
+    table[3:, 2:] = data
+    return table
+
+
+def benchmark(n_rows, n_columns, repeat=1, **configs):
+    """
+    Returns the shortest time of the construction of a :class:`~tabledataextractor.table.table.Table` from a
+    synthetic table, in seconds.
+
+    :param n_rows: Number of data rows
+    :type n_rows: int
+    :param n_columns: Number of data columns
+    :type n_columns: int
+    :param repeat: Number of repetitions
+    :type repeat: int
+    :param configs: Configuration keywords of the table
+    """
+    array = synthetic_table(n_rows, n_columns)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Table(array, **configs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Scaling benchmark of the Table construction.')
+    parser.add_argument('--min-cells', type=int, default=1000, help='number of data cells of the smallest table')
+    parser.add_argument('--max-cells', type=int, default=1000000, help='number of data cells of the largest table')
+    parser.add_argument('--columns', type=int, default=10, help='number of data columns')
+    parser.add_argument('--steps', type=int, default=2, help='sizes per factor of ten')
+    parser.add_argument('--repeat', type=int, default=1, help='repetitions of every size, the fastest is reported')
+    parser.add_argument('--orientation', default='original', help='orientation configuration of the tables')
+    arguments = parser.parse_args(args)
+
+    sizes = np.unique(np.logspace(math.log10(arguments.min_cells), math.log10(arguments.max_cells),
+                                  int(round(arguments.steps * math.log10(arguments.max_cells / arguments.min_cells)))
+                                  + 1).astype(int) // arguments.columns)
+    print('{:>10} {:>8} {:>8} {:>10} {:>12} {:>9}'.format('cells', 'rows', 'columns', 'time (s)', 'us / cell',
+                                                         'exponent'))
+    previous = None
+    for n_rows in sizes.tolist():
+        seconds = benchmark(n_rows, arguments.columns, arguments.repeat, orientation=arguments.orientation)
+        cells = n_rows * arguments.columns
+        exponent = ''
+        if previous is not None:
+            exponent = '{:.2f}'.format(math.log(seconds / previous[1]) / math.log(cells / previous[0]))
+        print('{:>10} {:>8} {:>8} {:>10.3f} {:>12.2f} {:>9}'.format(cells, n_rows, arguments.columns, seconds,
+                                                                   1e6 * seconds / cells, exponent), flush=True)
+        previous = cells, seconds
+
+
+if __name__ == '__main__':
+    main()
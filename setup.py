@@ -12,11 +12,11 @@ setup(name='tabledataextractor',
       long_description_content_type='text/markdown',
       zip_safe=False,
       test_suite='unittest',
+      entry_points={'console_scripts': ['tde = tabledataextractor.cli:main']},
       install_requires=[
             'django>2.1.6',
             'numpy==1.16; python_version < "3.7.0"',
             'numpy>=1.16,<2.0.0; python_version >= "3.7.0"',
-            'sympy',
             'beautifulsoup4>=4.12.0',
             'requests>=2.21.0',
             'urllib3>=1.24.2',
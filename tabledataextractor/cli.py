@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Command-line batch converter, installed as the ``tde`` console command.
+
+Runs `TableDataExtractor` on `.csv` and `.html` files, given as files, directories or glob patterns, and writes the
+results to a `JSONL` or `CSV` file::
+
+    tde tables/ 'supplementary/**/*.html' -j 8 -o results.jsonl
+
+In `JSONL` format, one line is written for every table, with the critical cells, the pre-cleaned table, the labels and
+the category table.
+In `CSV` format, one row is written for every cell of the pre-cleaned table, with its position, label and value.
+For data cells, the row and column categories are included as well.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import argparse
+import ast
+import csv
+import glob
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from tabledataextractor import __version__
+from tabledataextractor.output.export import open_output, infer_compression, COMPRESSIONS
+
+log = logging.getLogger(__name__)
+
+#: File extensions that are recognized as input tables.
+INPUT_EXTENSIONS = ('.csv', '.html')
+
+#: Header of the `CSV` output.
+CSV_FIELDS = ['source', 'table_number', 'row', 'column', 'label', 'value', 'row_categories', 'column_categories']
+
+
+def find_inputs(paths):
+    """
+    Yields all input files for the given files, directories and glob patterns, in a reproducible order.
+    Directories are searched recursively.
+
+    :param paths: Files, directories or glob patterns
+    :type paths: list[str]
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirectories, files in os.walk(path):
+                subdirectories.sort()
+                for name in sorted(files):
+                    if name.endswith(INPUT_EXTENSIONS):
+                        yield os.path.join(directory, name)
+        elif os.path.isfile(path):
+            yield path
+        else:
+            matches = sorted(match for match in glob.glob(path, recursive=True)
+                             if os.path.isfile(match) and match.endswith(INPUT_EXTENSIONS))
+            if not matches:
+                sys.stderr.write('No input files found for "{}".\n'.format(path))
+            yield from matches
+
+
+def parse_configs(items):
+    """
+    Parses ``KEY=VALUE`` configuration items into keyword arguments for :class:`~tabledataextractor.table.table.Table`.
+    Values are Python literals, e.g. ``use_title_row=False`` or ``row_header=0``.
+
+    :param items: Configuration items
+    :type items: list[str]
+    :return: dict
+    """
+    configs = {}
+    for item in items:
+        key, separator, value = item.partition('=')
+        if not separator:
+            raise argparse.ArgumentTypeError('Configuration "{}" is not of the form KEY=VALUE.'.format(item))
+        try:
+            configs[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            raise argparse.ArgumentTypeError('Configuration value "{}" is not a Python literal.'.format(value))
+    return configs
+
+
+def extract(job):
+    """
+    Runs `TableDataExtractor` on a single input file. Used by the worker processes.
+
+    :param job: Path of the input file, table number and configuration keywords
+    :type job: (str, int, dict)
+    :return: (str, dict, str) -- path, result record (`None` on failure) and error message (`None` on success)
+    """
+    from tabledataextractor import Table
+
+    path, table_number, configs = job
+    try:
+        table = Table(path, table_number=table_number, **configs)
+        record = {'source': path,
+                  'table_number': table_number,
+                  'critical_cells': {'cc1': _cell(table._cc1), 'cc2': _cell(table._cc2),
+                                     'cc3': _cell(table._cc3), 'cc4': _cell(table._cc4)},
+                  'pre_cleaned_table': table.pre_cleaned_table.tolist(),
+                  'labels': table.labels.tolist(),
+                  'category_table': table.category_table}
+    except Exception as e:
+        return path, None, '{}: {}'.format(type(e).__name__, e)
+    return path, record, None
+
+
+def _cell(cell):
+    """Converts a critical cell to a list of Python integers."""
+    return [int(index) for index in cell]
+
+
+def write_jsonl(record, f):
+    """Writes a result record as a single `JSONL` line."""
+    f.write(json.dumps(record, ensure_ascii=False))
+    f.write('\n')
+
+
+def write_csv(record, writer):
+    """Writes a result record as one `CSV` row per cell of the pre-cleaned table."""
+    cc3 = record['critical_cells']['cc3']
+    cc4 = record['critical_cells']['cc4']
+    n_data_columns = cc4[1] - cc3[1] + 1
+    category_table = record['category_table']
+    for row_index, (row, labels) in enumerate(zip(record['pre_cleaned_table'], record['labels'])):
+        for column_index, (value, label) in enumerate(zip(row, labels)):
+            row_categories, column_categories = '', ''
+            if cc3[0] <= row_index <= cc4[0] and cc3[1] <= column_index <= cc4[1]:
+                value, row_categories, column_categories = \
+                    category_table[(row_index - cc3[0]) * n_data_columns + column_index - cc3[1]]
+                row_categories = json.dumps(row_categories, ensure_ascii=False)
+                column_categories = json.dumps(column_categories, ensure_ascii=False)
+            writer.writerow([record['source'], record['table_number'], row_index, column_index, label, value,
+                             row_categories, column_categories])
+
+
+def _initialize_worker(log_level):
+    """Sets the logging level in a worker process."""
+    logging.getLogger().setLevel(log_level)
+
+
+def build_parser():
+    """Returns the :class:`argparse.ArgumentParser` of the ``tde`` command."""
+    parser = argparse.ArgumentParser(prog='tde', description='Extracts and standardizes data from .csv and .html '
+                                                             'tables with TableDataExtractor.')
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help='.csv or .html file, directory (searched recursively) or glob pattern')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file, "-" for standard output (default); compressed if it ends with .gz or .zst')
+    parser.add_argument('-f', '--format', choices=['jsonl', 'csv'],
+                        help='output format, inferred from the output file extension if not given (default: jsonl)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes (default: 1)')
+    parser.add_argument('-t', '--table-number', type=int, default=1,
+                        help='number of the table to read from .html files (default: 1)')
+    parser.add_argument('-c', '--config', action='append', default=[], metavar='KEY=VALUE',
+                        help='configuration keyword for the Table, e.g. use_title_row=False; can be repeated')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not report progress')
+    parser.add_argument('--log-level', default='WARNING', help='logging level (default: WARNING)')
+    parser.add_argument('--version', action='version', version='%(prog)s {}'.format(__version__))
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the ``tde`` command.
+
+    :param argv: Command-line arguments, ``sys.argv[1:]`` if not given
+    :type argv: list[str]
+    :return: exit status, `0` if all tables have been processed successfully, `1` otherwise
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        configs = parse_configs(args.config)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.jobs < 1:
+        parser.error('The number of jobs has to be at least 1.')
+    output_format = args.format
+    if output_format is None:
+        output_path = args.output.lower()
+        compression = infer_compression(output_path)
+        if compression is not None:
+            output_path = output_path[:-len(COMPRESSIONS[compression])]
+        output_format = 'csv' if output_path.endswith('.csv') else 'jsonl'
+    log_level = args.log_level.upper()
+    logging.getLogger().setLevel(log_level)
+
+    paths = list(dict.fromkeys(find_inputs(args.inputs)))
+    if not paths:
+        sys.stderr.write('No input files found.\n')
+        return 1
+    jobs = [(path, args.table_number, configs) for path in paths]
+    progress = not args.quiet
+
+    if args.output == '-':
+        f = sys.stdout
+    else:
+        f = open_output(args.output)
+
+    executor = None
+    if args.jobs > 1 and len(jobs) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs, initializer=_initialize_worker, initargs=(log_level,))
+        results = executor.map(extract, jobs, chunksize=max(1, min(64, len(jobs) // (4 * args.jobs))))
+    else:
+        results = map(extract, jobs)
+
+    errors = []
+    try:
+        writer = None
+        if output_format == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+        for n, (path, record, error) in enumerate(results, start=1):
+            if error is not None:
+                errors.append((path, error))
+            elif writer is not None:
+                write_csv(record, writer)
+            else:
+                write_jsonl(record, f)
+            if progress:
+                sys.stderr.write('\r[{}/{}] {} failed'.format(n, len(jobs), len(errors)))
+                sys.stderr.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if f is not sys.stdout:
+            f.close()
+        else:
+            f.flush()
+
+    if progress:
+        sys.stderr.write('\n')
+    sys.stderr.write('Processed {} tables, {} succeeded, {} failed.\n'.format(len(jobs), len(jobs) - len(errors),
+                                                                               len(errors)))
+    for path, error in errors:
+        sys.stderr.write('  {}: {}\n'.format(path, error))
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
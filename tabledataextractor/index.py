@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent search index over a corpus of extracted tables, stored in an `SQLite` database with full-text search
+(`FTS5 <https://www.sqlite.org/fts5.html>`_).
+
+Every table is analyzed once, when it is added to the index. The index stores the row categories, the column
+categories and the data values of the table, so that a corpus can be searched without analyzing the tables again::
+
+    with TableIndex('corpus.db') as index:
+        for path in paths:
+            index.add(Table(path), source=path)
+        index.search(column_category='Tc')
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+import sqlite3
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Columns of the full-text index that can be searched.
+FIELDS = ('row_categories', 'column_categories', 'data')
+
+# the table names are prefixed, such that the index can share a database with the tables written by
+# tabledataextractor.output.to_sqlite
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_tables (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    table_number INTEGER NOT NULL,
+    UNIQUE (source, table_number)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS index_tables_fts USING fts5(row_categories, column_categories, data);
+"""
+
+
+def _terms(array, exclude=()):
+    """Returns the distinct non-empty cells of an array, one per line."""
+    if array is None or np.size(array) == 0:
+        return ''
+    return '\n'.join(cell for cell in np.unique(array).tolist() if cell.strip() and cell not in exclude)
+
+
+def _phrase(text):
+    """Quotes `text` as an `FTS5` phrase, so that it is matched literally."""
+    return '"{}"'.format(text.replace('"', '""'))
+
+
+class TableIndex:
+    """
+    Search index over a corpus of tables.
+
+    :param path: Path to the `SQLite` database, created if it doesn't exist; ``':memory:'`` for an in-memory index
+    :type path: str
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        log.info("Table index opened: {}".format(path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT count(*) FROM index_tables").fetchone()[0]
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+    def add(self, table, source, table_number=1):
+        """
+        Adds a table to the index. A table that has already been indexed under the same `source` and `table_number`
+        is replaced.
+
+        :param table: Analyzed table
+        :type table: ~tabledataextractor.table.table.Table
+        :param source: Name of the table in the corpus, e.g. the path of the input file
+        :type source: str
+        :param table_number: Number of the table in the source
+        :type table_number: int
+        :return: id of the table in the index
+        """
+        with self._connection:
+            return self._add(table, source, table_number)
+
+    def add_many(self, tables):
+        """
+        Adds several tables to the index, in a single transaction.
+
+        :param tables: Tuples of table, source and table number, as for :meth:`add`
+        :type tables: iterable of (~tabledataextractor.table.table.Table, str, int)
+        :return: list of table ids
+        """
+        with self._connection:
+            return [self._add(table, source, table_number) for table, source, table_number in tables]
+
+    def _add(self, table, source, table_number):
+        """Adds a table to the index, within an open transaction."""
+        row = self._connection.execute("SELECT id FROM index_tables WHERE source = ? AND table_number = ?",
+                                       (source, table_number)).fetchone()
+        if row is not None:
+            self._connection.execute("DELETE FROM index_tables_fts WHERE rowid = ?", row)
+            self._connection.execute("DELETE FROM index_tables WHERE id = ?", row)
+        table_id = self._connection.execute("INSERT INTO index_tables (source, table_number) VALUES (?, ?)",
+                                            (source, table_number)).lastrowid
+        self._connection.execute("INSERT INTO index_tables_fts (rowid, row_categories, column_categories, data) "
+                                 "VALUES (?, ?, ?, ?)",
+                                 (table_id, _terms(table.row_header), _terms(table.col_header),
+                                  _terms(table.data, exclude=('NoValue',))))
+        log.debug("Table {} of {} indexed with id {}.".format(table_number, source, table_id))
+        return table_id
+
+    def remove(self, source, table_number=1):
+        """
+        Removes a table from the index.
+
+        :param source: Name of the table in the corpus
+        :type source: str
+        :param table_number: Number of the table in the source
+        :type table_number: int
+        :return: `True` if the table was in the index
+        """
+        with self._connection:
+            row = self._connection.execute("SELECT id FROM index_tables WHERE source = ? AND table_number = ?",
+                                           (source, table_number)).fetchone()
+            if row is None:
+                return False
+            self._connection.execute("DELETE FROM index_tables_fts WHERE rowid = ?", row)
+            self._connection.execute("DELETE FROM index_tables WHERE id = ?", row)
+            return True
+
+    def search(self, row_category=None, column_category=None, data=None, query=None, limit=None):
+        """
+        Returns the tables that match all of the given criteria, best matches first.
+
+        `row_category`, `column_category` and `data` are matched as phrases of whole words, case-insensitive,
+        e.g. ``column_category='Tc'`` matches the column category ``'Tc (K)'``. `query` is passed to the index as is,
+        in the `FTS5 query syntax <https://www.sqlite.org/fts5.html#full_text_query_syntax>`_, with the columns
+        ``row_categories``, ``column_categories`` and ``data``, e.g. ``'column_categories: lattice*'``.
+
+        :param row_category: Phrase that has to occur in the row categories
+        :type row_category: str
+        :param column_category: Phrase that has to occur in the column categories
+        :type column_category: str
+        :param data: Phrase that has to occur in the data
+        :type data: str
+        :param query: `FTS5` query
+        :type query: str
+        :param limit: Maximum number of results
+        :type limit: int
+        :return: list of (str, int) -- source and table number of the matching tables
+        """
+        criteria = []
+        for field, phrase in zip(FIELDS, (row_category, column_category, data)):
+            if phrase is not None:
+                criteria.append('{}: {}'.format(field, _phrase(phrase)))
+        if query is not None:
+            criteria.append('({})'.format(query))
+        if not criteria:
+            raise ValueError('No search criteria given.')
+
+        sql = "SELECT index_tables.source, index_tables.table_number FROM index_tables_fts " \
+              "JOIN index_tables ON index_tables.id = index_tables_fts.rowid " \
+              "WHERE index_tables_fts MATCH ? ORDER BY rank"
+        parameters = [' AND '.join(criteria)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return [tuple(row) for row in self._connection.execute(sql, parameters)]
@@ -5,14 +5,26 @@ Analyzes the input and calls the appropriate input module.
 
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
+import io
 import os.path
+import re
+import numpy as np
+import pandas as pd
 from tabledataextractor.input import from_html
 from tabledataextractor.input import from_csv
 from tabledataextractor.input import from_list
+from tabledataextractor.input import from_array
+from tabledataextractor.input import from_pandas
 import logging
 
 log = logging.getLogger(__name__)
 
+#: Finds the start of a table element in `html` content.
+_HTML_TABLE = re.compile(r'<table[\s>]', re.IGNORECASE)
+
+#: Maximum length of the description of an input, see :func:`~tabledataextractor.input.from_any.describe`.
+_DESCRIPTION_LENGTH = 80
+
 
 def url(name):
     """
@@ -55,27 +67,119 @@ def csv(name):
         return False
 
 
+def content(name):
+    """
+    Returns `True` if the input string is the content of a table (`html` or `csv` text) rather than a path or `URL`.
+    Paths and `URLs` never contain line breaks or markup.
+
+    :param name: Input string
+    :type name: str
+    """
+    return '\n' in name or '<' in name
+
+
+def html_content(text):
+    """
+    Returns `True` if the input text is `html` content with at least one table.
+
+    :param text: Input text
+    :type text: str
+    """
+    return _HTML_TABLE.search(text) is not None
+
+
+def describe(name_key):
+    """
+    Returns a short description of the input, for logging.
+
+    :param name_key: Input, as for :func:`~tabledataextractor.input.from_any.create_table`
+    :return: str
+    """
+    if isinstance(name_key, str):
+        description = name_key
+    elif isinstance(name_key, bytes):
+        description = '<{} bytes>'.format(len(name_key))
+    elif isinstance(name_key, (np.ndarray, pd.DataFrame)):
+        description = '<{} of shape {}>'.format(type(name_key).__name__, name_key.shape)
+    elif isinstance(name_key, list):
+        description = '<list of {} rows>'.format(len(name_key))
+    else:
+        description = '<{}>'.format(type(name_key).__name__)
+    description = description.replace('\n', ' ')
+    if len(description) > _DESCRIPTION_LENGTH:
+        description = description[:_DESCRIPTION_LENGTH - 3] + '...'
+    return description
+
+
+def read_content(text, table_number=1):
+    """
+    Reads a table from `html` or `csv` text. The format is determined from the content.
+
+    :param text: `html` or `csv` text
+    :type text: str
+    :param table_number: Number of the table that we want to input if there are several in the `html` text
+    :type table_number: int
+    :return: table as numpy.array
+    """
+    if html_content(text):
+        log.info("HTML content.")
+        return from_html.read_string(text, table_number)
+    else:
+        log.info("CSV content.")
+        return from_csv.read(io.StringIO(text))
+
+
 def create_table(name_key, table_number=1):
     """
     Checks the input and calls the appropriate modules for conversion.
     Returns a numpy array with the raw table.
 
-    :param name_key: Path to `.html` or `.cvs` file, `URL` or `python list` that is used as input
-    :type name_key: str | list
+    :param name_key: Path to `.html` or `.cvs` file, `URL`, `html` or `csv` content as `str` or `bytes`, file object,
+                     `python list`, `numpy array` or `pandas DataFrame` that is used as input
+    :type name_key: str | bytes | io.IOBase | list | numpy.ndarray | pandas.DataFrame
     :param table_number: Number of the table that we want to input if there are several at the given address/path
     :type table_number: int
     :return: table as numpy.array
     """
 
-    if isinstance(name_key, list):
+    if isinstance(name_key, np.ndarray):
+        log.info("Input is numpy array.")
+        return from_array.read(name_key)
+
+    elif isinstance(name_key, pd.DataFrame):
+        log.info("Input is pandas DataFrame.")
+        return from_pandas.read(name_key)
+
+    elif isinstance(name_key, list):
         log.info("Input is list type.")
         if len(name_key) > 0:
             return from_list.read(name_key)
         else:
-            msg = 'Input is invalid. ' \
-                  'Supported are: path to .html or .cvs file, URL or multidimensional python list object'
+            msg = 'Input is invalid. Supported are: path to .html or .cvs file, URL, html or csv content, ' \
+                  'file object, multidimensional python list object, numpy array or pandas DataFrame'
             log.critical(msg)
-            raise TypeError(msg, str(name_key))
+            raise TypeError(msg, describe(name_key))
+
+    elif isinstance(name_key, bytes):
+        log.info("Input is bytes.")
+        return read_content(name_key.decode('utf-8'), table_number)
+
+    elif hasattr(name_key, 'read'):
+        log.info("Input is file object.")
+        text = name_key.read()
+        if isinstance(text, bytes):
+            text = text.decode('utf-8')
+        return read_content(text, table_number)
+
+    elif not isinstance(name_key, str):
+        msg = 'Input is invalid. Supported are: path to .html or .cvs file, URL, html or csv content, file object, ' \
+              'multidimensional python list object, numpy array or pandas DataFrame'
+        log.critical(msg)
+        raise TypeError(msg, describe(name_key))
+
+    elif content(name_key):
+        log.info("Input is content.")
+        return read_content(name_key, table_number)
 
     elif url(name_key):
         log.info("Url: {}".format(name_key))
@@ -90,8 +194,9 @@ def create_table(name_key, table_number=1):
         return from_csv.read(name_key)
 
     else:
-        msg = 'Input is invalid. Supported are: path to .html or .cvs file, URL or multidimensional python list object'
+        msg = 'Input is invalid. Supported are: path to .html or .cvs file, URL, html or csv content, file object, ' \
+              'multidimensional python list object, numpy array or pandas DataFrame'
         log.critical(msg)
-        raise TypeError(msg, str(name_key))
+        raise TypeError(msg, describe(name_key))
 
 
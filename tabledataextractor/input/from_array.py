@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Inputs from a Numpy array.
+"""
+
+import numpy as np
+import logging
+
+log = logging.getLogger(__name__)
+
+
+def read(array):
+    """
+    Returns the input array as a numpy array of strings. No copy is made if the array already has the correct type.
+    In arrays of objects, `None` is converted to an empty cell.
+
+    :param array: Input array
+    :type array: numpy.ndarray
+    :return: numpy.ndarray
+    """
+    if array.dtype == np.dtype('<U60'):
+        return array
+    elif array.dtype == object:
+        missing = np.equal(array, None)
+        array = array.astype('<U60')
+        array[missing] = ''
+        return array
+    else:
+        return array.astype('<U60')
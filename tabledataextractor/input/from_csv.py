@@ -1,26 +1,116 @@
 # -*- coding: utf-8 -*-
 """
 Reads a `csv` formatted table from file. The file has to be 'utf-8' encoded.
+
+The file is streamed twice: the first pass determines the shape of the table, the second pass fills a preallocated
+array in chunks of rows. In this way, the peak memory stays close to the size of the final array, even for very
+large files.
 """
 
 import numpy as np
 import logging
 import csv
+from tabledataextractor.exceptions import InputError
 
 log = logging.getLogger(__name__)
 
+#: Number of rows that are parsed before they are copied into the array.
+CHUNK_SIZE = 10000
+
+#: Number of characters that are used to sniff the `csv` dialect.
+SNIFF_SIZE = 65536
+
+#: Ways of handling rows with a different number of cells than the table.
+RAGGED = ('drop', 'pad', 'error')
+
 
-def read(file_path):
+def read(file_path, dialect='excel', ragged='drop', chunk_size=CHUNK_SIZE):
     """
-    :param file_path: Path to `.csv` input file
-    :type file_path: str
+    :param file_path: Path to `.csv` input file, or a seekable text file object
+    :type file_path: str | io.TextIOBase
+    :param dialect: `csv` dialect, as accepted by :func:`csv.reader`, or ``'sniff'`` to detect the dialect from the
+                    beginning of the file
+    :type dialect: str | csv.Dialect
+    :param ragged: Handling of rows with a different number of cells than the first row. ``'drop'`` leaves them out,
+                   ``'pad'`` keeps all rows and pads them with empty cells to the length of the longest row and
+                   ``'error'`` raises an :class:`~tabledataextractor.exceptions.InputError`. Empty lines are always
+                   skipped.
+    :type ragged: str
+    :param chunk_size: Number of rows that are copied into the array at once
+    :type chunk_size: int
     :return: numpy.ndarray
     """
+    if ragged not in RAGGED:
+        raise ValueError('Handling of ragged rows "{}" does not exist. Use one of {}.'.format(ragged, RAGGED))
 
+    if hasattr(file_path, 'read'):
+        return _read(file_path, dialect, ragged, chunk_size)
     with open(file_path, 'r', encoding='utf-8') as f:
-        array = [elem for elem in list(csv.reader(f)) if elem]
-        n = len(array[0])
-        array = [x for x in array if len(x) == n]  # Only include rows with data for every column
-        array = np.asarray(array, dtype='<U60')
-    return array
+        return _read(f, dialect, ragged, chunk_size)
+
+
+def sniff_dialect(f):
+    """
+    Detects the `csv` dialect from the beginning of a file. Falls back to the ``'excel'`` dialect.
+
+    :param f: Seekable text file object, will be rewound to its initial position
+    :return: csv.Dialect
+    """
+    position = f.tell()
+    sample = f.read(SNIFF_SIZE)
+    f.seek(position)
+    try:
+        return csv.Sniffer().sniff(sample)
+    except csv.Error:
+        log.debug("Dialect of csv file could not be determined, 'excel' dialect is used.")
+        return csv.get_dialect('excel')
+
 
+def _read(f, dialect, ragged, chunk_size):
+    """Reads an open file in two passes, see :func:`~tabledataextractor.input.from_csv.read`."""
+    if dialect == 'sniff':
+        dialect = sniff_dialect(f)
+    start = f.tell()
+
+    # first pass, find the shape of the table
+    n_rows = 0
+    n_columns = None
+    for line_number, row in enumerate(csv.reader(f, dialect), start=1):
+        if not row:
+            continue
+        if n_columns is None:
+            n_columns = len(row)
+        if len(row) == n_columns:
+            n_rows += 1
+        elif ragged == 'pad':
+            n_columns = max(n_columns, len(row))
+            n_rows += 1
+        elif ragged == 'error':
+            msg = 'Row on line {} has {} cells, expected {}.'.format(line_number, len(row), n_columns)
+            log.critical(msg)
+            raise InputError(msg)
+    if n_columns is None:
+        return np.empty((0, 0), dtype='<U60')
+
+    # second pass, fill the array
+    f.seek(start)
+    array = np.full((n_rows, n_columns), fill_value='', dtype='<U60')
+    row_index = 0
+    chunk = []
+    for row in csv.reader(f, dialect):
+        if len(row) == n_columns:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                array[row_index:row_index + len(chunk)] = chunk
+                row_index += len(chunk)
+                chunk = []
+        elif row and ragged == 'pad':
+            if chunk:
+                array[row_index:row_index + len(chunk)] = chunk
+                row_index += len(chunk)
+                chunk = []
+            array[row_index, :len(row)] = row
+            row_index += 1
+    if chunk:
+        array[row_index:row_index + len(chunk)] = chunk
+    return array
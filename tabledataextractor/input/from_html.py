@@ -1,131 +1,231 @@
 # -*- coding: utf-8 -*-
 """
 Reads an `html` formatted table.
+
+Tables in `html` files are located with a byte-offset index, see :func:`~tabledataextractor.input.from_html.index_tables`,
+so that only the requested table is parsed, instead of the whole document.
+By default, all parsers skip the markup outside of `<table>` elements (`tables_only=True`), which saves most of the
+parsing time and memory for web pages.
 """
 
 
 import numpy as np
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.ie.options import Options as IeOptions
-import copy
+import functools
 import logging
+import mmap
+import os
+import re
 from tabledataextractor.exceptions import InputError
 
 log = logging.getLogger(__name__)
 
+#: Finds comments, scripts, styles and table start/end tags in the raw bytes of an `html` document.
+#: Comments, scripts and styles are matched only so that table tags inside them are skipped.
+_TAG_SCAN = re.compile(rb'<!--.*?(?:-->|\Z)|<(script|style)\b.*?(?:</\1\s*>|\Z)|<(/?)table(?=[\s/>])[^>]*>',
+                       re.DOTALL | re.IGNORECASE)
+
+#: Leading integer of a `rowspan` or `colspan` attribute.
+_SPAN = re.compile(r'\s*(\d+)')
+
+#: Largest `colspan` that is accepted, as in the `html` standard.
+MAX_COLSPAN = 1000
+
+#: Restricts parsing to table elements, see :func:`~tabledataextractor.input.from_html.parse`.
+TABLE_STRAINER = SoupStrainer("table")
+
+#: Number of `html` files whose byte-offset indexes of the tables are cached, the least recently used are dropped.
+TABLE_INDEX_CACHE_SIZE = 256
+
+
+def _span(cell, attribute, maximum):
+    """
+    Returns the `rowspan` or `colspan` of a cell as a positive integer. Missing or invalid values count as `1`,
+    and values are limited to `maximum`. A `rowspan` of `0` spans all remaining rows and is returned as `maximum`.
+    """
+    value = cell.get(attribute)
+    if value is None:
+        return 1
+    match = _SPAN.match(value)
+    if match is None:
+        return 1
+    span = int(match.group(1))
+    if span == 0 and attribute == 'rowspan':
+        return maximum
+    return min(max(span, 1), maximum)
+
+
+def _rows(html_table):
+    """
+    Returns the cells in each row of the table, excluding the rows of nested tables. Rows without cells are included,
+    since they can be covered by cells spanning from the rows above.
+    """
+    return [row.find_all(["td", "th"], recursive=False) for row in html_table.find_all("tr")
+            if row.find_parent("table") is html_table]
+
 
 def makearray(html_table):
     """
     Creates a numpy array from an `.html` file, taking `rowspan` and `colspan` into account.
 
-    Modified from:
-        John Ricco, https://johnricco.github.io/2017/04/04/python-html/, *Using Python to scrape HTML tables with merged cells*
+    The content of cells with `rowspan`/`colspan` is duplicated into all grid cells that they span.
+    The cells are first placed on the grid, row by row, at the first column that is not occupied by a cell spanning
+    from a row above. Every row of the table is a row of the grid, also if it has no cells of its own. The size of
+    the array follows from the placed cells; rows that are shorter than the widest row are padded with empty cells,
+    and `rowspan` is clipped at the last row. The spanned regions are filled by slice assignment, and finally the
+    rows that are not covered by any cell are removed.
 
-    Added functionality for duplicating cell content for cells with `rowspan`/`colspan`.
-    The table has to be :math:`n*m`, rectangular, with the same number of columns in every row.
+    Originally modified from:
+        John Ricco, https://johnricco.github.io/2017/04/04/python-html/, *Using Python to scrape HTML tables with merged cells*
     """
-    n_cols = 0
-    n_rows = 0
+    rows = _rows(html_table)
+    n_rows = len(rows)
 
-    for row in html_table.findAll("tr"):
-        col_tags = row.find_all(["td", "th"])
-        if len(col_tags) > 0:
-            n_rows += 1
-            if len(col_tags) > n_cols:
-                n_cols = len(col_tags)
+    # placement of cells, (row, column, rowspan, colspan, text)
+    placements = []
+    # for every column, index of the first row that is not occupied by a cell spanning from above
+    occupied_until = []
+    n_cols = 0
+    for row_index, cells in enumerate(rows):
+        col_index = 0
+        for cell in cells:
+            while col_index < len(occupied_until) and occupied_until[col_index] > row_index:
+                col_index += 1
+            rowspan = _span(cell, 'rowspan', n_rows - row_index)
+            colspan = _span(cell, 'colspan', MAX_COLSPAN)
+            end = col_index + colspan
+            if end > len(occupied_until):
+                occupied_until.extend([0] * (end - len(occupied_until)))
+            occupied_until[col_index:end] = [row_index + rowspan] * colspan
+            placements.append((row_index, col_index, rowspan, colspan, cell.get_text()))
+            col_index = end
+        n_cols = max(n_cols, col_index)
 
-    # according to numpy documentation fill_value should be of type Union[int, float, complex]
-    # however, 'str' works just fine
     array = np.full((n_rows, n_cols), fill_value="", dtype='<U60')
+    covered = np.zeros(n_rows, dtype=bool)
+    for row_index, col_index, rowspan, colspan, text in placements:
+        array[row_index:row_index + rowspan, col_index:col_index + colspan] = text
+        covered[row_index:row_index + rowspan] = True
+    return array[covered]
 
-    # list to store rowspan values
-    skip_index = [0 for i in range(0, n_cols)]
 
-    # iterating over each row in the table
-    row_counter = 0
-    for row in html_table.findAll("tr"):
+def parse(markup, tables_only=True):
+    """
+    Parses `html` markup with `BeautifulSoup` and the `lxml` parser.
 
-        # skip row if it's empty
-        if len(row.find_all(["td", "th"])) == 0:
+    :param markup: `html` text or file object
+    :type markup: str | io.TextIOBase
+    :param tables_only: If `True`, only `<table>` elements and their content are parsed, everything else is skipped
+    :type tables_only: bool
+    :return: bs4.BeautifulSoup
+    """
+    if tables_only:
+        return BeautifulSoup(markup, features='lxml', parse_only=TABLE_STRAINER)
+    return BeautifulSoup(markup, features='lxml')
+
+
+def _scan_tables(data):
+    """Returns the byte offsets `(start, end)` of all tables in `data`, in the order of their start tags."""
+    offsets = []
+    open_tables = []
+    for match in _TAG_SCAN.finditer(data):
+        if match.group(2) is None:
+            # comment, script or style
             continue
+        if not match.group(2):
+            open_tables.append(len(offsets))
+            offsets.append([match.start(), None])
+        elif open_tables:
+            offsets[open_tables.pop()][1] = match.end()
+    for index in open_tables:
+        offsets[index][1] = len(data)
+    return [tuple(offset) for offset in offsets]
 
-        else:
 
-            # get all the cells containing data in this row
-            columns = row.find_all(["td", "th"])
-            col_dim = []
-            row_dim = []
-            col_dim_counter = -1
-            row_dim_counter = -1
-            col_counter = -1
-            this_skip_index = copy.deepcopy(skip_index)
-
-            for col in columns:
-
-                # determine all cell dimensions
-                colspan = col.get("colspan")
-                if not colspan:
-                    col_dim.append(1)
-                else:
-                    col_dim.append(int(colspan))
-                col_dim_counter += 1
-
-                rowspan = col.get("rowspan")
-                if not rowspan:
-                    row_dim.append(1)
-                else:
-                    row_dim.append(int(rowspan))
-                row_dim_counter += 1
-
-                # adjust column counter
-                if col_counter == -1:
-                    col_counter = 0
-                else:
-                    col_counter = col_counter + col_dim[col_dim_counter - 1]
-
-                while skip_index[col_counter] > 0:
-                    col_counter += 1
-
-                # get cell contents
-                cell_data = col.get_text()
-
-                # insert data into cell
-                array[row_counter, col_counter] = cell_data
-
-                # Insert data into neighbouring rowspan/colspan cells
-                if colspan:
-                    for spanned_col in range(col_counter+1, col_counter + int(colspan)):
-                        array[row_counter, spanned_col] = cell_data
-                if rowspan:
-                    for spanned_row in range(row_counter+1, row_counter + int(rowspan)):
-                        array[spanned_row, col_counter] = cell_data
-
-                #record column skipping index
-                if row_dim[row_dim_counter] > 1:
-                    this_skip_index[col_counter] = row_dim[row_dim_counter]
-
-        # adjust row counter
-        row_counter += 1
-
-        # adjust column skipping index
-        skip_index = [i - 1 if i > 0 else i for i in this_skip_index]
-
-    return array
-
-
-def read_file(file_path, table_number=1):
-    """Reads an .html file and returns a numpy array."""
-    file = open(file_path, encoding='UTF-8')
-    html_soup = BeautifulSoup(file, features='lxml')
-    file.close()
-    html_table = html_soup.find_all("table")[table_number-1]
-    array = makearray(html_table)
-    return array
+def index_tables(file_path):
+    """
+    Returns the byte offsets `(start, end)` of all tables in an `.html` file, in document order.
+    Nested tables are included, as for ``find_all("table")`` in `BeautifulSoup`.
+
+    The file is scanned through a memory map, without building a document tree. The index is cached and reused
+    until the file is modified, for the :data:`TABLE_INDEX_CACHE_SIZE` most recently used files.
+
+    :param file_path: Path to the `.html` file
+    :type file_path: str
+    :return: list of (int, int)
+    """
+    stat = os.stat(file_path)
+    return _index_tables(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=TABLE_INDEX_CACHE_SIZE)
+def _index_tables(file_path, mtime_ns, size):
+    """Scans an `.html` file for its tables, cached by the path, modification time and size of the file."""
+    if size == 0:
+        return []
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _scan_tables(data)
+
+
+def read_file(file_path, table_number=1, tables_only=True):
+    """
+    Reads an .html file and returns a numpy array.
+
+    Only the requested table is read from the file and parsed, using the index from
+    :func:`~tabledataextractor.input.from_html.index_tables`. If the table is not found in the index, the whole
+    document is parsed.
+
+    :param file_path: Path to the `.html` file
+    :type file_path: str
+    :param table_number: Number of Table in the file
+    :type table_number: int
+    :param tables_only: Parse only the table elements, see :func:`~tabledataextractor.input.from_html.parse`
+    :type tables_only: bool
+    """
+    offsets = index_tables(file_path)
+    if 0 < table_number <= len(offsets):
+        start, end = offsets[table_number - 1]
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            fragment = f.read(end - start)
+        # universal newlines, as for files opened in text mode
+        fragment = fragment.decode('UTF-8').replace('\r\n', '\n').replace('\r', '\n')
+        html_table = parse(fragment, tables_only).find("table")
+        if html_table is not None:
+            return makearray(html_table)
+    log.debug("Table {} not found in the index of {}, the whole document is parsed.".format(table_number, file_path))
+    with open(file_path, encoding='UTF-8') as file:
+        html_soup = parse(file, tables_only)
+    try:
+        html_table = html_soup.find_all("table")[table_number - 1]
+    except IndexError:
+        raise InputError("table_number={} is out of range".format(table_number))
+    return makearray(html_table)
+
+
+def read_string(html, table_number=1, tables_only=True):
+    """
+    Reads a table from `html` text and returns a numpy array.
+
+    :param html: `html` text
+    :type html: str
+    :param table_number: Number of Table in the text
+    :type table_number: int
+    :param tables_only: Parse only the table elements, see :func:`~tabledataextractor.input.from_html.parse`
+    :type tables_only: bool
+    """
+    html_soup = parse(html, tables_only)
+    try:
+        html_table = html_soup.find_all("table")[table_number - 1]
+    except IndexError:
+        raise InputError("table_number={} is out of range".format(table_number))
+    return makearray(html_table)
 
 
 def configure_selenium(browser='Firefox'):
@@ -146,7 +246,7 @@ def configure_selenium(browser='Firefox'):
         return None
 
 
-def read_url(url, table_number=1):
+def read_url(url, table_number=1, tables_only=True):
     """
     Reads in a table from an URL and returns a numpy array. Will try `Requests <http://docs.python-requests.org/en/master/>`_ first. If it doesn't succeed, `Selenium <https://selenium-python.readthedocs.io/>`_ will be used.
 
@@ -154,6 +254,8 @@ def read_url(url, table_number=1):
     :type url: str
     :param table_number: Number of Table on the web page.
     :type table_number: int
+    :param tables_only: Parse only the table elements, see :func:`~tabledataextractor.input.from_html.parse`
+    :type tables_only: bool
     """
 
     if not isinstance(table_number, int):
@@ -164,7 +266,7 @@ def read_url(url, table_number=1):
     # first try the requests package, if it fails do the selenium, which is much slower
     try:
         html_file = requests.get(url)
-        html_soup = BeautifulSoup(html_file.text, features='lxml')
+        html_soup = parse(html_file.text, tables_only)
         html_table = html_soup.find_all("table")[table_number - 1]
         array = makearray(html_table)
         log.info("Package 'requests' was used.")
@@ -173,7 +275,7 @@ def read_url(url, table_number=1):
         driver = configure_selenium()
         driver.get(url)
         html_file = driver.page_source
-        html_soup = BeautifulSoup(html_file, features='lxml')
+        html_soup = parse(html_file, tables_only)
         try:
             html_table = html_soup.find_all("table")[table_number-1]
         except IndexError:
@@ -11,13 +11,18 @@ log = logging.getLogger(__name__)
 
 def read(plist):
     """
-    Creates a numpy array from a Python list. Works if rows are of different length.
+    Creates a numpy array from a Python list. Works if rows are of different length, shorter rows are padded with
+    empty cells.
 
     :param plist: Input List
     :type plist: list
     :return: numpy.ndarray
     """
-    length = len(sorted(plist, key=len, reverse=True)[0])
-    array = np.array([l+[None]*(length-len(l)) for l in plist], dtype='<U60')
+    lengths = [len(row) for row in plist]
+    length = max(lengths)
+    if min(lengths) == length:
+        return np.array(plist, dtype='<U60')
+    array = np.full((len(plist), length), fill_value='', dtype='<U60')
+    for row_index, row in enumerate(plist):
+        array[row_index, :len(row)] = row
     return array
-
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Inputs from a `Pandas <http://pandas.pydata.org/>`_ `DataFrame`.
+"""
+
+import numpy as np
+import pandas as pd
+import logging
+
+log = logging.getLogger(__name__)
+
+
+def _has_labels(index):
+    """Returns `False` if the index only holds the default integer labels, `0, 1, 2, ...`."""
+    return not (isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1 and index.name is None)
+
+
+def _fill(target, values):
+    """Copies values into a string array, missing values become empty cells."""
+    target[...] = values
+    missing = pd.isna(values)
+    if missing.any():
+        target[missing] = ''
+
+
+def read(df, header=None, index=None):
+    """
+    Creates a numpy array from a `Pandas DataFrame`, without intermediate Python lists.
+    The column labels become the column header rows and the index labels become the row header columns of the table.
+    Missing values become empty cells.
+
+    :param df: Input DataFrame
+    :type df: pandas.DataFrame
+    :param header: Whether to include the column labels, one row for every level. By default, the column labels are
+                   included unless they are the default integer labels.
+    :type header: bool
+    :param index: Whether to include the index labels, one column for every level. By default, the index labels are
+                  included unless they are the default integer labels.
+    :type index: bool
+    :return: numpy.ndarray
+    """
+    if header is None:
+        header = _has_labels(df.columns)
+    if index is None:
+        index = _has_labels(df.index)
+    n_header_rows = df.columns.nlevels if header else 0
+    n_index_columns = df.index.nlevels if index else 0
+
+    array = np.empty((n_header_rows + df.shape[0], n_index_columns + df.shape[1]), dtype='<U60')
+    _fill(array[n_header_rows:, n_index_columns:], df.to_numpy())
+    array[:n_header_rows, :n_index_columns] = ''
+    for level in range(n_header_rows):
+        _fill(array[level, n_index_columns:], df.columns.get_level_values(level).to_numpy())
+    for level in range(n_index_columns):
+        _fill(array[n_header_rows:, level], df.index.get_level_values(level).to_numpy())
+        if n_header_rows and df.index.names[level] is not None:
+            array[n_header_rows - 1, level] = df.index.names[level]
+    return array
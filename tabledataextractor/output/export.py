@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Exports the artefacts of a table (raw table, pre-cleaned table, labels, category table and footnotes) to `CSV` or
+`JSONL` files, optionally compressed with `gzip` or `zstd`.
+
+Files are written through large buffers, and the compression is inferred from the file extension (``.gz`` or
+``.zst``) if it is not given. `zstd` compression requires the optional
+`zstandard <https://pypi.org/project/zstandard/>`_ package.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+#: Artefacts of a table that can be exported.
+ARTEFACTS = ('raw_table', 'pre_cleaned_table', 'labels', 'category_table', 'footnotes')
+
+#: Export formats.
+FORMATS = ('csv', 'jsonl')
+
+#: Compression methods and their file extensions.
+COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+#: Size of the write buffer in bytes.
+BUFFER_SIZE = 1024 * 1024
+
+#: Header of the `CSV` export of the category table.
+CATEGORY_TABLE_FIELDS = ['data', 'row_categories', 'column_categories']
+
+#: Header of the `CSV` export of the footnotes.
+FOOTNOTE_FIELDS = ['prefix', 'text', 'prefix_cell', 'text_cell', 'reference_cells', 'references']
+
+
+def infer_compression(file_path):
+    """
+    Returns the compression of a file from its extension, `None` for an uncompressed file.
+
+    :param file_path: Path to the file
+    :type file_path: str
+    """
+    for compression, extension in COMPRESSIONS.items():
+        if file_path.lower().endswith(extension):
+            return compression
+    return None
+
+
+def infer_format(file_path):
+    """
+    Returns the export format of a file from its extension, ignoring the extension of the compression.
+    Defaults to `CSV`.
+
+    :param file_path: Path to the file
+    :type file_path: str
+    """
+    path = file_path.lower()
+    compression = infer_compression(path)
+    if compression is not None:
+        path = path[:-len(COMPRESSIONS[compression])]
+    return 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+
+
+def open_output(file_path, compression=None, buffer_size=BUFFER_SIZE):
+    """
+    Opens a text file for writing, with a large buffer and optional compression.
+
+    :param file_path: Path to the file, overwritten if it exists
+    :type file_path: str
+    :param compression: ``'gzip'``, ``'zstd'`` or `None`; inferred from the file extension if `None`
+    :type compression: str
+    :param buffer_size: Size of the write buffer in bytes
+    :type buffer_size: int
+    :return: text file object
+    """
+    if compression is None:
+        compression = infer_compression(file_path)
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError('Compression "{}" does not exist. Use one of {}.'.format(compression,
+                                                                               tuple(COMPRESSIONS)))
+    if os.path.exists(file_path):
+        log.info("File: {} overwritten.".format(file_path))
+
+    raw = open(file_path, 'wb', buffering=buffer_size)
+    try:
+        if compression == 'gzip':
+            binary = io.BufferedWriter(_Closing(gzip.GzipFile(fileobj=raw, mode='wb'), raw), buffer_size=buffer_size)
+        elif compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd compression requires the 'zstandard' package.")
+            binary = io.BufferedWriter(_Closing(zstandard.ZstdCompressor().stream_writer(raw), raw),
+                                       buffer_size=buffer_size)
+        else:
+            binary = raw
+    except Exception:
+        raw.close()
+        raise
+    return io.TextIOWrapper(binary, encoding='utf-8', newline='')
+
+
+class _Closing(io.RawIOBase):
+    """Writable raw stream over a compressed stream, that closes the compressed stream and then the file."""
+
+    def __init__(self, stream, file):
+        self._stream = stream
+        self._file = file
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._stream.write(b)
+        return len(b)
+
+    def close(self):
+        if not self.closed:
+            self._stream.close()
+            if not self._file.closed:
+                self._file.close()
+        super().close()
+
+
+def _cell(cell):
+    """Converts a cell index into a list of Python integers, `None` stays `None`."""
+    return None if cell is None else [int(index) for index in cell]
+
+
+def records(table, artefact):
+    """
+    Yields the records of an artefact of a table: the rows of the raw table, pre-cleaned table and labels as lists,
+    and the data points of the category table and the footnotes as dictionaries.
+
+    :param table: Input table
+    :type table: ~tabledataextractor.table.table.Table
+    :param artefact: One of :data:`ARTEFACTS`
+    :type artefact: str
+    """
+    if artefact not in ARTEFACTS:
+        raise ValueError('Artefact "{}" does not exist. Use one of {}.'.format(artefact, ARTEFACTS))
+    if artefact == 'category_table':
+        for data, row_categories, column_categories in table.category_table:
+            yield {'data': data, 'row_categories': row_categories, 'column_categories': column_categories}
+    elif artefact == 'footnotes':
+        for footnote in table.footnotes or ():
+            yield {'prefix': footnote.prefix, 'text': footnote.text, 'prefix_cell': _cell(footnote.prefix_cell),
+                   'text_cell': _cell(footnote.text_cell),
+                   'reference_cells': [_cell(cell) for cell in footnote.reference_cells],
+                   'references': list(footnote.references)}
+    else:
+        yield from getattr(table, artefact).tolist()
+
+
+def write_csv(rows, f, header=None):
+    """
+    Writes rows to an open text file, as `CSV`. Lists and dictionaries in the cells are encoded as `JSON`.
+
+    :param rows: Rows, as lists, or dictionaries with the keys in `header`
+    :param f: Open text file
+    :param header: Names of the columns, written as the first row
+    :type header: list[str]
+    """
+    writer = csv.writer(f)
+    if header is not None:
+        writer.writerow(header)
+    for row in rows:
+        if isinstance(row, dict):
+            row = [row[key] for key in header]
+            row = [json.dumps(cell, ensure_ascii=False) if isinstance(cell, (list, dict)) else cell for cell in row]
+        writer.writerow(row)
+
+
+def write_jsonl(rows, f):
+    """
+    Writes rows to an open text file, as `JSONL`, one `JSON` document per line.
+
+    :param rows: Rows
+    :param f: Open text file
+    """
+    f.writelines(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+
+
+def export(table, file_path, artefact='category_table', output_format=None, compression=None):
+    """
+    Exports an artefact of a table to a file.
+
+    :param table: Input table
+    :type table: ~tabledataextractor.table.table.Table
+    :param file_path: Output location, overwritten if it exists
+    :type file_path: str
+    :param artefact: One of :data:`ARTEFACTS`
+    :type artefact: str
+    :param output_format: ``'csv'`` or ``'jsonl'``; inferred from the file extension if `None`
+    :type output_format: str
+    :param compression: ``'gzip'``, ``'zstd'`` or `None`; inferred from the file extension if `None`
+    :type compression: str
+    """
+    if output_format is None:
+        output_format = infer_format(file_path)
+    if output_format not in FORMATS:
+        raise ValueError('Format "{}" does not exist. Use one of {}.'.format(output_format, FORMATS))
+    rows = records(table, artefact)
+    header = {'category_table': CATEGORY_TABLE_FIELDS, 'footnotes': FOOTNOTE_FIELDS}.get(artefact)
+    with open_output(file_path, compression) as f:
+        if output_format == 'csv':
+            write_csv(rows, f, header)
+        else:
+            write_jsonl(rows, f)
@@ -1,77 +1,117 @@
 # -*- coding: utf-8 -*-
 """
 Functions for printing to screen in a nice format.
+
+Column widths are computed with vectorized string operations, and the text is assembled with a single ``join``.
+Large tables can be truncated to a maximum number of rows and columns, in which case the first and last rows and
+columns are shown, separated by ``...``.
 """
 
 import logging
+import sys
 import numpy as np
 from prettytable import PrettyTable
 
 log = logging.getLogger(__name__)
 
+#: Cell that marks the truncated rows and columns.
+ELLIPSIS = '...'
+
+#: Maximum number of rows of each table in the representation of a :class:`~tabledataextractor.table.table.Table`.
+REPR_MAX_ROWS = 40
+
+#: Maximum number of columns of each table in the representation of a :class:`~tabledataextractor.table.table.Table`.
+REPR_MAX_COLUMNS = 20
+
+
+def _truncate(table, limit, axis):
+    """Keeps the first and last cells of `table` along `axis`, up to `limit` in total, and inserts an ellipsis."""
+    if limit is None or table.shape[axis] <= limit:
+        return table
+    head = (limit + 1) // 2
+    tail = limit - head
+    parts = [np.take(table, range(head), axis=axis)]
+    shape = list(table.shape)
+    shape[axis] = 1
+    parts.append(np.full(shape, ELLIPSIS, dtype='<U3'))
+    if tail > 0:
+        parts.append(np.take(table, range(table.shape[axis] - tail, table.shape[axis]), axis=axis))
+    return np.concatenate(parts, axis=axis)
+
 
-def print_table(table):
+def truncate(table, max_rows=None, max_columns=None):
     """
-    Prints a table to screen.
+    Truncates a table to a maximum number of rows and columns. The first and last rows and columns are kept,
+    separated by a row and a column of ``...``.
 
-    :param table: input numpy array for printing
+    :param table: input numpy array
     :type table: numpy.array
+    :param max_rows: Maximum number of rows, all rows if `None`
+    :type max_rows: int
+    :param max_columns: Maximum number of columns, all columns if `None`
+    :type max_columns: int
+    :return: numpy.array
     """
-    n_columns = table.shape[1]
-    cell_width = np.zeros(n_columns, dtype=int)
+    return _truncate(_truncate(table, max_rows, axis=0), max_columns, axis=1)
 
-    # find the maximum cell width for each column i
-    for i, column in enumerate(table.T):
-        for cell in column:
-            if len(cell) > cell_width[i]:
-                cell_width[i] = len(cell)
 
-    # print each row
-    for row in table:
-        for i, cell in enumerate(row):
-            print("{:{cell_width}} ".format(cell, cell_width=cell_width[i]+1), end='', flush=True)
-        print("\n", end='', flush=True)
-    print("\n", flush=True)
-
-
-def as_string(table):
+def as_string(table, max_rows=None, max_columns=None):
     """
     Returns table as string for printing.
 
     :param table: input numpy array
     :type table: numpy.array
+    :param max_rows: Maximum number of rows to show, all rows if `None`
+    :type max_rows: int
+    :param max_columns: Maximum number of columns to show, all columns if `None`
+    :type max_columns: int
     :return: string
     """
-    n_columns = table.shape[1]
-    cell_width = np.zeros(n_columns, dtype=int)
-    output = ''
-
-    # find the maximum cell width for each column i
-    for i, column in enumerate(table.T):
-        for cell in column:
-            if len(cell) > cell_width[i]:
-                cell_width[i] = len(cell)
-
-    # print each row
-    for row in table:
-        for i, cell in enumerate(row):
-            output += "{:{cell_width}} ".format(cell, cell_width=cell_width[i]+1)
-        output += "\n"
-    output += "\n"
-    return output
-
-
-def list_as_PrettyTable(table_list):
+    table = truncate(np.asarray(table, dtype=str), max_rows, max_columns)
+    if table.size == 0:
+        return '\n' * (len(table) + 1)
+
+    # maximum cell width for each column, every cell is followed by two spaces at least
+    cell_width = np.char.str_len(table).max(axis=0)
+    columns = [np.char.ljust(column, width + 2) for column, width in zip(table.T, cell_width.tolist())]
+    lines = [''.join(row) for row in zip(*[column.tolist() for column in columns])]
+    return '\n'.join(lines) + '\n\n'
+
+
+def print_table(table, file=None, max_rows=None, max_columns=None):
+    """
+    Prints a table to screen.
+
+    :param table: input numpy array for printing
+    :type table: numpy.array
+    :param file: Stream to print to, `sys.stdout` by default
+    :param max_rows: Maximum number of rows to show, all rows if `None`
+    :type max_rows: int
+    :param max_columns: Maximum number of columns to show, all columns if `None`
+    :type max_columns: int
+    """
+    file = sys.stdout if file is None else file
+    file.write(as_string(table, max_rows=max_rows, max_columns=max_columns) + '\n')
+    file.flush()
+
+
+def list_as_PrettyTable(table_list, max_rows=None):
     """
     Turns list into :class:`PrettyTable` object, ready for printing.
 
     :param table_list: list to be printed
+    :param max_rows: Maximum number of rows to include, all rows if `None`
+    :type max_rows: int
     :return: table as `PrettyTable <https://pypi.org/project/PrettyTable/>`_
 
     """
     t = PrettyTable()
     t.field_names = ["Data", "Row Categories", "Column Categories"]
-    for row in table_list:
+    if max_rows is not None and len(table_list) > max_rows:
+        head = (max_rows + 1) // 2
+        rows = table_list[:head] + [[ELLIPSIS] * 3] + table_list[len(table_list) - (max_rows - head):]
+    else:
+        rows = table_list
+    for row in rows:
         t.add_row(row)
     return t
-
@@ -5,12 +5,12 @@ Outputs the table to cvs.
 
 import logging
 import csv
-import os
+from tabledataextractor.output.export import open_output
 
 log = logging.getLogger(__name__)
 
 
-def write_to_csv(table, file_path):
+def write_to_csv(table, file_path, compression=None):
     """
     Writes a numpy array table to a .csv file.
     Overrides existing files.
@@ -19,8 +19,9 @@ def write_to_csv(table, file_path):
     :type table: ndarray
     :param file_path: Output location
     :type file_path: str
+    :param compression: ``'gzip'``, ``'zstd'`` or `None`; inferred from the file extension if `None`,
+                        see :func:`~tabledataextractor.output.export.open_output`
+    :type compression: str
     """
-    if os.path.exists(file_path):
-        log.info("File: {} overwritten.".format(file_path))
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with open_output(file_path, compression) as f:
         csv.writer(f).writerows(table)
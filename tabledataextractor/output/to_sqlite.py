@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Outputs tables to an `SQLite` database, in a normalised schema:
+
+    * ``tables``: source, table number, shape of the pre-cleaned table, orientation and the critical cells
+      (region boundaries) of every table
+    * ``data_points``: data values, with their row and column index in the data region
+    * ``categories``: row and column categories, with the index of the data row or column they belong to and their
+      level in the header
+    * ``footnotes`` and ``footnote_references``: footnote prefixes, texts and the cells that reference them
+    * ``cells``: every cell of the pre-cleaned table with its label (optional)
+
+The category table of a table is obtained by joining ``data_points`` with ``categories``, on the row index for row
+categories and on the column index for column categories.
+
+Rows are inserted in batches with ``executemany``, and every batch is committed as a single transaction.
+"""
+
+import itertools
+import logging
+import sqlite3
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Number of rows that are inserted in a single transaction.
+BATCH_SIZE = 50000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tables (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    table_number INTEGER NOT NULL,
+    n_rows INTEGER NOT NULL,
+    n_columns INTEGER NOT NULL,
+    transposed INTEGER NOT NULL,
+    cc1_row INTEGER, cc1_column INTEGER,
+    cc2_row INTEGER, cc2_column INTEGER,
+    cc3_row INTEGER, cc3_column INTEGER,
+    cc4_row INTEGER, cc4_column INTEGER,
+    UNIQUE (source, table_number)
+);
+CREATE TABLE IF NOT EXISTS data_points (
+    table_id INTEGER NOT NULL REFERENCES tables (id) ON DELETE CASCADE,
+    row INTEGER NOT NULL,
+    column INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (table_id, row, column)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS categories (
+    table_id INTEGER NOT NULL REFERENCES tables (id) ON DELETE CASCADE,
+    axis TEXT NOT NULL CHECK (axis IN ('row', 'column')),
+    position INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (table_id, axis, position, level)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS footnotes (
+    table_id INTEGER NOT NULL REFERENCES tables (id) ON DELETE CASCADE,
+    footnote INTEGER NOT NULL,
+    prefix TEXT NOT NULL,
+    text TEXT NOT NULL,
+    prefix_row INTEGER, prefix_column INTEGER,
+    text_row INTEGER, text_column INTEGER,
+    PRIMARY KEY (table_id, footnote)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS footnote_references (
+    table_id INTEGER NOT NULL REFERENCES tables (id) ON DELETE CASCADE,
+    footnote INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    column INTEGER NOT NULL,
+    reference TEXT NOT NULL,
+    PRIMARY KEY (table_id, footnote, row, column)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cells (
+    table_id INTEGER NOT NULL REFERENCES tables (id) ON DELETE CASCADE,
+    row INTEGER NOT NULL,
+    column INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (table_id, row, column)
+) WITHOUT ROWID;
+"""
+
+_INSERT = {
+    'data_points': "INSERT INTO data_points (table_id, row, column, value) VALUES (?, ?, ?, ?)",
+    'categories': "INSERT INTO categories (table_id, axis, position, level, category) VALUES (?, ?, ?, ?, ?)",
+    'footnotes': "INSERT INTO footnotes (table_id, footnote, prefix, text, prefix_row, prefix_column, text_row, "
+                 "text_column) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    'footnote_references': "INSERT INTO footnote_references (table_id, footnote, row, column, reference) "
+                           "VALUES (?, ?, ?, ?, ?)",
+    'cells': "INSERT INTO cells (table_id, row, column, value, label) VALUES (?, ?, ?, ?, ?)",
+}
+
+
+def connect(file_path, wal=False):
+    """
+    Opens an `SQLite` database and creates the schema, if needed.
+
+    :param file_path: Path to the database, ``':memory:'`` for an in-memory database
+    :type file_path: str
+    :param wal: Use write-ahead logging, which allows reading from the database while it is being written to
+    :type wal: bool
+    :return: sqlite3.Connection
+    """
+    connection = sqlite3.connect(file_path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    if wal:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+    with connection:
+        connection.executescript(_SCHEMA)
+    return connection
+
+
+def _cell(cell):
+    """Returns the row and column index of a cell, `(None, None)` if the cell doesn't exist."""
+    if cell is None:
+        return None, None
+    return int(cell[0]), int(cell[1])
+
+
+def _grid(table_id, array, *columns):
+    """Yields `(table_id, *columns, row, column, value)` for every cell of an array, in row-major order."""
+    rows, cols = np.indices(np.shape(array))
+    return zip(itertools.repeat(table_id), *[itertools.repeat(column) for column in columns],
+               rows.ravel().tolist(), cols.ravel().tolist(), np.ravel(array).tolist())
+
+
+def _rows(table, table_id, cells):
+    """Yields the name of the database table and a row to insert, for every row that describes `table`."""
+    # every region is read from the table only once, since the critical cells are not cached
+    for row in _grid(table_id, table.data):
+        yield 'data_points', row
+    row_header = table.row_header
+    if row_header is not None:
+        for row in _grid(table_id, row_header, 'row'):
+            yield 'categories', row
+    col_header = table.col_header
+    if col_header is not None:
+        for row in _grid(table_id, col_header.T, 'column'):
+            yield 'categories', row
+    for number, footnote in enumerate(table.footnotes or (), start=1):
+        yield 'footnotes', (table_id, number, footnote.prefix, footnote.text) + _cell(footnote.prefix_cell) + \
+            _cell(footnote.text_cell)
+        for cell, reference in zip(footnote.reference_cells, footnote.references):
+            yield 'footnote_references', (table_id, number) + _cell(cell) + (reference,)
+    if cells:
+        for row, label in zip(_grid(table_id, table.pre_cleaned_table), np.ravel(table.labels).tolist()):
+            yield 'cells', row + (label,)
+
+
+def write_to_sqlite(tables, connection, batch_size=BATCH_SIZE, cells=True):
+    """
+    Writes tables to an `SQLite` database. A table that is already in the database, with the same source and table
+    number, is replaced, together with all of its rows, also if the connection doesn't enforce foreign keys.
+
+    :param tables: Tuples of the table, its source (e.g. the path of the input file) and table number
+    :type tables: iterable of (~tabledataextractor.table.table.Table, str, int)
+    :param connection: Database connection, see :func:`~tabledataextractor.output.to_sqlite.connect`
+    :type connection: sqlite3.Connection
+    :param batch_size: Number of rows that are inserted in a single transaction
+    :type batch_size: int
+    :param cells: Whether to write every cell of the pre-cleaned table with its label
+    :type cells: bool
+    :return: list of the ids of the tables in the database
+    """
+    table_ids = []
+    batch = {name: [] for name in _INSERT}
+    n_batch = 0
+    try:
+        for table, source, table_number in tables:
+            existing = connection.execute("SELECT id FROM tables WHERE source = ? AND table_number = ?",
+                                          (source, table_number)).fetchone()
+            if existing is not None:
+                # the batched rows may still refer to the table that is replaced
+                _flush(connection, batch)
+                n_batch = 0
+                _delete(connection, existing[0])
+            shape = np.shape(table.pre_cleaned_table)
+            table_id = connection.execute(
+                "INSERT INTO tables (source, table_number, n_rows, n_columns, transposed, cc1_row, cc1_column, "
+                "cc2_row, cc2_column, cc3_row, cc3_column, cc4_row, cc4_column) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, table_number, shape[0], shape[1], int(table.history.table_transposed)) +
+                _cell(table._cc1) + _cell(table._cc2) + _cell(table._cc3) + _cell(table._cc4)).lastrowid
+            table_ids.append(table_id)
+            for name, row in _rows(table, table_id, cells):
+                batch[name].append(row)
+                n_batch += 1
+                if n_batch >= batch_size:
+                    _flush(connection, batch)
+                    n_batch = 0
+        _flush(connection, batch)
+    except Exception:
+        connection.rollback()
+        raise
+    log.info("{} tables written to SQLite.".format(len(table_ids)))
+    return table_ids
+
+
+def _delete(connection, table_id):
+    """
+    Deletes a table and its rows from the database. The rows are deleted explicitly, since the connection may not
+    enforce foreign keys, in which case ``ON DELETE CASCADE`` has no effect.
+    """
+    for name in _INSERT:
+        connection.execute("DELETE FROM {} WHERE table_id = ?".format(name), (table_id,))
+    connection.execute("DELETE FROM tables WHERE id = ?", (table_id,))
+
+
+def _flush(connection, batch):
+    """Inserts the batched rows and commits the transaction."""
+    for name, rows in batch.items():
+        if rows:
+            connection.executemany(_INSERT[name], rows)
+            rows.clear()
+    connection.commit()
@@ -2,23 +2,53 @@
 """
 Algorithms for TableDataExtractor.
 
+The algorithms don't modify the :class:`~tabledataextractor.table.table.Table` they are given. They read its
+configuration and its current `pre-cleaned table`, and return their results, together with any flags for the
+:class:`~tabledataextractor.table.history.History` of the table, which is updated by the table itself.
+Configuration that differs from the configuration of the table, like the use of the title row during the
+spanning-cells step, is passed to the algorithms explicitly.
+
 .. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
 
 """
 
 import logging
+from collections import Counter, namedtuple
 import numpy as np
-from sympy import Symbol
-from sympy import factor_list, factor
 
 from tabledataextractor.exceptions import MIPSError
 from tabledataextractor.table.parse import StringParser, CellParser
+from tabledataextractor.table import labels
+from tabledataextractor.table import factors
+from tabledataextractor.table.duplicates import Deduplicated, DuplicateIndex, deduplicate
 
 
 log = logging.getLogger(__name__)
 
+#: Regular expression that defines an empty cell, by default. See the ``empty_cell`` configuration keyword of
+#: :class:`~tabledataextractor.table.table.Table`.
+EMPTY_CELL = r'^([\s\-\–\—\"]+)?$'
+
+#: Matches cells that start with a number, see :func:`~tabledataextractor.table.algorithms.orientation_score`.
+NUMERIC_CELL = r'^\s*[\-\+\u2212\u00b1~<>≈]?\s*\(?\d'
+
+#: With ``orientation = 'auto'``, the transposed table is kept only if its
+#: :func:`~tabledataextractor.table.algorithms.orientation_score` exceeds that of the original table by more than this
+#: margin. A single stray row of notes in the data region should not flip the orientation of a table.
+ORIENTATION_MARGIN = 0.25
+
+#: Result of :func:`~tabledataextractor.table.algorithms.prefix_duplicate_labels`, whether prefixing has been
+#: performed and whether it has been performed on the rows (by adding a column).
+Prefixing = namedtuple('Prefixing', ['performed', 'rows'])
+
+#: No prefixing has been performed.
+NO_PREFIXING = Prefixing(performed=False, rows=False)
+
+#: Result of :func:`~tabledataextractor.table.algorithms.mips`.
+MIPSResult = namedtuple('MIPSResult', ['cc1', 'cc2', 'title_row_removed'])
+
 
-def empty_string(string, regex=r'^([\s\-\–\—\"]+)?$'):
+def empty_string(string, regex=EMPTY_CELL):
     """
     Returns `True` if a particular string is empty, which is defined with a regular expression.
 
@@ -32,7 +62,7 @@ def empty_string(string, regex=r'^([\s\-\–\—\"]+)?$'):
     return empty_parser.parse(string, method='fullmatch')
 
 
-def empty_cells(array, regex=r'^([\s\-\–\—\"]+)?$'):
+def empty_cells(array, regex=EMPTY_CELL):
     """
     Returns a mask with `True` for all empty cells in the original array and `False` for non-empty cells.
 
@@ -41,80 +71,74 @@ def empty_cells(array, regex=r'^([\s\-\–\—\"]+)?$'):
     :param array: Input array to return the mask for
     :type array: numpy array
     """
-    empty = np.full_like(array, fill_value=False, dtype=bool)
     empty_parser = CellParser(regex)
-    for empty_cell in empty_parser.parse(array, method='fullmatch'):
-        if array.ndim == 2:
-            empty[empty_cell[0], empty_cell[1]] = True
-        elif array.ndim == 1:
-            empty[empty_cell[0]] = True
-    return empty
+    return empty_parser.match_mask(array, method='fullmatch')
 
 
-def standardize_empty(array):
+def standardize_empty(array, array_empty=None):
     """
     Returns an array with the empty cells of the input array standardized to 'NoValue'.
 
     :param array: Input array
     :type array: numpy.array
+    :param array_empty: Mask with `True` for the empty cells of `array`, computed with
+                        :func:`~tabledataextractor.table.algorithms.empty_cells` if `None`
+    :type array_empty: numpy.array
     :return: Array with standardized empty cells
     """
+    if array_empty is None:
+        array_empty = empty_cells(array)
     standardized = np.copy(array)
-    for row_index, row in enumerate(standardized):
-        for col_index, col in enumerate(row):
-            if empty_string(col):
-                standardized[row_index, col_index] = 'NoValue'
+    standardized[array_empty] = 'NoValue'
     return standardized
 
 
-def pre_clean(array):
+def _leading(mask):
+    """Returns the number of leading `True` values of a one-dimensional mask."""
+    stops = np.flatnonzero(~mask)
+    return int(stops[0]) if stops.size else len(mask)
+
+
+def pre_clean(array, array_empty=None, cells=None):
     """
     Removes empty and duplicate rows and columns that extend over the whole table.
 
     :param array: Input Table object
     :type array: Numpy array
+    :param array_empty: Mask with `True` for the empty cells of `array`, computed with
+                        :func:`~tabledataextractor.table.algorithms.empty_cells` if `None`
+    :type array_empty: numpy.array
+    :param cells: Sparse store of the non-empty cells of `array`, used instead of `array_empty` if given
+    :type cells: ~tabledataextractor.table.cells.SparseCells
     """
 
     pre_cleaned_table = np.copy(array)
-    array_empty = empty_cells(array)
+    if cells is not None:
+        row_counts, column_counts = cells.row_counts(), cells.column_counts()
+    else:
+        if array_empty is None:
+            array_empty = empty_cells(array)
+        row_counts, column_counts = (~array_empty).sum(axis=1), (~array_empty).sum(axis=0)
 
     # find empty rows and delete them
-    empty_rows = []
-    for row_index, row in enumerate(array_empty):
-        if False not in row:
-            empty_rows.append(row_index)
+    empty_rows = np.flatnonzero(row_counts == 0).tolist()
     log.debug("Empty rows {} deleted.".format(empty_rows))
     pre_cleaned_table = np.delete(pre_cleaned_table, empty_rows, axis=0)
 
     # find empty columns and delete them
-    empty_columns = []
-    for column_index, column in enumerate(array_empty.T):
-        if False not in column:
-            empty_columns.append(column_index)
+    empty_columns = np.flatnonzero(column_counts == 0).tolist()
     log.debug("Empty columns {} deleted.".format(empty_columns))
     pre_cleaned_table = np.delete(pre_cleaned_table, empty_columns, axis=1)
 
     # delete duplicate rows that extend over the whole table
-    _, indices = np.unique(pre_cleaned_table, axis=0, return_index=True)
-    # for logging only, which rows have been removed
-    removed_rows = []
-    for row_index in range(0, len(pre_cleaned_table)):
-        if row_index not in indices:
-            removed_rows.append(row_index)
-    log.debug("Duplicate rows {} removed.".format(removed_rows))
-    # deletion:
-    pre_cleaned_table = pre_cleaned_table[np.sort(indices)]
+    rows = deduplicate(pre_cleaned_table, axis=0)
+    log.debug("Duplicate rows {} removed.".format(rows.removed))
+    pre_cleaned_table = pre_cleaned_table[rows.kept]
 
     # delete duplicate columns that extend over the whole table
-    _, indices = np.unique(pre_cleaned_table, axis=1, return_index=True)
-    # for logging only, which rows have been removed
-    removed_columns = []
-    for column_index in range(0, len(pre_cleaned_table.T)):
-        if column_index not in indices:
-            removed_columns.append(column_index)
-    log.debug("Duplicate columns {} removed.".format(removed_columns))
-    # deletion:
-    pre_cleaned_table = pre_cleaned_table[:, np.sort(indices)]
+    columns = deduplicate(pre_cleaned_table, axis=1)
+    log.debug("Duplicate columns {} removed.".format(columns.removed))
+    pre_cleaned_table = pre_cleaned_table[:, columns.kept]
 
     # clean-up unicode characters
     pre_cleaned_table = clean_unicode(pre_cleaned_table)
@@ -125,12 +149,22 @@ def pre_clean(array):
 def clean_unicode(array):
     """
     Replaces problematic unicode characters in a given numpy array.
+    As with :func:`numpy.char.replace`, the strings of the cleaned array are as long as the longest string.
+    Only the cells that contain problematic characters are replaced.
+
     :param array: input array
     :type array: numpy.array
     :return: cleaned array
     """
-    temp = np.copy(array)
-    temp = np.char.replace(temp, '\xa0', ' ')
+    if array.dtype.kind != 'U' or array.dtype.itemsize == 0 or array.size == 0:
+        return np.char.replace(np.copy(array), '\xa0', ' ')
+    code_points = np.ascontiguousarray(array).view(np.uint32).reshape(array.size, -1)
+    # strings don't end with null characters, the longest string ends in the last column with a code point
+    width = np.flatnonzero(code_points.any(axis=0))
+    temp = array.astype('<U{}'.format(int(width[-1]) + 1 if width.size else 1))
+    problematic = (code_points == ord('\xa0')).any(axis=1).reshape(array.shape)
+    if problematic.any():
+        temp[problematic] = [cell.replace('\xa0', ' ') for cell in temp[problematic].tolist()]
     return temp
 
 
@@ -146,18 +180,12 @@ def find_cc4(table_object):
     :type table_object: ~tabledataextractor.table.table.Table
     :return: cc4
     """
-    # searching from the bottom of original table:
-    n_rows = len(table_object.pre_cleaned_table)
-    for row_index in range(n_rows - 1, -1, -1):
-        # counting the number of full cells
-        # if n_empty < n_full terminate, this is our goal row
-        n_full = 0
-        n_columns = len(table_object.pre_cleaned_table_empty[row_index])
-        for empty in table_object.pre_cleaned_table_empty[row_index]:
-            if not empty:
-                n_full += 1
-            if n_full > int(n_columns / 2):
-                return row_index, n_columns - 1
+    # searching from the bottom of original table for the last row where n_empty < n_full
+    cells = table_object.pre_cleaned_table_cells
+    n_columns = cells.shape[1]
+    rows = np.flatnonzero(cells.row_counts() > int(n_columns / 2))
+    if rows.size:
+        return int(rows[-1]), n_columns - 1
 
 
 def duplicate_rows(table):
@@ -167,11 +195,7 @@ def duplicate_rows(table):
     :return: True or False
     """
     if table.ndim > 0 and table.size:
-        _, indices = np.unique(table, axis=0, return_index=True)
-        if len(table) > len(indices):
-            return True
-        else:
-            return False
+        return bool(deduplicate(table.reshape(len(table), -1), axis=0).removed)
     else:
         return False
 
@@ -183,30 +207,57 @@ def duplicate_columns(table):
     :return: True or False
     """
     if table.T.ndim > 0 and table.T.size:
-        _, indices = np.unique(table.T, axis=0, return_index=True)
-        if len(table.T) > len(indices):
-            return True
-        else:
-            return False
+        return bool(deduplicate(table.T.reshape(len(table.T), -1), axis=0).removed)
     else:
         return False
 
 
-def find_cc1_cc2(table_object, cc4, array):
+def find_cc1_cc2(table_object, cc4, array, configs=None, prefixing=None):
     """
     Main MIPS (*Minimum Indexing Point Search*) algorithm. According to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
-    Searches for critical cells `CC2` and `CC3`.
+    Searches for critical cells `CC1` and `CC2`, see :func:`~tabledataextractor.table.algorithms.mips`.
+
+    :param table_object: Input Table object
+    :type table_object: ~tabledataextractor.table.table.Table
+    :param cc4: Position of `CC4` cell found with ``find_cc4()``
+    :type cc4: (int, int)
+    :param array: table to search for `CC1` and `CC2`
+    :type array: numpy array
+    :param configs: Configuration to use instead of the configuration of the table
+    :type configs: collections.abc.Mapping
+    :param prefixing: Prefixing that has been performed on `array`, as recorded in the history of the table if `None`
+    :type prefixing: ~tabledataextractor.table.algorithms.Prefixing
+    :return: cc1, cc2
+    """
+    cc1, cc2, _ = mips(table_object, cc4, array, configs=configs, prefixing=prefixing)
+    return cc1, cc2
+
+
+def mips(table_object, cc4, array, configs=None, prefixing=None):
+    """
+    Main MIPS (*Minimum Indexing Point Search*) algorithm. According to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
+    Searches for critical cells `CC1` and `CC2`.
     MIPS locates the critical cells that define the minimum row and column headers needed to index
     every data cell.
 
     :param table_object: Input Table object
     :type table_object: ~tabledataextractor.table.table.Table
     :param cc4: Position of `CC4` cell found with ``find_cc4()``
+    :type cc4: (int, int)
     :param array: table to search for `CC1` and `CC2`
     :type array: numpy array
-    :type cc4: (int, int)
-    :return: cc1, cc2
+    :param configs: Configuration to use instead of the configuration of the table
+    :type configs: collections.abc.Mapping
+    :param prefixing: Prefixing that has been performed on `array`, as recorded in the history of the table if `None`
+    :type prefixing: ~tabledataextractor.table.algorithms.Prefixing
+    :return: ~tabledataextractor.table.algorithms.MIPSResult
     """
+    if configs is None:
+        configs = table_object.configs
+    if prefixing is None:
+        prefixing = Prefixing(table_object.history.prefixing_performed, table_object.history.prefixed_rows)
+
+    use_max_data_area = configs['use_max_data_area']
 
     # Initialize
     cc2 = None
@@ -218,96 +269,93 @@ def find_cc1_cc2(table_object, cc4, array):
     c2 = 0
     max_area = 0
 
-    def table_slice_cc2(table, r2, r_max, c1, c2):
+    # the sections of the table are given by the bounds of their rows and columns, and their duplicate rows and
+    # columns are found in the index, without slicing the table
+    index = DuplicateIndex(array)
+    debug = log.isEnabledFor(logging.DEBUG)
+
+    def sections_cc2(r1, r2, c1, c2):
         """
-        Function to cut the correct slices out of array for `CC2 `in ``find_cc1_cc2()``.
-        Cuts out the next row and column header candidates from the pre-cleaned table.
+        Bounds of the sections of the table for `CC2` in ``find_cc1_cc2()``.
+        The next row and column header candidates from the pre-cleaned table.
 
-        :param table: pre-cleaned table
+        :param r1: current r1 parameter in MIPS algorithm
         :param r2: current r2 parameter in MIPS algorithm
-        :param r_max: r_max parameter in MIPS algorithm
         :param c1: first column for MIPS algorithm
         :param c2: current c2 parameter for MIPS algorithm
         :return: (section_1, section_2)
         """
-
         # one more row and column index than in the published pseudocode is needed,
         # since the a:b notation in python doesn't include b
-        if r2 + 1 == r_max and c1 == c2:
-            section_1 = table[r2 + 1, c1]
-        elif r2 + 1 == r_max and c1 != c2:
-            section_1 = table[r2 + 1, c1:c2 + 1]
-        elif r2 + 1 != r_max and c1 != c2:
-            section_1 = table[r2 + 1:r_max + 1, c1:c2 + 1]
-        elif r2 + 1 != r_max and c1 == c2:
-            section_1 = table[r2 + 1:r_max + 1, c1]
-        else:
-            log.critical("Not defined section_1, r2+1= {}, r_max= {}, c1= {}, c2= {}".format(r2 + 1, r_max, c1, c2))
-            section_1 = None
-
+        section_1 = (r2 + 1, r_max + 1), (c1, c2 + 1)
         # contrary to the published pseudocode the row maximum is r2, not r2-1
-        # one more row and column index than in the published pseudocode is needed,
-        # since the a:b notation in python doesn't include b
-        if r1 == r2 and c2 + 1 == c_max:
-            section_2 = table[r1, c2 + 1]
-        elif r1 == r2 and c2 + 1 != c_max:
-            section_2 = table[r1, c2 + 1: c_max + 1]
-        elif r1 != r2 and c2 + 1 != c_max:
-            section_2 = table[r1: r2 + 1, c2 + 1: c_max + 1]
-        elif r1 != r2 and c2 + 1 == c_max:
-            section_2 = table[r1: r2 + 1, c2 + 1]
-        else:
-            log.critical(
-                "Not defined section_2, r2-1= {}, r1= {}, c2+1= {}, c_max= {}".format(r2 - 1, r1, c2 + 1, c_max))
-            section_2 = None
-
+        section_2 = (r1, r2 + 1), (c2 + 1, c_max + 1)
         return section_1, section_2
 
-    def table_slice_1_cc1(table, r1, r2, c2, c_max):
+    def section_1_cc1(r1, r2, c2):
         """
-        Function to cut a correct slice out of array for CC1 in _find_cc1_cc2().
-        Cuts out the column header.
+        Bounds of the section of the table for CC1 in _find_cc1_cc2().
+        The column header.
         """
-        # one more row and column index than in the published pseudocode is needed,
-        # since the a:b notation in python doesn't include b
         # contrary to the published pseudocode, the correct range is [r1:r2,c2+1:c_max] and not [r1+1:r2,c2+1:c_max]
-        if r1 == r2 and c2 + 1 == c_max:
-            section = table[r1, c2 + 1]
-        elif r1 == r2 and c2 + 1 != c_max:
-            section = table[r1, c2 + 1:c_max + 1]
-        elif r1 != r2 and c2 + 1 != c_max:
-            section = table[r1: r2 + 1, c2 + 1:c_max + 1]
-        elif r1 != r2 and c2 + 1 == c_max:
-            section = table[r1: r2 + 1, c2 + 1]
-        else:
-            log.critical(
-                "Not defined section 1 for cc1, r1+1= {}, r2= {}, c2+1= {}, c_max= {}".format(r1 + 1, r2, c2 + 1,
-                                                                                              c_max))
-            section = None
-        return section
+        return (r1, r2 + 1), (c2 + 1, c_max + 1)
 
-    def table_slice_2_cc1(table, r2, r_max, c1, c2):
+    def section_2_cc1(r2, c1, c2):
         """
-        Function to cut a correct slice out of array for CC1 in _find_cc1_cc2().
-        Cuts out the row header.
+        Bounds of the section of the table for CC1 in _find_cc1_cc2().
+        The row header.
         """
-        # one more row and column index than in the published pseudocode is needed,
-        # since the a:b notation in python doesn't include b
         # contrary to the published pseudocode, the correct range is [r2:r_max,c1:c2] and not [r2+1:c2,c1+1:r_max]
-        if r2 + 1 == r_max and c1 == c2:
-            section = table[r2 + 1, c1]
-        elif r2 + 1 == r_max and c1 != c2:
-            section = table[r2 + 1, c1: c2 + 1]
-        elif r2 + 1 != r_max and c1 != c2:
-            section = table[r2 + 1: r_max + 1, c1: c2 + 1]
-        elif r2 + 1 != r_max and c1 == c2:
-            section = table[r2 + 1: r_max + 1, c1]
-        else:
-            log.critical(
-                "Not defined section 2 for cc1, r2+1= {}, c2= {}, c1+1= {}, r_max= {}".format(r2 + 1, c2, c1 + 1,
-                                                                                              r_max))
-            section = None
-        return section
+        return (r2 + 1, r_max + 1), (c1, c2 + 1)
+
+    def section_array(section):
+        """Slices a section out of array, for logging."""
+        (r_start, r_stop), (c_start, c_stop) = section
+        return array[r_start:r_stop, c_start:c_stop]
+
+    def has_duplicate_rows(section):
+        """
+        Returns True if the section has duplicate rows.
+        A section of a single row is a one-dimensional slice of the table, and duplicate cells are searched for.
+        """
+        rows, columns = section
+        if rows[1] - rows[0] == 1:
+            return index.duplicate_columns(rows, columns)
+        return index.duplicate_rows(rows, columns)
+
+    def has_duplicate_columns(section):
+        """
+        Returns True if the section has duplicate columns.
+        A section of a single column is a one-dimensional slice of the table, and duplicate cells are searched for.
+        """
+        rows, columns = section
+        if columns[1] - columns[0] == 1:
+            return index.duplicate_rows(rows, columns)
+        return index.duplicate_columns(rows, columns)
+
+    def last_without_duplicates(r1, r2, c1, c2):
+        """
+        Returns the smallest row index, down to which r2 can be decreased from r2 without duplicates in the sections
+        for `CC2`. There are no duplicates for r2.
+
+        If section 1 has at least two rows and section 2 at least two columns, the duplicates can only appear, and not
+        disappear, as r2 decreases, since section 1 gains rows and section 2 loses rows, and the row index is found
+        by bisection.
+        """
+        if r2 + 1 >= r_max or c2 + 1 >= c_max:
+            return r2
+        # no duplicates for r2 = high, duplicates for r2 = low, or low is above the table
+        low, high = r1 - 1, r2
+        while high - low > 1:
+            middle = (low + high) // 2
+            section_1, section_2 = sections_cc2(r1, middle, c1, c2)
+            if has_duplicate_rows(section_1) or has_duplicate_columns(section_2):
+                low = middle
+            else:
+                high = middle
+        if high != r2:
+            log.debug("No duplicates for r2= {} to {}.".format(r2, high))
+        return high
 
     # MAIN MIPS algorithm
     # Locate candidate MIPs by finding the minimum indexing headers:
@@ -316,21 +364,25 @@ def find_cc1_cc2(table_object, cc4, array):
     # discriminate between duplicate rows in the row header vs duplicate columns in the column header
     while c2 < c_max and r2 >= r1:
 
-        log.debug("Entering loop:  r_max= {}, c_max= {}, c1= {}, c2= {}, r1= {}, r2= {}, cc2= {}"
-                  .format(r_max, c_max, c1, c2, r1, r2, cc2))
-
-        temp_section_1, temp_section_2 = table_slice_cc2(array, r2, r_max, c1, c2)
-
-        log.debug("temp_section_1:\n{}".format(temp_section_1))
-        log.debug("temp_section_2:\n{}".format(temp_section_2))
-        log.debug("duplicate_rows= {}, duplicate_columns= {}".
-                  format(duplicate_rows(temp_section_1), duplicate_rows(temp_section_2)))
-
-        if not duplicate_rows(temp_section_1) and not duplicate_columns(temp_section_2):
-            if table_object.configs['use_max_data_area']:
+        temp_section_1, temp_section_2 = sections_cc2(r1, r2, c1, c2)
+        duplicate_rows_1 = has_duplicate_rows(temp_section_1)
+        duplicate_columns_2 = has_duplicate_columns(temp_section_2)
+
+        if debug:
+            log.debug("Entering loop:  r_max= {}, c_max= {}, c1= {}, c2= {}, r1= {}, r2= {}, cc2= {}"
+                      .format(r_max, c_max, c1, c2, r1, r2, cc2))
+            log.debug("temp_section_1:\n{}".format(section_array(temp_section_1)))
+            log.debug("temp_section_2:\n{}".format(section_array(temp_section_2)))
+            log.debug("duplicate_rows= {}, duplicate_columns= {}".format(duplicate_rows_1, duplicate_columns_2))
+
+        if not duplicate_rows_1 and not duplicate_columns_2:
+            # the loop would step up through all rows without duplicates, and end at the last of them
+            r2 = last_without_duplicates(r1, r2, c1, c2)
+            if use_max_data_area:
                 data_area = (r_max - r2) * (c_max - c2)
-                log.debug("The data area of the new candidate C2= {} is *1: {}".format((r2, c2), data_area))
-                log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
+                if debug:
+                    log.debug("The data area of the new candidate C2= {} is *1: {}".format((r2, c2), data_area))
+                    log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
                 if data_area >= max_area:
                     max_area = data_area
                     cc2 = (r2, c2)
@@ -340,12 +392,13 @@ def find_cc1_cc2(table_object, cc4, array):
                 cc2 = (r2, c2)
                 log.debug("CC2= {}".format(cc2))
                 r2 = r2 - 1
-        elif duplicate_rows(temp_section_1) and not duplicate_columns(temp_section_2):
+        elif duplicate_rows_1 and not duplicate_columns_2:
             c2 = c2 + 1
-            if table_object.configs['use_max_data_area']:
+            if use_max_data_area:
                 data_area = (r_max - r2) * (c_max - c2)
-                log.debug("The data area of the new candidate C2= {} is *2: {}".format((r2, c2), data_area))
-                log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
+                if debug:
+                    log.debug("The data area of the new candidate C2= {} is *2: {}".format((r2, c2), data_area))
+                    log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
                 if data_area >= max_area:
                     max_area = data_area
                     cc2 = (r2, c2)
@@ -353,13 +406,14 @@ def find_cc1_cc2(table_object, cc4, array):
             else:
                 cc2 = (r2, c2)
                 log.debug("CC2= {}".format(cc2))
-        elif duplicate_rows(temp_section_1) and duplicate_columns(temp_section_2):
+        elif duplicate_rows_1 and duplicate_columns_2:
             c2 = c2 + 1
             r2 = r2 + 1
-            if table_object.configs['use_max_data_area']:
+            if use_max_data_area:
                 data_area = (r_max - r2) * (c_max - c2)
-                log.debug("The data area of the new candidate C2= {} is *3: {}".format((r2, c2), data_area))
-                log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
+                if debug:
+                    log.debug("The data area of the new candidate C2= {} is *3: {}".format((r2, c2), data_area))
+                    log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
                 if data_area >= max_area:
                     max_area = data_area
                     cc2 = (r2, c2)
@@ -369,10 +423,11 @@ def find_cc1_cc2(table_object, cc4, array):
         # if none of those above is satisfied, just finish the loop
         else:
             r2 = r2 + 1
-            if table_object.configs['use_max_data_area']:
+            if use_max_data_area:
                 data_area = (r_max - r2) * (c_max - c2)
-                log.debug("The data area of the new candidate C2= {} is *4: {}".format((r2, c2), data_area))
-                log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
+                if debug:
+                    log.debug("The data area of the new candidate C2= {} is *4: {}".format((r2, c2), data_area))
+                    log.debug("Data area:\n{}".format(array[r2 + 1:r_max + 1, c2 + 1:c_max + 1]))
                 if data_area >= max_area:
                     max_area = data_area
                     cc2 = (r2, c2)
@@ -393,17 +448,15 @@ def find_cc1_cc2(table_object, cc4, array):
     c2 = cc2[1]
 
     # Locate CC1 at intersection of the top row and the leftmost column necessary for indexing:
-    log.debug("Potentially duplicate columns:\n{}".format(table_slice_1_cc1(array, r1, r2, c2, c_max)))
-    while not duplicate_columns(table_slice_1_cc1(array, r1, r2, c2, c_max)) and r1 <= r2:
-        log.debug("Potentially duplicate columns:\n{}".format(table_slice_1_cc1(array, r1, r2, c2, c_max)))
-        log.debug("Duplicate columns= {}".format(duplicate_columns(table_slice_1_cc1(array, r1, r2, c2, c_max))))
+    while not has_duplicate_columns(section_1_cc1(r1, r2, c2)) and r1 <= r2:
+        if debug:
+            log.debug("Potentially duplicate columns:\n{}".format(section_array(section_1_cc1(r1, r2, c2))))
         r1 = r1 + 1
         log.debug("r1= {}".format(r1))
 
-    log.debug("Potentially duplicate rows:\n{}".format(table_slice_2_cc1(array, r2, r_max, c1, c2)))
-    while not duplicate_rows(table_slice_2_cc1(array, r2, r_max, c1, c2)) and c1 <= c2:
-        log.debug("Potentially duplicate rows:\n{}".format(table_slice_2_cc1(array, r2, r_max, c1, c2)))
-        log.debug("Duplicate rows= {}".format(duplicate_rows(table_slice_2_cc1(array, r2, r_max, c1, c2))))
+    while not has_duplicate_rows(section_2_cc1(r2, c1, c2)) and c1 <= c2:
+        if debug:
+            log.debug("Potentially duplicate rows:\n{}".format(section_array(section_2_cc1(r2, c1, c2))))
         c1 = c1 + 1
         log.debug("c1= {}".format(c1))
 
@@ -414,43 +467,42 @@ def find_cc1_cc2(table_object, cc4, array):
     # by definition of cc2.
     # hence, the assertions:
     try:
-        assert not duplicate_columns(table_slice_1_cc1(array, r1=0, r2=cc2[0], c2=cc2[1], c_max=c_max))
-        assert not duplicate_rows(table_slice_2_cc1(array, r2=cc2[0], r_max=r_max, c1=0, c2=cc2[1]))
+        assert not has_duplicate_columns(section_1_cc1(r1=0, r2=cc2[0], c2=cc2[1]))
+        assert not has_duplicate_rows(section_2_cc1(r2=cc2[0], c1=0, c2=cc2[1]))
         assert r1 >= 0 and c1 >= 0
         cc1 = (r1 - 1, c1 - 1)
     except AssertionError:
         raise MIPSError("Error in _find_cc1_cc2")
 
     # provision for using the uppermost row possible for cc1, if titles are turned of
-    if not table_object.configs['use_title_row']:
+    title_row_removed = False
+    if not configs['use_title_row']:
         if cc1[0] != 0:
             log.debug("METHOD. Title row removed, cc1 was shifted from {} to {}".format(cc1, (0, cc1[1])))
             cc1 = (0, cc1[1])
-            table_object.history._title_row_removed = True
-    else:
-        table_object.history._title_row_removed = False
+            title_row_removed = True
 
     # provision for using only the first column of the table as row header
-    if table_object.configs['row_header'] is not None:
-        row_header = table_object.configs['row_header']
+    if configs['row_header'] is not None:
+        row_header = configs['row_header']
         assert isinstance(row_header, int)
-        if table_object.history.prefixed_rows:
+        if prefixing.rows:
             row_header += 1
         left = min(cc1[1], row_header)
         cc1 = (cc1[0], left)
         cc2 = (cc2[0], row_header)
 
     # provision for using only the first row of the table as column header
-    if table_object.configs['col_header'] is not None:
-        col_header = table_object.configs['col_header']
+    if configs['col_header'] is not None:
+        col_header = configs['col_header']
         assert isinstance(col_header, int)
-        if table_object.history.prefixing_performed and not table_object.history.prefixed_rows:
+        if prefixing.performed and not prefixing.rows:
             col_header += 1
         top = min(cc1[0], col_header)
         cc1 = (top, cc1[1])
         cc2 = (col_header, cc2[1])
 
-    return cc1, cc2
+    return MIPSResult(cc1, cc2, title_row_removed)
 
 
 def find_cc3(table_object, cc2):
@@ -478,18 +530,14 @@ def find_cc3(table_object, cc2):
 
     # OPTION 1
     # searching from the top of table for first half-full row, starting with first row below the header:
-    n_rows = len(table_object.pre_cleaned_table[cc2[0] + 1:])
-    log.debug("n_rows= {}".format(n_rows))
-    for row_index in range(cc2[0] + 1, cc2[0] + 1 + n_rows, 1):
-        n_full = 0
-        n_columns = len(table_object.pre_cleaned_table[row_index, cc2[1] + 1:])
-        log.debug("n_columns= {}".format(n_columns))
-        for column_index in range(cc2[1] + 1, cc2[1] + 1 + n_columns, 1):
-            empty = table_object.pre_cleaned_table_empty[row_index, column_index]
-            if not empty:
-                n_full += 1
-            if n_full >= int(n_columns / 2):
-                return row_index, cc2[1] + 1
+    cells = table_object.pre_cleaned_table_cells
+    n_columns = max(cells.shape[1] - (cc2[1] + 1), 0)
+    log.debug("n_rows= {}, n_columns= {}".format(max(cells.shape[0] - (cc2[0] + 1), 0), n_columns))
+    if n_columns > 0:
+        n_full = cells.row_counts(cc2[1] + 1)[cc2[0] + 1:]
+        rows = np.flatnonzero(n_full >= int(n_columns / 2))
+        if rows.size:
+            return cc2[0] + 1 + int(rows[0]), cc2[1] + 1
     raise MIPSError("No CC3 critical cell found! No data region defined.")
     # OPTION 2
     # return (cc2[0]+1,cc2[1]+1)
@@ -503,25 +551,25 @@ def find_title_row(table_object):
     :type table_object: ~tabledataextractor.table.table.Table
     :return: int
     """
-    for row_index, empty_row in enumerate(table_object.pre_cleaned_table_empty):
-        if not empty_row.all():
-            return row_index
+    rows = np.flatnonzero(table_object.pre_cleaned_table_cells.row_counts())
+    if rows.size:
+        return int(rows[0])
 
 
-def find_note_cells(table_object, labels_table):
+def find_note_cells(table_object, label_codes):
     """
     Searches for all non-empty cells that have not been labelled differently.
 
     :param table_object: Input Table object
     :type table_object: ~tabledataextractor.table.table.Table
-    :param labels_table: table that holds all the labels
-    :type labels_table: Numpy array
-    :return: Tuple
+    :param label_codes: table that holds all the label codes, see :mod:`~tabledataextractor.table.labels`
+    :type label_codes: Numpy array
+    :return: Mask array with `True` for all note cells
     """
-    for row_index, row in enumerate(labels_table):
-        for column_index, cell in enumerate(row):
-            if cell == '/' and not table_object.pre_cleaned_table_empty[row_index, column_index]:
-                yield row_index, column_index
+    cells = table_object.pre_cleaned_table_cells
+    notes = np.zeros(np.shape(label_codes), dtype=bool)
+    notes[cells.rows, cells.columns] = label_codes[cells.rows, cells.columns] == labels.NONE
+    return notes
 
 
 def prefix_duplicate_labels(table_object, array):
@@ -549,27 +597,11 @@ def prefix_duplicate_labels(table_object, array):
     :type table_object: ~tabledataextractor.table.table.Table
     :param array: Table to use as input and to do the prefixing on
     :type array: Numpy array
-    :return: Table with added rows/columns with prefixes, or, input table, if no prefixing was done
+    :return: (numpy.array, ~tabledataextractor.table.algorithms.Prefixing) -- table with added rows/columns with
+             prefixes, or, input table, if no prefixing was done, and the prefixing that has been performed
 
     """
 
-    def unique(data, row_or_column):
-        """
-        Returns True if data is unique in the given row/column or False if not unique or not present.
-
-        :param data:
-        :param row_or_column:
-        :return:
-        """
-        count = 0
-        for cell in row_or_column:
-            if cell == data:
-                count += 1
-        if count == 1:
-            return True
-        else:
-            return False
-
     def prefixed_row_or_column(table):
         """
         Main algorithm for creating prefixed column/row headers.
@@ -579,34 +611,41 @@ def prefix_duplicate_labels(table_object, array):
         Returns the row/column containing the prefixes and the position of the row/column where the new row/column
         has to be inserted into the original table.
 
-        This function is getting ugly and could be rewritten with the use of a nice list of tuples,
-        for every row/column in the table, we would have a list of distinct elements with their positions in the row/column
+        The cells of every row/column are counted once. Rows/columns without duplicate cells are skipped, and the
+        unique cells to the left are kept on a stack, such that every row/column is processed in linear time.
 
         :param table: input table (will not be changed)
         :return: row_index: where the row/column has to be inserted, new_row: the list of prefixes
         """
+        empty_string = empty_parser.parse
 
         unique_prefix = False
         prefixed = False
         row_index = 0
         new_row = []
-        for row_index, row in enumerate(table):
+        for row_index, row in enumerate(table.tolist()):
+            counts = Counter(row)
+            # a row is not prefixed if it has no duplicate cells other than empty cells
+            if all(count == 1 or empty_string(cell, method='fullmatch') for cell, count in counts.items()):
+                continue
             duplicated_row = []
             new_row = []
+            # positions in duplicated_row of the cells that are unique in the row, to the left of the current cell
+            unique_cells = []
             for cell_index, cell in enumerate(row):
                 # append if unique or empty cell
-                if unique(cell, row) or empty_string(cell):
+                if counts[cell] == 1 or empty_string(cell, method='fullmatch'):
                     duplicated_row.append(cell)
                     new_row.append("")
                 else:
                     # find the first unique cell to the left
                     # don't use the first column and first row
                     # as these will presumably be in the stub header region
-                    for prefix in reversed(duplicated_row[1:]):
-                        # use the prefix if it is unique and not empty
-                        if unique(prefix, row) and not empty_string(prefix):
-                            unique_prefix = prefix
-                            break
+                    # use the prefix if it is unique and not empty
+                    while unique_cells and empty_string(duplicated_row[unique_cells[-1]], method='fullmatch'):
+                        unique_cells.pop()
+                    if unique_cells:
+                        unique_prefix = duplicated_row[unique_cells[-1]]
                     # prefix the cell and append it to new row
                     if unique_prefix:
                         duplicated_row.append(unique_prefix + "/" + cell)
@@ -616,6 +655,8 @@ def prefix_duplicate_labels(table_object, array):
                     else:
                         duplicated_row.append(cell)
                         new_row.append("")
+                if cell_index > 0 and counts.get(duplicated_row[-1], 0) == 1:
+                    unique_cells.append(cell_index)
             # and continue to the next row (if no prefixing has been performed)
             if prefixed:
                 break
@@ -625,22 +666,25 @@ def prefix_duplicate_labels(table_object, array):
             return None
 
     # MAIN ALGORITHM
+    empty_parser = StringParser(table_object.configs['empty_cell'])
+
     # 1. first, check the MIPS, to see what header we would have gotten without the prefixing
     # note, cc4 couldn't have changed
     log.debug("Prefixing. Attempt to run main MIPS algorithm.")
     try:
-        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), array)
+        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), array, prefixing=NO_PREFIXING)
     except (MIPSError, TypeError):
         log.error("Prefixing was not performed due to failure of MIPS algorithm.")
-        return array
+        return array, NO_PREFIXING
 
     # this flag is used for the return value, if it doesn't change the original table is returned
     prefixed = False
 
     # 2. DO THE PREFIXING
     # prefixing of column headers
-    if prefixed_row_or_column(array):
-        row_index, new_row = prefixed_row_or_column(array)
+    prefixes = prefixed_row_or_column(array)
+    if prefixes:
+        row_index, new_row = prefixes
         # only perform prefixing if not below of header region (above is allowed!)
         # to allow prefixing even below the old header region cannot be right
         if row_index <= cc2[0]:
@@ -651,8 +695,9 @@ def prefix_duplicate_labels(table_object, array):
             prefixed_table = np.insert(array, row_index, new_row, axis=0)
 
     # prefixing of row headers
-    if prefixed_row_or_column(array.T):
-        column_index, new_column = prefixed_row_or_column(array.T)
+    prefixes = prefixed_row_or_column(array.T)
+    if prefixes:
+        column_index, new_column = prefixes
         # only perform prefixing if not to the right of header region (to the left is allowed!)
         # to allow prefixing even below the old header region cannot be right
         if column_index <= cc2[1]:
@@ -667,10 +712,11 @@ def prefix_duplicate_labels(table_object, array):
     if prefixed:
         # if new headers fail, the prefixing has destroyed the table, which is not a HIT table anymore
         try:
-            cc1_new, cc2_new = find_cc1_cc2(table_object, find_cc4(table_object), prefixed_table)
+            cc1_new, cc2_new = find_cc1_cc2(table_object, find_cc4(table_object), prefixed_table,
+                                            prefixing=NO_PREFIXING)
         except (MIPSError, TypeError):
             log.debug("Prefixing was not performed because it destroyed the table")
-            return array
+            return array, NO_PREFIXING
         # return prefixed_table only if the prefixing has not made the header to start lower,
         # it can end lower (and this is desired and what we want - not to include the data region into the header),
         # but it cannot start lower, because that would mean that we have removed some of the hierarchy and added
@@ -679,17 +725,65 @@ def prefix_duplicate_labels(table_object, array):
             # Another condition, the header has to end lower than before, not to include at east one
             # lower row/column that was included before
             if cc2_new[0] <= cc2[0] and cc2_new[1] <= cc2[1]:
-                table_object.history._prefixing_performed = True
                 log.debug("METHOD. Prefixing was performed.")
-                if len(prefixed_table.T) > len(array.T):
-                    table_object.history._prefixed_rows = True
-                return prefixed_table
-            else:
-                return array
-        else:
-            return array
-    else:
-        return array
+                return prefixed_table, Prefixing(performed=True, rows=len(prefixed_table.T) > len(array.T))
+    return array, NO_PREFIXING
+
+
+def fill_spanning_cells(array, start_row=0):
+    """
+    Fills the empty cells of spanning cells with the content of the spanning cell, first downwards and then to the
+    right. Only truly empty cells (empty strings) are filled, and rows above `start_row` are left as they are.
+
+    Downwards, an empty cell is filled with the nearest non-empty cell above it in the same column, unless a blank row
+    lies in between. To the right, an empty cell is filled with the nearest non-empty cell to its left in the same
+    row, if that cell differs from the cell above or below it, unless a blank column lies in between. Blank rows and
+    columns are the boundaries of the spanning cells.
+
+    Both fills are forward fills of cell indices with :func:`numpy.maximum.accumulate`, with the blank rows and
+    columns found once. The fill to the right is done row by row, since a cell is compared with the cell above it,
+    as filled.
+
+    :param array: Input table
+    :type array: numpy.array
+    :param start_row: First row that is filled
+    :type start_row: int
+    :return: numpy.array, table with filled spanning cells
+    """
+    if array.size == 0:
+        return array.copy()
+    start_row = max(start_row, 0)
+    n_rows, n_columns = array.shape
+    temp = array.copy()
+    filled = array != ''
+    blank_rows = ~filled.any(axis=1)
+    blank_columns = ~filled.any(axis=0)
+
+    # fill down, a blank row stops the fill
+    rows = np.arange(n_rows)[start_row:, np.newaxis]
+    source = np.maximum.accumulate(np.where(filled[start_row:] | blank_rows[start_row:, np.newaxis], rows, -1),
+                                   axis=0)
+    fill = ~filled[start_row:] & (source >= 0)
+    fill[fill] = ~blank_rows[source[fill]]
+    fill_rows, fill_columns = np.nonzero(fill)
+    temp[start_row + fill_rows, fill_columns] = array[source[fill_rows, fill_columns], fill_columns]
+    filled[start_row:] |= fill
+
+    # fill right, a blank column stops the fill, and so does a cell that doesn't differ from the cells above and below
+    columns = np.arange(n_columns)
+    events = np.where(blank_columns, columns, -1)
+    for row_index in range(start_row, n_rows):
+        row = temp[row_index]
+        row_filled = filled[row_index]
+        differs = row != temp[row_index - 1]
+        if row_index < n_rows - 1:
+            differs |= row != temp[row_index + 1]
+        source = np.maximum.accumulate(np.where(row_filled, columns, events))
+        fill = ~row_filled & (source >= 0)
+        fill[fill] = row_filled[source[fill]] & differs[source[fill]]
+        row[fill] = row[source[fill]]
+
+    return temp
 
 
 def duplicate_spanning_cells(table_object, array):
@@ -702,6 +796,8 @@ def duplicate_spanning_cells(table_object, array):
 
     Algorithm according to Nagy and Seth, 2016, in Procs. ICPR 2016, Cancun, Mexico.
 
+    The spanning cells have been extended if the returned array differs from the input array.
+
     :param table_object: Input Table object
     :type table_object: ~tabledataextractor.table.table.Table
     :param array: Table to use as input
@@ -709,48 +805,17 @@ def duplicate_spanning_cells(table_object, array):
     :return: Array with spanning cells copied, if necessary. Alternatively, returns the original table.
     """
 
-    def empty_row(arrayy):
-        """Returns 'True' if the whole row is truly empty"""
-        for element in arrayy:
-            if element:
-                return False
-        return True
-
     # running MIPS to find the data region
     log.debug("Spanning cells. Attempt to run MIPS algorithm, to find potential title row.")
     try:
-        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), table_object.pre_cleaned_table)
+        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), table_object.pre_cleaned_table,
+                                prefixing=NO_PREFIXING)
     except (MIPSError, TypeError):
         log.error("Spanning cells update was not performed due to failure of MIPS algorithm.")
         return array
 
     log.debug("Spanning cells. Attempt to run main spanning cell algorithm.")
-    temp = array.copy()
-    top_fill = None
-    left_fill = None
-    for c in range(0, len(temp.T)):
-        flag = 0
-        for r in range(cc1[0], len(temp)):
-            if temp[r, c]:
-                top_fill = temp[r, c]
-                flag = 1
-            elif flag == 1:
-                temp[r, c] = top_fill
-            if len(temp) - 1 > r and empty_row(temp[r + 1]):
-                flag = 0
-    for r in range(cc1[0], len(temp)):
-        flag = 0
-        for c in range(len(temp.T)):
-            if temp[r, c]:
-                if (len(temp) - 1 > r and temp[r + 1, c] != temp[r, c]) or temp[r - 1, c] != temp[r, c]:
-                    left_fill = temp[r, c]
-                    flag = 1
-                else:
-                    flag = 0
-            elif flag == 1:
-                temp[r, c] = left_fill
-            if len(temp.T) - 1 > c and empty_row(temp.T[c + 1]):
-                flag = 0
+    temp = fill_spanning_cells(array, cc1[0])
 
     # Finding the header regions to make sure the spanning cells additions are not applied in the data region
     # Then, the main MIPS algorithm has to be run
@@ -758,37 +823,32 @@ def duplicate_spanning_cells(table_object, array):
     diff_row_length = 0
     diff_col_length = 0
     if table_object.configs['use_prefixing']:
-        temp2 = prefix_duplicate_labels(table_object, temp)
-        # reset the prefixing flag
-        table_object.history._prefixing_performed = False
-        table_object.history._prefixed_rows = False
+        # the prefixing is only used to find the header regions, it is not applied to the table
+        temp2, _ = prefix_duplicate_labels(table_object, temp)
         diff_row_length = len(temp2) - len(temp)
         diff_col_length = len(temp2.T) - len(temp.T)
     log.debug("Spanning cells. Attempt to run main MIPS algorithm.")
-    # disable title row temporarily
-    old_title_row_setting = table_object.configs['use_title_row']
-    table_object.configs['use_title_row'] = False
+    # without the title row
+    configs = table_object.configs.replace(use_title_row=False)
     try:
-        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), temp2)
+        cc1, cc2 = find_cc1_cc2(table_object, find_cc4(table_object), temp2, configs=configs,
+                                prefixing=NO_PREFIXING)
     except (MIPSError, TypeError):
         log.error("Spanning cells update was not performed due to failure of MIPS algorithm.")
         return array
-    finally:
-        table_object.configs['use_title_row'] = old_title_row_setting
 
     updated = array.copy()
     # update the original table with values from the updated table if the cells are in the header regions
     # update column header
-    for col_header_index in range(cc1[0], cc2[0] + 1 - diff_row_length):
-        updated[col_header_index, :] = temp[col_header_index, :]
+    col_header_rows = np.arange(cc1[0], cc2[0] + 1 - diff_row_length)
+    updated[col_header_rows, :] = temp[col_header_rows, :]
 
     # update row header
-    for row_header_index in range(cc1[1], cc2[1] + 1 - diff_col_length):
-        updated[:, row_header_index] = temp[:, row_header_index]
+    row_header_columns = np.arange(cc1[1], cc2[1] + 1 - diff_col_length)
+    updated[:, row_header_columns] = temp[:, row_header_columns]
 
     # log
     if not np.array_equal(updated, array):
-        table_object.history._spanning_cells_extended = True
         log.debug("METHOD. Spanning cells extended.")
 
     return updated
@@ -801,46 +861,46 @@ def header_extension_up(table_object, cc1):
     Algorithm according to Nagy and Seth, 2016, *"Table Headers: An entrance to the data mine"*,
     in Procs. ICPR 2016, Cancun, Mexico.
 
+    The header has been extended upwards if `cc1_new` differs from `cc1`.
+
     :param table_object: Input Table object
     :type table_object: ~tabledataextractor.table.table.Table
     :param cc1: `CC1` critical cell
     :return: cc1_new
     """
 
+    table = table_object.pre_cleaned_table
+    cells = table_object.pre_cleaned_table_cells
     cc1_new_row = None
     cc1_new_col = None
 
     # add row above the identified column header if it does not consist of cells with identical values and if it
     # adds at least one non-blank cell that has a value different from the cell immediately below it
-    current_row = table_object.pre_cleaned_table[cc1[0], :]
+    # the first column is left out of both checks, to allow for (and preserve) a title
+    above = table[:cc1[0], 1:]
+    filled = ~cells.region_empty(slice(0, cc1[0]), slice(1, None))
+    uniform = (above == above[:, :1]).all(axis=1) if above.shape[1] else np.zeros(len(above), dtype=bool)
+    current_row = table[cc1[0], 1:]
     for row_index in range(cc1[0]-1, -1, -1):
-        # start after the first column to allow for a title
-        if len(np.unique(table_object.pre_cleaned_table[row_index, 1:])) == 1:
+        if uniform[row_index]:
             cc1_new_row = row_index+1
-        else:
-            for col_index, cell in enumerate(table_object.pre_cleaned_table[row_index, :]):
-                # remove the first row from this check to preserve a title,
-                # if the title is the only non-empty element of the row
-                if col_index != 0 and \
-                        cell != current_row[col_index] and \
-                        not table_object.pre_cleaned_table_empty[row_index, col_index]:
-                    current_row = table_object.pre_cleaned_table[row_index, :]
-                    cc1_new_row = row_index
-                    break
+        elif ((above[row_index] != current_row) & filled[row_index]).any():
+            current_row = above[row_index]
+            cc1_new_row = row_index
     if cc1_new_row is None:
         cc1_new_row = cc1[0]
 
     # now do the same for the row headers
-    current_col = table_object.pre_cleaned_table[:, cc1[1]]
+    left = table[:, :cc1[1]].T
+    filled = ~cells.region_empty(columns=slice(0, cc1[1])).T
+    uniform = (left == left[:, :1]).all(axis=1) if left.shape[1] else np.zeros(len(left), dtype=bool)
+    current_col = table[:, cc1[1]]
     for col_index in range(cc1[1]-1, -1, -1):
-        if len(np.unique(table_object.pre_cleaned_table[:, col_index])) == 1:
+        if uniform[col_index]:
             cc1_new_col = col_index+1
-        else:
-            for row_index, cell in enumerate(table_object.pre_cleaned_table[:, col_index]):
-                if cell != current_col[row_index] and not table_object.pre_cleaned_table_empty[row_index, col_index]:
-                    current_col = table_object.pre_cleaned_table[:, col_index]
-                    cc1_new_col = col_index
-                    break
+        elif ((left[col_index] != current_col) & filled[col_index]).any():
+            current_col = left[col_index]
+            cc1_new_col = col_index
     if cc1_new_col is None:
         cc1_new_col = cc1[1]
 
@@ -848,13 +908,12 @@ def header_extension_up(table_object, cc1):
 
     # log
     if not cc1_new == cc1:
-        table_object.history._header_extended_up = True
         log.debug("METHOD. Header extended upwards.")
 
     return cc1_new
 
 
-def header_extension_down(table_object, cc1, cc2, cc4):
+def header_extension_down(table_object, cc1, cc2, cc4, prefixing=None):
     """
     Extends the header downwards, if no prefixing was done and if the appropriate stub header is empty.
     For column-header expansion downwards, only the first cell of the stub header has to be empty.
@@ -868,94 +927,116 @@ def header_extension_down(table_object, cc1, cc2, cc4):
     :type cc1: (int, int)
     :param cc4: Critical cell `CC4`
     :type cc4: (int, int)
-    :return: New `cc2`
+    :param prefixing: Prefixing that has been performed on the table, as recorded in its history if `None`
+    :type prefixing: ~tabledataextractor.table.algorithms.Prefixing
+    :return: (New `cc2`, `True` if the header has been extended)
     """
+    if prefixing is None:
+        prefixing = Prefixing(table_object.history.prefixing_performed, table_object.history.prefixed_rows)
+    table = table_object.pre_cleaned_table
+    cells = table_object.pre_cleaned_table_cells
     cc2_new = cc2
     extended = False
+    header_extended = False
 
     # only do downwards header extension if no prefixing was done
-    if not table_object.history.prefixing_performed:
+    if not prefixing.performed:
 
         # extend column header downwards, changes cc2 row
         # only the first cell of the stub header has to be empty to accept the move downwards
-        row_index = cc2[0]
-        while row_index <= cc4[0] and empty_string(table_object.pre_cleaned_table[row_index, cc1[1]]):
-            row_index += 1
-            cc2_new = (row_index - 1, cc2_new[1])
-            if cc2_new != cc2:
-                extended = True
-
-        if extended:
-            table_object.history._header_extended_down = True
+        n_empty = _leading(cells.region_empty(slice(cc2[0], cc4[0] + 1), slice(cc1[1], cc1[1] + 1))[:, 0])
+        if n_empty:
+            cc2_new = (cc2[0] + n_empty - 1, cc2_new[1])
+            extended = cc2_new != cc2
 
         # Check if row header can be shortened now, check duplicate rows accordingly, changes cc2 col
         if extended:
+            header_extended = True
+            cc3 = find_cc3(table_object, cc2)
+            row_header = table[cc3[0]:cc4[0] + 1, cc1[1]:cc2[1] + 1]
             cc2_new_col = cc2_new[1]
-            i = len(table_object.row_header.T)
-            while not duplicate_rows(table_object.row_header[:, :i]) and i > 1:
+            i = len(row_header.T)
+            while not duplicate_rows(row_header[:, :i]) and i > 1:
                 i -= 1
-                if not duplicate_rows(table_object.row_header[:, :i]):
+                if not duplicate_rows(row_header[:, :i]):
                     cc2_new_col -= 1
             cc2_new = (cc2_new[0], cc2_new_col)
             extended = False
 
         # extend row header to the right, changes cc2 col
         # this check is more rigorous than above, and all the cells in the stub header have to be empty
-        col_index = cc2_new[1]
-        while col_index <= cc4[1] and empty_cells(table_object.pre_cleaned_table[cc1[0]:cc2[0]+1, col_index]).all():
-            col_index += 1
-            if col_index - 1 != cc2_new[1]:
-                extended = True
-            cc2_new = (cc2_new[0], col_index - 1)
+        n_filled = cells.column_counts(cc1[0], cc2[0] + 1)[cc2_new[1]:cc4[1] + 1]
+        n_empty = _leading(n_filled == 0)
+        if n_empty > 1:
+            extended = True
+        if n_empty:
+            cc2_new = (cc2_new[0], cc2_new[1] + n_empty - 1)
 
         if extended:
+            header_extended = True
             # Check if column header can be shortened now, changes cc2 row
+            cc3 = find_cc3(table_object, cc2)
+            col_header = table[cc1[0]:cc2[0] + 1, cc3[1]:cc4[1] + 1]
             cc2_new_row = cc2_new[0]
-            i = len(table_object.col_header)
-            while not duplicate_columns(table_object.col_header[:i, :]) and i > 1:
+            i = len(col_header)
+            while not duplicate_columns(col_header[:i, :]) and i > 1:
                 i -= 1
-                if not duplicate_columns(table_object.col_header[:i, :]):
+                if not duplicate_columns(col_header[:i, :]):
                     cc2_new_row -= 1
             cc2_new = (cc2_new_row, cc2_new[1])
 
-        if extended:
-            table_object.history._header_extended_down = True
-
-    return cc2_new
+    return cc2_new, header_extended
 
 
-def categorize_header(header):
+def orientation_score(table_object):
     """
-    Performs header categorization (calls the `SymPy` `fact` function) for a given table.
+    Cheap structural score of the orientation of an analyzed table, used with ``orientation = 'auto'``.
+    The score is the type consistency of the data columns, averaged over the non-empty data columns. The type
+    consistency of a column is the fraction of its non-empty cells that share the majority type, numeric or text.
+    Tables are usually laid out with a single quantity per column.
 
-    :param header: header region, Numpy array
-    :return: factor_list
+    :param table_object: Input Table object
+    :type table_object: ~tabledataextractor.table.table.Table
+    :return: float, between `0` and `1`
+    """
+    cc3, cc4 = table_object._cc3, table_object._cc4
+    data = table_object.pre_cleaned_table[cc3[0]:cc4[0] + 1, cc3[1]:cc4[1] + 1]
+    if data.size == 0:
+        return 0.0
+
+    filled = ~table_object.pre_cleaned_table_cells.region_empty(slice(cc3[0], cc4[0] + 1), slice(cc3[1], cc4[1] + 1))
+    numeric = CellParser(NUMERIC_CELL).match_mask(data) & filled
+    n_filled = filled.sum(axis=0)
+    n_numeric = numeric.sum(axis=0)
+    columns = n_filled > 0
+    if not columns.any():
+        return 0.0
+    consistency = np.maximum(n_numeric, n_filled - n_numeric)[columns] / n_filled[columns]
+    return float(consistency.mean())
+
+
+def categorize_header(header, header_empty=None):
     """
+    Performs header categorization for a given header, see :func:`~tabledataextractor.table.factors.factorize`.
 
-    # empty expression and part of the expression that will be factorized
-    # these are SymPy expressions
-    expression = 0
-    part = 0
-    for row_index, row in enumerate(header):
-        for column_index, cell in enumerate(row):
-            if column_index == 0:
-                part = Symbol(cell)
-            else:
-                part = part * Symbol(cell)
-        expression = expression + part
-    # factorization
-    # f = factor(expression, deep=True)
-    f = factor_list(expression)
-    log.debug("Factorization, initial header: {}".format(expression))
-    log.debug("Factorization, factorized header: {}".format(f))
+    :param header: header region, Numpy array, with one path of labels in every row
+    :param header_empty: Mask with `True` for the empty cells of `header`, computed with
+                         :func:`~tabledataextractor.table.algorithms.empty_cells` if `None`
+    :type header_empty: numpy.array
+    :return: category tree
+    """
+    if header is not None and header_empty is None:
+        header_empty = empty_cells(header)
+    f = factors.factorize(header, header_empty)
+    log.debug("Factorization, factorized header: {}".format(factors.to_string(f)))
     return f
 
 
-def build_category_table(table, cc1, cc2, cc3, cc4):
+def build_category_table(table, cc1, cc2, cc3, cc4, table_empty=None):
     """
-    Build category table for given input table.
+    Factorizes the row and column headers of a table.
     Original header factorization, according to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
-    This version is not used, instead :class:`~tabledataextractor.output.to_pandas.build_category_table` is being used.
+    The category table itself is built by :func:`~tabledataextractor.table.algorithms.build_category_rows`.
 
     :param table: Table on which to perform the categorization
     :type table: Numpy array
@@ -963,18 +1044,23 @@ def build_category_table(table, cc1, cc2, cc3, cc4):
     :param cc2: key MIPS cell
     :param cc3: key MIPS cell
     :param cc4: key MIPS cell
-    :return: category table as numpy array
+    :param table_empty: Mask with `True` for the empty cells of `table`, computed with
+                        :func:`~tabledataextractor.table.algorithms.empty_cells` if `None`
+    :type table_empty: numpy.array
+    :return: (row_factors, column_factors) -- category trees of the row and column header
     """
-
+    if table_empty is None:
+        table_empty = empty_cells(table)
     column_header = table[cc1[0]:cc2[0] + 1, cc3[1]:cc4[1] + 1]
     row_header = table[cc3[0]:cc4[0] + 1, cc1[1]:cc2[1] + 1]
-    column_factors = categorize_header(column_header.T)
-    row_factors = categorize_header(row_header)
+    column_factors = categorize_header(column_header.T, table_empty[cc1[0]:cc2[0] + 1, cc3[1]:cc4[1] + 1].T)
+    row_factors = categorize_header(row_header, table_empty[cc3[0]:cc4[0] + 1, cc1[1]:cc2[1] + 1])
+    return row_factors, column_factors
 
 
 def split_table(table_object):
     """
-    Splits table into subtables. Yields :class:`~tabledataextractor.table.table.Table` objects.
+    Splits table into subtables. Yields the subtables as views into the `pre-cleaned table` of the input table.
 
     Algorithm:
         If the stub header is repeated in the column header section the table is split up before
@@ -993,13 +1079,13 @@ def split_table(table_object):
         if i == 0 and column.size > 0 and \
                 table_object.stub_header[:-1].T[0].size > 0 and \
                 np.array_equal(column, table_object.stub_header[:-1].T[0]):
-            yield table_object._pre_cleaned_table[:, 0:col_index + 1].tolist()
+            yield table_object._pre_cleaned_table[:, 0:col_index + 1]
             i += 1
         # every other match is only forwards looking
         if i > 0 and column.size > 0 and \
                 table_object.stub_header[:-1].T[0].size > 0 and \
                 np.array_equal(column, table_object.stub_header[:-1].T[0]):
-            yield table_object._pre_cleaned_table[:, col_index + 1:col_index + i * col_index + 2].tolist()
+            yield table_object._pre_cleaned_table[:, col_index + 1:col_index + i * col_index + 2]
             i += 1
 
     # now the same thing for the row header
@@ -1009,39 +1095,34 @@ def split_table(table_object):
         if i == 0 and row.size > 0 and \
                 table_object.stub_header[0, :-1].size > 0 and \
                 np.array_equal(row, table_object.stub_header[0, :-1]):
-            yield table_object._pre_cleaned_table[0:row_index + 1, :].tolist()
+            yield table_object._pre_cleaned_table[0:row_index + 1, :]
             i += 1
         # every other match is only forwards looking
         if i > 0 and row.size > 0 and \
                 table_object.stub_header[0, :-1].size > 0 \
                 and np.array_equal(row, table_object.stub_header[0, :-1]):
-            yield table_object._pre_cleaned_table[row_index + 1:row_index + i * row_index + 2, :].tolist()
+            yield table_object._pre_cleaned_table[row_index + 1:row_index + i * row_index + 2, :]
             i += 1
 
 
-def find_row_header_table(category_table, stub_header):
+def build_category_rows(data, row_header, col_header):
     """
-    Constructs a Table from the row categories of the original table.
-
-    :param category_table: ~tabledataextractor.table.table.Table.category_table
-    :type category_table: list
-    :param stub_header: ~tabledataextractor.table.table.Table.stub_header
-    :type stub_header: numpy.ndarray
-    :return: list
+    Builds the category table from the data region and the headers of a table. Every row of the category table
+    holds a data value, its row categories and its column categories. The data values are in row-major order.
+
+    :param data: Data region
+    :type data: numpy.ndarray
+    :param row_header: Row header, with a row for every row of the data region
+    :type row_header: numpy.ndarray
+    :param col_header: Column header, with a column for every column of the data region
+    :type col_header: numpy.ndarray
+    :return: category table as Python list
     """
-    stub_header = stub_header.tolist()
-    raw_table = list()
-    for line in stub_header:
-        new_line = list()
-        for item in line:
-            new_line.append(item)
-        raw_table.append(new_line)
-    for line in category_table:
-        new_line = list()
-        for item in line[1]:
-            new_line.append(item)
-        raw_table.append(new_line)
-    return raw_table
+    row_categories = row_header.tolist()
+    column_categories = col_header.T.tolist()
+    return [[value, list(row_categories[row_index]), list(column_categories[column_index])]
+            for row_index, row in enumerate(data.tolist())
+            for column_index, value in enumerate(row)]
 
 
 def clean_row_header(pre_cleaned_table, cc2):
@@ -1052,13 +1133,8 @@ def clean_row_header(pre_cleaned_table, cc2):
     modified_part = pre_cleaned_table[cc2[0]+1:, :]
 
     # delete duplicate rows that extend over the whole table
-    _, indices = np.unique(modified_part, axis=0, return_index=True)
-    # for logging only, which rows have been removed
-    removed_rows = []
-    for row_index in range(0, len(modified_part)):
-        if row_index not in indices:
-            removed_rows.append(row_index)
-    # deletion
-    modified_part = modified_part[np.sort(indices)]
+    rows = deduplicate(modified_part, axis=0)
+    log.debug("Duplicate rows {} removed from the row header.".format([cc2[0] + 1 + row for row in rows.removed]))
+    modified_part = modified_part[rows.kept]
 
     return np.vstack((unmodified_part, modified_part))
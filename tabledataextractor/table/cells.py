@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Sparse store of the non-empty cells of a table.
+
+Tables from layout-heavy documents and from spreadsheets are often mostly empty. :class:`SparseCells` keeps only the
+coordinates and the values of the non-empty cells, in row-major order, and the empty cells are implied. The counts of
+non-empty cells in rows and columns, the footnote search and the search for note cells run over the stored cells only,
+such that their time scales with the content of the table rather than with its area.
+
+The store is built from the dense table with :meth:`SparseCells.from_table`, which parses only the cells that are not
+blank, so no mask of the empty cells is computed over the whole table. The values are stored with the length of the
+longest value, so the store takes memory in proportion to the content of the table. A
+:class:`~tabledataextractor.table.table.Table` keeps the store instead of a mask of the empty cells, and builds such
+masks only for the regions that need them. The dense table itself remains the working representation of the other
+steps of the analysis.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+
+class SparseCells:
+    """
+    Non-empty cells of a table, in row-major order. The cells of row `r` are
+    ``rows[row_starts[r]:row_starts[r + 1]]``, and likewise for the columns and values.
+
+    :param shape: Shape of the table, `(n_rows, n_columns)`
+    :type shape: (int, int)
+    :param rows: Row indices of the non-empty cells, in row-major order
+    :type rows: numpy.array
+    :param columns: Column indices of the non-empty cells
+    :type columns: numpy.array
+    :param values: Values of the non-empty cells, `None` to store only their positions
+    :type values: numpy.array
+    """
+
+    def __init__(self, shape, rows, columns, values=None):
+        self.shape = tuple(int(size) for size in shape)
+        self.rows = np.asarray(rows, dtype=np.intp)
+        self.columns = np.asarray(columns, dtype=np.intp)
+        self.values = np.asarray(values) if values is not None else None
+        if len(self.rows) != len(self.columns) or (self.values is not None and len(self.values) != len(self.rows)):
+            raise ValueError('Rows, columns and values of the cells have different lengths.')
+        #: Position of the first cell of every row, and the number of cells at the end, of length `n_rows + 1`.
+        self.row_starts = np.zeros(self.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.rows, minlength=self.shape[0]), out=self.row_starts[1:])
+        for array in (self.rows, self.columns, self.values, self.row_starts):
+            if array is not None:
+                array.flags.writeable = False
+
+    @classmethod
+    def from_array(cls, array, empty):
+        """
+        Returns the store of the non-empty cells of a dense table.
+
+        :param array: Input table
+        :type array: numpy.array
+        :param empty: Mask with `True` for the empty cells of `array`
+        :type empty: numpy.array
+        :return: ~tabledataextractor.table.cells.SparseCells
+        """
+        rows, columns = np.nonzero(~np.asarray(empty, dtype=bool))
+        return cls(np.shape(array), rows, columns, array[rows, columns])
+
+    @classmethod
+    def from_table(cls, array, empty_parser, values=True):
+        """
+        Returns the store of the non-empty cells of a dense table, as defined by a parser of the empty cells.
+        Blank cells are empty if the parser matches the empty string, and only the other cells are parsed.
+        The values are stored with the length of the longest value, rather than with the width of the table.
+
+        :param array: Input table
+        :type array: numpy.array
+        :param empty_parser: Parser that matches the empty cells, with ``method='fullmatch'``
+        :type empty_parser: ~tabledataextractor.table.parse.CellParser
+        :param values: Whether to store the values of the cells, or only their positions
+        :type values: bool
+        :return: ~tabledataextractor.table.cells.SparseCells
+        """
+        array = np.asarray(array)
+        if empty_parser.match_mask(np.array(['']), method='fullmatch')[0]:
+            rows, columns = np.nonzero(array != '')
+        else:
+            rows, columns = (index.ravel() for index in np.indices(array.shape))
+        filled = ~empty_parser.match_mask(array[rows, columns], method='fullmatch')
+        rows, columns = rows[filled], columns[filled]
+        if not values:
+            return cls(array.shape, rows, columns)
+        values = array[rows, columns]
+        if values.dtype.kind == 'U' and len(values):
+            values = values.astype('<U{}'.format(max(int(np.char.str_len(values).max()), 1)))
+        return cls(array.shape, rows, columns, values)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def empty(self):
+        """
+        Mask with `True` for all empty cells of the table, built on demand.
+
+        :type: numpy.array
+        """
+        return self.region_empty()
+
+    def region_empty(self, rows=slice(None), columns=slice(None)):
+        """
+        Returns a mask with `True` for the empty cells of a region of the table, built on demand. Only the stored
+        cells of the rows of the region are visited.
+
+        :param rows: Rows of the region, with a step of `1`
+        :type rows: slice
+        :param columns: Columns of the region, with a step of `1`
+        :type columns: slice
+        :return: numpy.array
+        """
+        row_start, row_stop, _ = rows.indices(self.shape[0])
+        column_start, column_stop, _ = columns.indices(self.shape[1])
+        row_stop, column_stop = max(row_start, row_stop), max(column_start, column_stop)
+        empty = np.ones((row_stop - row_start, column_stop - column_start), dtype=bool)
+        cells = slice(self.row_starts[row_start], self.row_starts[row_stop])
+        cell_rows, cell_columns = self.rows[cells], self.columns[cells]
+        inside = (cell_columns >= column_start) & (cell_columns < column_stop)
+        empty[cell_rows[inside] - row_start, cell_columns[inside] - column_start] = False
+        return empty
+
+    def to_array(self, fill=''):
+        """
+        Returns the dense table, with the empty cells set to `fill`.
+
+        :param fill: Value of the empty cells
+        :type fill: str
+        :return: numpy.array
+        """
+        if self.values is None:
+            raise ValueError('The values of the cells are not stored.')
+        dtype = np.promote_types(self.values.dtype, np.asarray(fill).dtype) if len(self) else np.asarray(fill).dtype
+        array = np.full(self.shape, fill, dtype=dtype)
+        array[self.rows, self.columns] = self.values
+        return array
+
+    def is_empty(self, row, column):
+        """
+        Returns `True` if a cell of the table is empty.
+
+        :param row: Row index of the cell
+        :type row: int
+        :param column: Column index of the cell
+        :type column: int
+        :return: bool
+        """
+        start, stop = self.row_starts[row], self.row_starts[row + 1]
+        position = start + int(np.searchsorted(self.columns[start:stop], column))
+        return not (position < stop and self.columns[position] == column)
+
+    def row_counts(self, start=0, stop=None):
+        """
+        Returns the number of non-empty cells of every row, within the columns ``start:stop``.
+
+        :param start: First column
+        :type start: int
+        :param stop: Column after the last column, the last column of the table if `None`
+        :type stop: int
+        :return: numpy.array of length `n_rows`
+        """
+        if start <= 0 and (stop is None or stop >= self.shape[1]):
+            return np.diff(self.row_starts)
+        stop = self.shape[1] if stop is None else stop
+        inside = (self.columns >= start) & (self.columns < stop)
+        return np.bincount(self.rows[inside], minlength=self.shape[0])
+
+    def column_counts(self, start=0, stop=None):
+        """
+        Returns the number of non-empty cells of every column, within the rows ``start:stop``. Only the cells of
+        these rows are visited.
+
+        :param start: First row
+        :type start: int
+        :param stop: Row after the last row, the last row of the table if `None`
+        :type stop: int
+        :return: numpy.array of length `n_columns`
+        """
+        start, stop, _ = slice(start, stop).indices(self.shape[0])
+        columns = self.columns[self.row_starts[start]:self.row_starts[max(start, stop)]]
+        return np.bincount(columns, minlength=self.shape[1])
+
+    def below(self, row):
+        """
+        Returns the slice of the stored cells below a row of the table.
+
+        :param row: Row index
+        :type row: int
+        :return: slice
+        """
+        return slice(int(self.row_starts[min(max(row + 1, 0), self.shape[0])]), len(self))
+
+    def above(self, row):
+        """
+        Returns the slice of the stored cells above a row of the table.
+
+        :param row: Row index
+        :type row: int
+        :return: slice
+        """
+        return slice(0, int(self.row_starts[min(max(row, 0), self.shape[0])]))
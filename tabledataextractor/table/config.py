@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration of a :class:`~tabledataextractor.table.table.Table`.
+
+A configuration is immutable and hashable. It is validated once, when it is created, and instances are interned,
+such that all tables created with the same configuration keywords share a single :class:`Config` instance, together
+with its precompiled cell parsers. Interned configurations are held by weak references, and a configuration that is
+no longer used by any table is dropped. Being hashable, a configuration can be used as a key for caching results.
+
+Configuration keywords are read like the keys of a dictionary::
+
+    config = Config.create(use_title_row=False)
+    config['use_title_row']
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+import re
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from tabledataextractor.exceptions import InputError
+from tabledataextractor.table.parse import CellParser
+from tabledataextractor.table.algorithms import EMPTY_CELL
+from tabledataextractor.table.footnotes import FOOTNOTE_CELL
+
+log = logging.getLogger(__name__)
+
+#: Orientations of the input table, see the ``orientation`` configuration keyword of
+#: :class:`~tabledataextractor.table.table.Table`.
+ORIENTATIONS = ('original', 'transposed', 'auto')
+
+#: Interned configurations, by their configuration keywords.
+_INSTANCES = weakref.WeakValueDictionary()
+
+
+class Config(Mapping):
+    """
+    Immutable configuration of a :class:`~tabledataextractor.table.table.Table`.
+    Use :meth:`create` to obtain the shared instance for a set of configuration keywords.
+
+    :param kwargs: Configuration keywords, see :class:`~tabledataextractor.table.table.Table`; keywords that are not
+                   given have their default value
+    :raises InputError: if a keyword does not exist or has an invalid value
+    """
+
+    __slots__ = ('_values', '_hash', 'empty_parser', 'footnote_parser', '__weakref__')
+
+    #: Configuration keywords and their default values.
+    DEFAULTS = MappingProxyType({'use_title_row': True,
+                                 'use_prefixing': True,
+                                 'use_footnotes': True,
+                                 'use_spanning_cells': True,
+                                 'use_header_extension': True,
+                                 'use_max_data_area': False,
+                                 'standardize_empty_data': True,
+                                 'row_header': None,
+                                 'col_header': None,
+                                 'orientation': 'original',
+                                 'parallel_orientation': False,
+                                 'empty_cell': EMPTY_CELL})
+
+    def __init__(self, **kwargs):
+        values = dict(self.DEFAULTS)
+        for key, value in kwargs.items():
+            if key not in values:
+                msg = 'Keyword "{}" does not exist.'.format(key)
+                log.critical(msg)
+                raise InputError(msg)
+            values[key] = self._validate(key, value)
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_hash', hash((type(self),) + tuple(values.items())))
+        #: Parser that matches empty cells, with ``method='fullmatch'``.
+        object.__setattr__(self, 'empty_parser', CellParser(values['empty_cell']))
+        #: Parser that matches footnote cells.
+        object.__setattr__(self, 'footnote_parser', CellParser(FOOTNOTE_CELL))
+
+    @classmethod
+    def create(cls, **kwargs):
+        """
+        Returns the shared configuration for the given configuration keywords. The configuration is validated
+        only when it is created, while no other instance with the same keywords is in use.
+
+        :param kwargs: Configuration keywords
+        :return: ~tabledataextractor.table.config.Config
+        """
+        try:
+            key = (cls,) + tuple(sorted(kwargs.items()))
+            return _INSTANCES[key]
+        except (KeyError, TypeError):
+            key = None
+        config = cls(**kwargs)
+        config = _INSTANCES.setdefault((cls,) + tuple(sorted(config.items())), config)
+        if key is not None:
+            _INSTANCES.setdefault(key, config)
+        log.info('Configuration parameters are: {}'.format(dict(config)))
+        return config
+
+    def replace(self, **changes):
+        """
+        Returns the shared configuration with some of the configuration keywords changed.
+
+        :param changes: Configuration keywords to change
+        :return: ~tabledataextractor.table.config.Config
+        """
+        return type(self).create(**dict(self._values, **changes))
+
+    def _validate(self, key, value):
+        """Returns the validated value of a configuration keyword."""
+        default = self.DEFAULTS[key]
+        if isinstance(default, bool):
+            if not isinstance(value, (bool, int)):
+                self._invalid(key, value)
+            return bool(value)
+        if key in ('row_header', 'col_header'):
+            if value is None and default is None:
+                return value
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                self._invalid(key, value)
+            return value
+        if key == 'orientation' and value not in ORIENTATIONS:
+            msg = 'Orientation "{}" does not exist. Use one of {}.'.format(value, ORIENTATIONS)
+            log.critical(msg)
+            raise InputError(msg)
+        if key == 'empty_cell':
+            if not isinstance(value, str):
+                self._invalid(key, value)
+            try:
+                re.compile(value)
+            except re.error as e:
+                msg = 'Invalid regular expression {!r} of keyword "empty_cell": {}'.format(value, e)
+                log.critical(msg)
+                raise InputError(msg)
+        return value
+
+    @staticmethod
+    def _invalid(key, value):
+        msg = 'Invalid value {!r} of keyword "{}".'.format(value, key)
+        log.critical(msg)
+        raise InputError(msg)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, Config):
+            return type(self) is type(other) and self._values == other._values
+        return Mapping.__eq__(self, other)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __reduce__(self):
+        return _create, (type(self), dict(self._values))
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__,
+                               ', '.join('{}={!r}'.format(key, value) for key, value in self._values.items()))
+
+
+class TrivialConfig(Config):
+    """
+    Immutable configuration of a :class:`~tabledataextractor.table.table.TrivialTable`.
+    """
+
+    __slots__ = ()
+
+    #: Configuration keywords and their default values.
+    DEFAULTS = MappingProxyType({'standardize_empty_data': False,
+                                 'clean_row_header': False,
+                                 'row_header': 0,
+                                 'col_header': 0,
+                                 'empty_cell': EMPTY_CELL})
+
+
+def _create(cls, values):
+    """Unpickles a configuration as the shared instance."""
+    return cls.create(**values)
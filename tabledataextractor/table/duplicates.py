@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Duplicate rows and columns of tables.
+
+:func:`deduplicate` removes the duplicate rows or columns of a table in a single pass. :class:`DuplicateIndex`
+answers whether slices of a table have duplicate rows or columns, as asked repeatedly by the MIPS algorithm,
+without comparing the cells of the slices.
+
+Every cell is hashed once, and the hashes are summed along the rows and along the columns into polynomial prefix
+hashes, such that the hash of any part of a row or column is the difference of two prefix hashes. For a range of
+columns, the rows are sorted by their hash once, which gives, for every row, the last earlier row with the same hash.
+Whether the rows in any range of rows have a duplicate is then a single look-up, and likewise for the columns.
+A duplicate that is found through the hashes is verified by comparing the cells of the two rows or columns, so the
+answers are exact. In the rare case of a hash collision, the slice is deduplicated exactly.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+from collections import namedtuple
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Result of :func:`~tabledataextractor.table.duplicates.deduplicate`, indices of the kept and of the removed rows or
+#: columns.
+Deduplicated = namedtuple('Deduplicated', ['kept', 'removed'])
+
+#: Bases of the polynomial prefix hashes along the rows and along the columns, odd 64-bit integers.
+_ROW_BASE = np.uint64(0x9E3779B97F4A7C15)
+_COLUMN_BASE = np.uint64(0xC2B2AE3D27D4EB4F)
+
+#: Slices with up to this number of rows (columns) are searched for duplicate rows (columns) directly, larger slices
+#: through the sorted hashes of all rows (columns) of the table.
+DIRECT_LINES = 64
+
+
+def _line_keys(array, axis=0):
+    """Returns a hashable key for every row (`axis=0`) or column (`axis=1`) of a two-dimensional array."""
+    lines = np.ascontiguousarray(array if axis == 0 else np.transpose(array))
+    if lines.shape[1] == 0 or lines.dtype.itemsize == 0:
+        return [b''] * lines.shape[0]
+    return lines.view(np.dtype((np.void, lines.dtype.itemsize * lines.shape[1]))).ravel().tolist()
+
+
+def deduplicate(array, axis=0):
+    """
+    Finds the duplicate rows (`axis=0`) or columns (`axis=1`) of a table, in a single pass.
+    The first occurrence of every row or column is kept, all later occurrences are removed.
+
+    :param array: Input table
+    :type array: numpy.array
+    :param axis: 0 for rows, 1 for columns
+    :type axis: int
+    :return: ~tabledataextractor.table.duplicates.Deduplicated -- lists of the indices of the kept and of the
+             removed rows or columns, in increasing order
+    """
+    seen = set()
+    kept = []
+    removed = []
+    for index, key in enumerate(_line_keys(array, axis)):
+        if key in seen:
+            removed.append(index)
+        else:
+            seen.add(key)
+            kept.append(index)
+    return Deduplicated(kept, removed)
+
+
+def _prefix_hashes(cells, base):
+    """
+    Returns the polynomial prefix hashes of the rows of `cells`, an array of cell hashes. ``prefix[i, j]`` is the
+    hash of the first `j` cells of row `i`. Arithmetic wraps around modulo :math:`2^{64}`.
+    """
+    powers = np.cumprod(np.full(cells.shape[1], base, dtype=np.uint64))
+    prefix = np.zeros((cells.shape[0], cells.shape[1] + 1), dtype=np.uint64)
+    np.cumsum(cells * powers, axis=1, out=prefix[:, 1:])
+    return prefix
+
+
+def _last_duplicates(keys):
+    """
+    Returns, for every line, the largest index of a line with an equal key among the lines up to it, -1 if there is
+    none, and the index of the later line of that pair.
+    """
+    order = np.argsort(keys, kind='stable')
+    same = keys[order[1:]] == keys[order[:-1]]
+    previous = np.full(len(keys), -1, dtype=np.intp)
+    previous[order[1:][same]] = order[:-1][same]
+    last = np.maximum.accumulate(previous)
+    closing = np.maximum.accumulate(np.where((previous == last) & (previous >= 0), np.arange(len(keys)), -1))
+    return last, closing
+
+
+def _first_duplicate(keys):
+    """Returns the positions of the first two equal keys, `None` if the keys are distinct."""
+    seen = {}
+    for position, key in enumerate(keys):
+        if key in seen:
+            return seen[key], position
+        seen[key] = position
+    return None
+
+
+def _clip(bounds, size):
+    """Clips the bounds `(start, stop)` of a slice to a dimension of the given size, like Python slicing does."""
+    start, stop = bounds
+    stop = min(max(stop, 0), size)
+    return min(max(start, 0), stop), stop
+
+
+class DuplicateIndex:
+    """
+    Answers whether slices of a table have duplicate rows or columns. Slices are given by the bounds
+    `(start, stop)` of their rows and of their columns, as in ``array[start:stop]``.
+
+    Hashing the table takes linear time. A slice with up to :data:`DIRECT_LINES` rows is searched for duplicate
+    rows directly. For larger slices, the first question about a range of columns takes :math:`O(n \\log n)` time
+    for the `n` rows of the table, and every further question about the same range of columns is answered in
+    constant time. The same holds for the columns. A duplicate that has been found is verified in time linear in its
+    length.
+
+    :param array: Input table, which must not be changed while the index is in use
+    :type array: numpy.array
+    """
+
+    def __init__(self, array):
+        self.array = np.asarray(array)
+        cells = np.fromiter(map(hash, self.array.ravel().tolist()), dtype=np.int64,
+                            count=self.array.size).view(np.uint64).reshape(self.array.shape)
+        self._lines = (self.array, self.array.T)
+        self._prefixes = (_prefix_hashes(cells, _ROW_BASE), _prefix_hashes(cells.T, _COLUMN_BASE))
+        self._last = ({}, {})
+
+    def duplicate_rows(self, rows, columns):
+        """
+        Returns `True` if there are duplicate rows in a slice of the table.
+
+        :param rows: Bounds of the rows of the slice
+        :type rows: (int, int)
+        :param columns: Bounds of the columns of the slice
+        :type columns: (int, int)
+        :return: bool
+        """
+        return self._duplicates(0, rows, columns)
+
+    def duplicate_columns(self, rows, columns):
+        """
+        Returns `True` if there are duplicate columns in a slice of the table.
+
+        :param rows: Bounds of the rows of the slice
+        :type rows: (int, int)
+        :param columns: Bounds of the columns of the slice
+        :type columns: (int, int)
+        :return: bool
+        """
+        return self._duplicates(1, columns, rows)
+
+    def _duplicates(self, axis, lines, span):
+        """Returns `True` if there are duplicates among the `lines` of the table along `axis`, within `span`."""
+        table = self._lines[axis]
+        start, stop = _clip(lines, table.shape[0])
+        span = _clip(span, table.shape[1])
+        if stop - start < 2 or span[1] == span[0]:
+            return False
+        prefix = self._prefixes[axis]
+        if stop - start <= DIRECT_LINES:
+            pair = _first_duplicate((prefix[start:stop, span[1]] - prefix[start:stop, span[0]]).tolist())
+            if pair is None:
+                return False
+            first, second = start + pair[0], start + pair[1]
+        else:
+            try:
+                last, closing = self._last[axis][span]
+            except KeyError:
+                last, closing = self._last[axis][span] = _last_duplicates(prefix[:, span[1]] - prefix[:, span[0]])
+            if last[stop - 1] < start:
+                return False
+            first, second = last[stop - 1], closing[stop - 1]
+        if np.array_equal(table[first, span[0]:span[1]], table[second, span[0]:span[1]]):
+            return True
+        log.debug("Hash collision of lines {} and {}, the slice is deduplicated exactly.".format(first, second))
+        return bool(deduplicate(table[start:stop, span[0]:span[1]]).removed)
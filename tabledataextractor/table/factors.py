@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Header factorization, according to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
+
+Every column of the column header, and every row of the row header, is a path of labels, from the outermost to the
+innermost level. The header is the sum of the products of the labels along each path, and is factorized into a
+category tree. For example, the paths ``(A, a), (A, b), (B, a), (B, b)`` are factorized into ``(A + B) * (a + b)``.
+
+The factorization is combinatorial: the labels are coded as integers, level by level, and a set of paths is split
+into a product wherever it is the Cartesian product of its leading and trailing levels. Otherwise, the paths are
+grouped by their first level, and labels that are followed by the same set of paths are summed into a common factor.
+
+A category tree is a label (`str`), or a tuple ``('*', factor, factor, ...)`` for a product, or a tuple
+``('+', term, term, ...)`` for a sum. Labels and terms keep the order of their first appearance in the header.
+Empty cells are left out of the products. A path that ends early, e.g. ``(A, '')`` next to ``(A, b)``, leaves the
+:data:`UNIT`, the empty product, as a term, such that ``A * (1 + b)`` still expands to every path of the header.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Operator of a product in the category tree.
+PRODUCT = '*'
+#: Operator of a sum in the category tree.
+SUM = '+'
+#: Unit of the category tree, the empty product.
+UNIT = (PRODUCT,)
+
+
+def factorize(header, header_empty=None):
+    """
+    Factorizes a header into a category tree.
+
+    :param header: Header region, with one path of labels in every row
+    :type header: numpy.array
+    :param header_empty: Mask with `True` for the empty cells of `header`; if `None`, only cells with the empty
+                         string are empty
+    :type header_empty: numpy.array
+    :return: category tree, `None` for a header without labels
+    """
+    header = np.asarray(header)
+    if header.ndim != 2 or header.size == 0:
+        return None
+    if header_empty is not None:
+        header = np.where(header_empty, '', header)
+    codes, names = _encode(header)
+    tree = _factorize(_unique_rows(codes), list(range(header.shape[1])), names)
+    return None if tree == UNIT else tree
+
+
+def to_string(tree):
+    """
+    Formats a category tree as an expression, e.g. ``'(A + B) * (a + b)'``.
+
+    :param tree: Category tree, as returned by :func:`~tabledataextractor.table.factors.factorize`
+    :return: str
+    """
+    if tree is None:
+        return ''
+    if isinstance(tree, str):
+        return tree
+    if tree == UNIT:
+        return '1'
+    if tree[0] == PRODUCT:
+        return ' * '.join('({})'.format(to_string(factor)) if not isinstance(factor, str) and factor[0] == SUM
+                          else to_string(factor) for factor in tree[1:])
+    return ' + '.join(to_string(term) for term in tree[1:])
+
+
+def _encode(header):
+    """
+    Codes the labels of every level (column of `header`) as integers, in the order of their first appearance.
+    Returns the matrix of codes and the labels of every level.
+    """
+    codes = np.empty(header.shape, dtype=int)
+    names = []
+    for level, column in enumerate(header.T):
+        unique, first, inverse = np.unique(column, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        codes[:, level] = rank[inverse.reshape(-1)]
+        names.append(unique[order].tolist())
+    return codes, names
+
+
+def _unique_rows(codes):
+    """Returns the unique rows of `codes`, in the order of their first appearance."""
+    _, first = np.unique(codes, axis=0, return_index=True)
+    return codes[np.sort(first)]
+
+
+def _n_unique_rows(codes):
+    """Returns the number of unique rows of `codes`."""
+    return len(np.unique(codes, axis=0))
+
+
+def _label(names, level, code):
+    """Returns the label of a code, the :data:`UNIT` for an empty cell."""
+    return names[level][code] or UNIT
+
+
+def _combine(operator, items):
+    """
+    Builds a product or a sum, flattening nested items of the same operator. The :data:`UNIT` is left out of
+    products, and an empty product is the :data:`UNIT`.
+    """
+    flat = []
+    for item in items:
+        if not isinstance(item, str) and item[0] == operator:
+            flat.extend(item[1:])
+        else:
+            flat.append(item)
+    if not flat:
+        return UNIT
+    if len(flat) == 1:
+        return flat[0]
+    return (operator,) + tuple(flat)
+
+
+def _factorize(codes, levels, names):
+    """Factorizes the unique paths `codes`, whose columns are the header `levels`."""
+    n_paths, n_levels = codes.shape
+    if n_paths == 1:
+        return _combine(PRODUCT, [_label(names, level, code) for level, code in zip(levels, codes[0])])
+    if n_levels == 1:
+        return _combine(SUM, [_label(names, levels[0], code) for code in codes[:, 0]])
+
+    # product of leading and trailing levels
+    for split in range(1, n_levels):
+        n_leading = _n_unique_rows(codes[:, :split])
+        if n_leading * _n_unique_rows(codes[:, split:]) == n_paths:
+            return _combine(PRODUCT, [_factorize(_unique_rows(codes[:, :split]), levels[:split], names),
+                                      _factorize(_unique_rows(codes[:, split:]), levels[split:], names)])
+
+    # sum over the first level, labels followed by the same paths share a common factor
+    groups = {}
+    for code in dict.fromkeys(codes[:, 0].tolist()):
+        rest = codes[codes[:, 0] == code, 1:]
+        key = frozenset(map(tuple, rest.tolist()))
+        if key in groups:
+            groups[key][0].append(code)
+        else:
+            groups[key] = ([code], rest)
+    terms = []
+    for first_codes, rest in groups.values():
+        terms.append(_combine(PRODUCT, [_combine(SUM, [_label(names, levels[0], code) for code in first_codes]),
+                                        _factorize(rest, levels[1:], names)]))
+    return _combine(SUM, terms)
@@ -9,10 +9,14 @@ Footnote handling.
 import logging
 import numpy as np
 import re
-from .parse import CellParser
+from .parse import compile_pattern
 
 log = logging.getLogger(__name__)
 
+#: Matches a footnote cell, with the footnote prefix and possibly some text, see
+#: :func:`~tabledataextractor.table.footnotes.find_footnotes`.
+FOOTNOTE_CELL = r'^([*#\.o†\da-z][\.\)]?)(?!\d)\s?(([\w\[\]\s\:]+)?\.?)\s?$'
+
 
 class Footnote:
     """
@@ -32,7 +36,11 @@ class Footnote:
 
     def __init__(self, table, prefix, prefix_cell, text):
         self._table = table
-        self.pre_cleaned_table = np.copy(self._table.pre_cleaned_table)
+        self._source_table = self._table.pre_cleaned_table
+        self._cells = self._table.pre_cleaned_table_cells
+        # stripped text of the reference cells, by cell index
+        self._stripped = {}
+        self._pre_cleaned_table = None
 
         #: Prefix string, e.g., `"a)"`.
         self.prefix = prefix
@@ -52,23 +60,47 @@ class Footnote:
         #: Cell content of the cells contatining the footnote references within the table.
         self.references = self._find_references()
 
+    @property
+    def pre_cleaned_table(self):
+        """
+        Footnote-internal version of the `pre-cleaned table`, with the footnote prefix cut out of the reference cells.
+        Built on demand.
+
+        :type: numpy.array
+        """
+        if self._pre_cleaned_table is None:
+            self._pre_cleaned_table = np.copy(self._source_table)
+            for cell, text in self._stripped.items():
+                self._pre_cleaned_table[cell] = text
+        return self._pre_cleaned_table
+
     def _find_text_cell(self):
         """Finds the cell index containing the text associated with the prefix."""
-        for column_index in range(self.prefix_cell[1] + 1, np.shape(self.pre_cleaned_table)[1]):
-            if not self._table.pre_cleaned_table_empty[self.prefix_cell[0], column_index]:
+        for column_index in range(self.prefix_cell[1] + 1, self._cells.shape[1]):
+            if not self._cells.is_empty(self.prefix_cell[0], column_index):
                 return self.prefix_cell[0], column_index
             return None
 
     def _find_text(self):
         """Finds the text associated with the prefix, only one cell can contain the text."""
         if self.text_cell is not None:
-            return str(self.pre_cleaned_table[self.text_cell])
+            return str(self._source_table[self.text_cell])
         else:
             return ""
 
+    def _cells_above(self):
+        """Yields the index and the current text of every non-empty cell above the footnote, in row-major order."""
+        above = self._cells.above(self.prefix_cell[0])
+        for cell in zip(self._cells.rows[above].tolist(), self._cells.columns[above].tolist()):
+            yield cell, self._stripped.get(cell, self._source_table[cell])
+
+    def _strip(self, cell, text):
+        """Stores the stripped text of a reference cell, truncated like the cells of the table."""
+        self._stripped[cell] = np.array(text, dtype=self._source_table.dtype).item()
+
     def _find_reference_cells(self):
         """
-        Searches the entire table above each footnote for the previously detected footnote prefix.
+        Searches the non-empty cells above each footnote for the previously detected footnote prefix.
         Updates the footnote-internal version of the `pre-cleaned table`, by cutting out the footnote prefix out of the reference cell.
 
         Rules for matching:
@@ -90,45 +122,52 @@ class Footnote:
         # Case 1a If prefix is number, general
         if re.fullmatch(pattern='[\d]{1,2}', string=self.prefix):
             log.debug("Footnote prefix {} is number".format(self.prefix))
-            fn_ref_parser_1a = CellParser('(^.+\s)(' + self.prefix + ')(\s.+)?$')
-            for fn_ref in fn_ref_parser_1a.parse(self.pre_cleaned_table[0:self.prefix_cell[0]], method='match'):
-                fn_refs.append(fn_ref[:2])
-                stripped_text = fn_ref[2][0]
+            fn_ref_1a = compile_pattern('(^.+\s)(' + self.prefix + ')(\s.+)?$')
+            for cell, cell_text in self._cells_above():
+                match = fn_ref_1a.match(cell_text)
+                if not match:
+                    continue
+                fn_refs.append(cell)
+                stripped_text = match.group(1)
                 stripped_text += self.text if self.text is not None else ""
-                if fn_ref[2][2] is not None:
-                    stripped_text += fn_ref[2][2]
-                self.pre_cleaned_table[fn_ref[:2]] = stripped_text
+                if match.group(3) is not None:
+                    stripped_text += match.group(3)
+                self._strip(cell, stripped_text)
 
         # Case 2a If prefix is a-z:
         elif re.fullmatch(pattern='[a-zA-Z]', string=self.prefix):
             log.debug("Footnote prefix {} is letter".format(self.prefix))
-            fn_ref_parser_2a = CellParser('(^.+\s)(' + self.prefix + ')(\s.+)?$')
-            for fn_ref in fn_ref_parser_2a.parse(self.pre_cleaned_table[0:self.prefix_cell[0]], method='match'):
-                fn_refs.append(fn_ref[:2])
-                stripped_text = fn_ref[2][0]
+            fn_ref_2a = compile_pattern('(^.+\s)(' + self.prefix + ')(\s.+)?$')
+            for cell, cell_text in self._cells_above():
+                match = fn_ref_2a.match(cell_text)
+                if not match:
+                    continue
+                fn_refs.append(cell)
+                stripped_text = match.group(1)
                 stripped_text += self.text if self.text is not None else ""
-                if fn_ref[2][2] is not None:
-                    stripped_text += fn_ref[2][2]
-                self.pre_cleaned_table[fn_ref[:2]] = stripped_text
+                if match.group(3) is not None:
+                    stripped_text += match.group(3)
+                self._strip(cell, stripped_text)
 
             # Case 2b If prefix is a-z and alone in the cell
-            fn_ref_parser_2b = CellParser('^(' + self.prefix + ')$')
-            for fn_ref in fn_ref_parser_2b.parse(self.pre_cleaned_table[0:self.prefix_cell[0]], method='match'):
+            fn_ref_2b = compile_pattern('^(' + self.prefix + ')$')
+            for cell, cell_text in self._cells_above():
+                if not fn_ref_2b.match(cell_text):
+                    continue
                 log.debug("Footnote prefix {} is letter and is alone in cell.".format(self.prefix))
-                fn_refs.append(fn_ref[:2])
+                fn_refs.append(cell)
                 stripped_text = self.text if self.text is not None else ""
-                self.pre_cleaned_table[fn_ref[:2]] = stripped_text
+                self._strip(cell, stripped_text)
 
         # Case 3, everything else
         else:
-            fn_ref_parser = CellParser('(' + re.escape(self.prefix) + ')')
+            fn_ref = compile_pattern('(' + re.escape(self.prefix) + ')')
             repl = " "+self.text+" " if self.text is not None else " "
-            for fn_ref in fn_ref_parser.replace(self.pre_cleaned_table[0:self.prefix_cell[0]],
-                                                repl=repl,
-                                                method='search'):
-                fn_refs.append(fn_ref[:2])
-                stripped_text = fn_ref[2]
-                self.pre_cleaned_table[fn_ref[:2]] = stripped_text
+            for cell, cell_text in self._cells_above():
+                if not fn_ref.search(cell_text):
+                    continue
+                fn_refs.append(cell)
+                self._strip(cell, fn_ref.sub(repl, cell_text))
 
         return fn_refs
 
@@ -154,15 +193,22 @@ def find_footnotes(table_object):
 
         FNprefix  = \*, #, ., o, †; possibly followed by "." or ")"
 
-    A search is performed only below the data region.
+    A search is performed only below the data region, and only over the non-empty cells of the table, see
+    :class:`~tabledataextractor.table.cells.SparseCells`.
 
     :param table_object: Input Table object
     :type table_object: ~tabledataextractor.table.table.Table
     """
-    #: finds a footnote cell that possibly contains some text as well
-    fn_parser = CellParser(r'^([*#\.o†\da-z][\.\)]?)(?!\d)\s?(([\w\[\]\s\:]+)?\.?)\s?$')
-    for fn in fn_parser.parse(table_object.pre_cleaned_table):
-        if fn[0] > table_object._cc4[0]:
-            footnote = Footnote(table_object, prefix=fn[2][0], prefix_cell=(fn[0], fn[1]), text=fn[2][1])
-            yield footnote
+    # without `CC4` the data region is not defined, and neither are the footnotes below it
+    cc4 = table_object._cc4
+    if cc4 is None:
+        return
+    cells = table_object.pre_cleaned_table_cells
+    below_data = cells.below(cc4[0])
+    # finds a footnote cell that possibly contains some text as well, the parser is precompiled in the configuration
+    (index,), groups = table_object.configs.footnote_parser.parse_all(cells.values[below_data])
+    rows, columns = cells.rows[below_data][index], cells.columns[below_data][index]
+    for row_index, column_index, fn in zip(rows, columns, groups):
+        footnote = Footnote(table_object, prefix=fn[0], prefix_cell=(int(row_index), int(column_index)), text=fn[1])
+        yield footnote
 
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Cell labels of a table, stored as a matrix of small integer codes.
+
+The lower three bits of a code hold the region of the cell (`StubHeader`, `RowHeader`, `Data`, ...), which are
+mutually exclusive. The fourth bit flags a footnote text cell (`FNtext`) and the upper four bits count the footnotes
+that reference the cell (`FNref`). Both can be combined with a region.
+The string labels are produced only on request, with :func:`~tabledataextractor.table.labels.label_strings`.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+
+"""
+
+import logging
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Unlabelled cell, ``'/'``.
+NONE = 0
+#: Title row, ``'TableTitle'``.
+TABLE_TITLE = 1
+#: Stub header, ``'StubHeader'``.
+STUB_HEADER = 2
+#: Row header, ``'RowHeader'``.
+ROW_HEADER = 3
+#: Column header, ``'ColHeader'``.
+COL_HEADER = 4
+#: Data region, ``'Data'``.
+DATA = 5
+#: Non-empty cell outside of all other regions, ``'Note'``.
+NOTE = 6
+#: Footnote prefix, ``'FNprefix'``.
+FN_PREFIX = 7
+#: Flag for a footnote text cell, ``'FNtext'``.
+FN_TEXT = 8
+#: Increment for every footnote that references a cell, ``'FNref'``.
+FN_REF = 16
+
+#: Bit mask that selects the region from a label code.
+REGION_MASK = 7
+#: Bit mask that selects the number of footnote references from a label code.
+FN_REF_MASK = 240
+
+#: Data type of the label codes.
+DTYPE = np.uint8
+
+_REGION_NAMES = ('/', 'TableTitle', 'StubHeader', 'RowHeader', 'ColHeader', 'Data', 'Note', 'FNprefix')
+
+
+def _label_name(code):
+    """Returns the string label for a single label code."""
+    names = []
+    if code & REGION_MASK or not code:
+        names.append(_REGION_NAMES[code & REGION_MASK])
+    if code & FN_TEXT:
+        names.append('FNtext')
+    names.extend(['FNref'] * ((code & FN_REF_MASK) // FN_REF))
+    return ' & '.join(names)
+
+
+#: String label for every possible label code, used as a lookup table.
+LABEL_NAMES = np.array([_label_name(code) for code in range(256)], dtype='<U60')
+
+
+def region_codes(shape, cc1, cc2, cc3, cc4, title_row=None):
+    """
+    Returns the matrix of label codes for the title row and the four regions defined by the critical cells.
+
+    :param shape: Shape of the labelled table
+    :type shape: (int, int)
+    :param cc1: Critical cell `CC1`
+    :param cc2: Critical cell `CC2`
+    :param cc3: Critical cell `CC3`
+    :param cc4: Critical cell `CC4`
+    :param title_row: Index of the title row, if used
+    :type title_row: int
+    :return: numpy.array of label codes
+    """
+    codes = np.zeros(shape, dtype=DTYPE)
+    if title_row is not None:
+        codes[title_row, :] = TABLE_TITLE
+    codes[cc1[0]:cc2[0] + 1, cc1[1]:cc2[1] + 1] = STUB_HEADER
+    codes[cc3[0]:cc4[0] + 1, cc1[1]:cc2[1] + 1] = ROW_HEADER
+    codes[cc1[0]:cc2[0] + 1, cc3[1]:cc4[1] + 1] = COL_HEADER
+    codes[cc3[0]:cc4[0] + 1, cc3[1]:cc4[1] + 1] = DATA
+    return codes
+
+
+def label_strings(codes):
+    """
+    Converts a matrix of label codes into the matrix of string labels, e.g. ``'Data'`` or ``'Data & FNref'``.
+
+    :param codes: Label codes
+    :type codes: numpy.array
+    :return: numpy.array of strings
+    """
+    return LABEL_NAMES[codes]
@@ -1,14 +1,45 @@
 # -*- coding: utf-8 -*-
 """
 Tools for parsing the table based on regular expressions.
+
+Compiled regular expressions are shared between all parsers through a module-level cache, so that a pattern is
+compiled only once per process, no matter how many parsers or tables use it. The cache is bounded, and the least
+recently used patterns are dropped first.
 """
 
+import functools
 import logging
 import re
 import numpy as np
 
 log = logging.getLogger(__name__)
 
+#: Number of compiled regular expressions that are cached and shared by all parsers.
+PATTERN_CACHE_SIZE = 512
+
+#: Methods of compiled regular expressions that can be used for parsing.
+_METHODS = ('match', 'fullmatch', 'search')
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern):
+    """
+    Returns the compiled regular expression for `pattern`. Patterns are compiled only once and cached, for the
+    :data:`PATTERN_CACHE_SIZE` most recently used patterns.
+
+    :param pattern: Regular expression pattern
+    :type pattern: str
+    :return: compiled regular expression
+    """
+    return re.compile(pattern)
+
+
+def _matcher(prog, method):
+    """Returns the bound matching method (`match`, `fullmatch` or `search`) of a compiled regular expression."""
+    if method not in _METHODS:
+        raise ValueError('Parsing method "{}" does not exist. Use one of {}.'.format(method, _METHODS))
+    return getattr(prog, method)
+
 
 class CellParser:
     """
@@ -21,6 +52,7 @@ class CellParser:
         log.debug('Initialization of CellParser with regex pattern: "{}"'.format(pattern))
         assert isinstance(pattern, str)
         self.pattern = pattern
+        self._prog = compile_pattern(pattern)
 
     def parse(self, table, method='match'):
         """
@@ -38,32 +70,79 @@ class CellParser:
         # check if table is of correct type
         assert isinstance(table, np.ndarray)
 
-        result = None
-        prog = re.compile(self.pattern)
+        matcher = _matcher(self._prog, method)
 
         # check the dimensionality of the array
         if table.ndim == 2:
             for row_index, row in enumerate(table):
                 for column_index, cell in enumerate(row):
-                    if method == 'match':
-                        result = prog.match(cell)
-                    elif method == 'fullmatch':
-                        result = prog.fullmatch(cell)
-                    elif method == 'search':
-                        result = prog.search(cell)
+                    result = matcher(cell)
                     if result:
                         yield row_index, column_index, result.groups()
         elif table.ndim == 1:
             for row_index, row in enumerate(table):
-                if method == 'match':
-                    result = prog.match(row)
-                elif method == 'fullmatch':
-                    result = prog.fullmatch(row)
-                elif method == 'search':
-                    result = prog.search(row)
+                result = matcher(row)
                 if result:
                     yield row_index, result.groups()
 
+    def _unique_matches(self, table, method):
+        """
+        Matches every unique string of the table only once.
+
+        Returns the boolean array of matches and the array of matched groups for the unique strings,
+        as well as the inverse index that maps the unique strings back onto the (flattened) table.
+        """
+        matcher = _matcher(self._prog, method)
+        # the unique strings are numbered in the order of their first occurrence, by hashing rather than sorting
+        strings = table.ravel().tolist()
+        codes = {string: code for code, string in enumerate(dict.fromkeys(strings))}
+        inverse = np.fromiter(map(codes.__getitem__, strings), dtype=np.intp, count=len(strings))
+        matched = np.zeros(len(codes), dtype=bool)
+        groups = np.empty(len(codes), dtype=object)
+        for unique_index, string in enumerate(codes):
+            result = matcher(str(string))
+            if result:
+                matched[unique_index] = True
+                groups[unique_index] = result.groups()
+        return matched, groups, inverse
+
+    def match_mask(self, table, method='match'):
+        """
+        Inputs a table and returns a mask with `True` for all matching cells.
+        Every distinct string in the table is matched only once.
+
+        :param table: Input table to be parsed
+        :type table: numpy.array
+        :param method: `search`, `match` or `fullmatch`; see Python `Regular expressions <https://docs.python.org/3.6/library/re.html>`_
+        :type method: str
+        :return: numpy.array of `bool`, with the same shape as `table`
+        """
+        assert isinstance(table, np.ndarray)
+        if table.size == 0:
+            return np.zeros(table.shape, dtype=bool)
+        matched, _, inverse = self._unique_matches(table, method)
+        return matched[inverse].reshape(table.shape)
+
+    def parse_all(self, table, method='match'):
+        """
+        Bulk version of :meth:`parse`. Every distinct string in the table is matched only once.
+        Returns the indices of all matching cells, in row-major order, and the groups that were matched for each of them.
+
+        :param table: Input table to be parsed
+        :type table: numpy.array
+        :param method: `search`, `match` or `fullmatch`; see Python `Regular expressions <https://docs.python.org/3.6/library/re.html>`_
+        :type method: str
+        :return: (tuple of numpy.array, numpy.array) -- index arrays as returned by :func:`numpy.nonzero`, one
+                 for each dimension of `table`, and an object array with the tuple of matched groups for every match
+        """
+        assert isinstance(table, np.ndarray)
+        if table.size == 0:
+            return tuple(np.array([], dtype=int) for _ in range(table.ndim)), np.empty(0, dtype=object)
+        matched, groups, inverse = self._unique_matches(table, method)
+        mask = matched[inverse]
+        index = np.nonzero(mask.reshape(table.shape))
+        return index, groups[inverse[mask]]
+
     def cut(self, table, method='match'):
         """
         Inputs a table and yields a tuple with the index of the next matching cell, as well as a string
@@ -79,9 +158,8 @@ class CellParser:
         # check if table is of correct type
         assert isinstance(table, np.ndarray)
 
-        prog = re.compile(self.pattern)
         for result in self.parse(table, method):
-            yield result[0], result[1], prog.sub("", table[result[:2]])
+            yield result[0], result[1], self._prog.sub("", table[result[:2]])
 
     def replace(self, table, repl, method='match'):
         """
@@ -101,9 +179,8 @@ class CellParser:
         # check if table is of correct type
         assert isinstance(table, np.ndarray)
 
-        prog = re.compile(self.pattern)
         for result in self.parse(table, method):
-            yield result[0], result[1], prog.sub(repl, table[result[:2]])
+            yield result[0], result[1], self._prog.sub(repl, table[result[:2]])
 
 
 class StringParser:
@@ -115,6 +192,7 @@ class StringParser:
     def __init__(self, pattern):
         assert isinstance(pattern, str)
         self.pattern = pattern
+        self._prog = compile_pattern(pattern)
 
     def parse(self, string, method='match'):
         """
@@ -130,16 +208,7 @@ class StringParser:
         # check if string is of correct type
         assert isinstance(string, str)
 
-        result = None
-        prog = re.compile(self.pattern)
-
-        if method == 'match':
-            result = prog.match(string)
-        elif method == 'fullmatch':
-            result = prog.fullmatch(string)
-        elif method == 'search':
-            result = prog.search(string)
-        if result:
+        if _matcher(self._prog, method)(string):
             return True
         else:
             return False
@@ -156,6 +225,5 @@ class StringParser:
         # check if string is of correct type
         assert isinstance(string, str)
 
-        prog = re.compile(self.pattern)
-        result = prog.sub(string, "")
+        result = self._prog.sub(string, "")
         return result
@@ -6,29 +6,62 @@ Represents a table in a highly standardized format.
 
 """
 
+import copy
+import functools
 import logging
+import threading
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 from tabledataextractor.input import from_any
-from tabledataextractor.output.print import as_string, print_table, list_as_PrettyTable
+from tabledataextractor.output.print import as_string, print_table, list_as_PrettyTable, truncate, \
+    REPR_MAX_ROWS, REPR_MAX_COLUMNS
 from tabledataextractor.output.to_csv import write_to_csv
-from tabledataextractor.output.to_pandas import to_pandas, build_category_table
+from tabledataextractor.output import to_sqlite
+from tabledataextractor.output.export import export
+from tabledataextractor.output.to_pandas import to_pandas
 from tabledataextractor.table.parse import StringParser
 from tabledataextractor.exceptions import InputError, MIPSError, TDEError
 from tabledataextractor.table.history import History
-from tabledataextractor.table.algorithms import find_cc1_cc2, find_cc3, find_cc4, prefix_duplicate_labels, \
-    duplicate_spanning_cells, header_extension_up, find_title_row, find_note_cells, empty_cells, \
-    pre_clean, split_table, standardize_empty, header_extension_down, find_row_header_table, clean_row_header
+from tabledataextractor.table.config import Config, TrivialConfig, ORIENTATIONS
+from tabledataextractor.table.algorithms import mips, find_cc3, find_cc4, prefix_duplicate_labels, \
+    duplicate_spanning_cells, NO_PREFIXING, header_extension_up, find_title_row, find_note_cells, \
+    pre_clean, split_table, standardize_empty, header_extension_down, clean_row_header, \
+    categorize_header, orientation_score, build_category_rows, ORIENTATION_MARGIN
 from tabledataextractor.table.footnotes import find_footnotes
+from tabledataextractor.table.cells import SparseCells
+from tabledataextractor.table import labels
+from tabledataextractor.table.labels import region_codes, label_strings
 
 log = logging.getLogger(__name__)
 
+#: Marks a cached property that has not been built yet.
+_NOT_BUILT = object()
+
+#: Worker processes shared by all tables with ``parallel_orientation = True``, see :func:`orientation_executor`.
+_ORIENTATION_EXECUTOR = None
+_ORIENTATION_EXECUTOR_LOCK = threading.Lock()
+
+
+def orientation_executor():
+    """
+    Returns the process pool that analyzes the transposed tables with ``parallel_orientation = True``. The pool is
+    created on first use and shared by all tables, such that the worker processes are started only once.
+
+    :return: concurrent.futures.ProcessPoolExecutor
+    """
+    global _ORIENTATION_EXECUTOR
+    with _ORIENTATION_EXECUTOR_LOCK:
+        if _ORIENTATION_EXECUTOR is None:
+            _ORIENTATION_EXECUTOR = ProcessPoolExecutor()
+        return _ORIENTATION_EXECUTOR
+
 
 class Table:
     """
     Main `TableDataExtractor` object that includes the raw (input), cleaned (processes) and labelled tables.
-    Represents the table input (.csv, .html, python list, url) in a highly standardized `category table` format,
-    using the MIPS (*Minimum Indexing Point Search*) algorithm.
+    Represents the table input (.csv, .html, python list, numpy array, pandas DataFrame, url) in a highly
+    standardized `category table` format, using the MIPS (*Minimum Indexing Point Search*) algorithm.
 
     Optional configuration keywords (defaults):
 
@@ -53,54 +86,113 @@ class Table:
         * ``col_header = None``
             If an integer is given, it indicates the index of `col_header` rows. This overwrites the MIPS algorithm.
             For example, ``col_header = 0`` will make only the first row a column header.
-
-    :param file_path: Path to .html or .cvs file, URL or list object that is used as input
-    :type file_path: str | list
+        * ``orientation = 'original'``
+            Orientation of the input table, ``'original'``, ``'transposed'`` or ``'auto'``. With ``'auto'``, the table
+            is analyzed in both orientations and the transposed table is kept only if its
+            :func:`~tabledataextractor.table.algorithms.orientation_score` is clearly higher.
+        * ``parallel_orientation = False``
+            If `True` and ``orientation = 'auto'``, the transposed table is analyzed in a separate process,
+            concurrently with the original table. The worker processes are shared by all tables, see
+            :func:`~tabledataextractor.table.table.orientation_executor`.
+        * ``empty_cell = r'^([\\s\\-\\–\\—\\"]+)?$'``
+            Regular expression that defines an empty cell, when fully matched. For example,
+            ``empty_cell = r'^([\\s\\-\\–\\—\\"]+|n/a|nd|×)?$'`` also treats `n/a`, `nd` and `×` as empty.
+
+    :param file_path: Path to .html or .cvs file, URL, html or csv content as str or bytes, file object, list object,
+                      numpy array or pandas DataFrame that is used as input
+    :type file_path: str | bytes | io.IOBase | list | numpy.ndarray | pandas.DataFrame
     :param table_number: Number of table to read, if there are several at the given url, or in the html file
     :type table_number: int
     """
 
+    #: Class of the configuration, see :mod:`~tabledataextractor.table.config`.
+    _config_class = Config
+
     def __init__(self, file_path, table_number=1, **kwargs):
         """Runs required `TableDataExtractor` algorithms automatically upon initialization."""
-        log.info('Initialization of table: "{}"'.format(file_path))
+        self._source = from_any.describe(file_path)
+        log.info('Initialization of table: "{}"'.format(self._source))
         self._file_path = file_path
         self._table_number = table_number
+        self._raw_table = None
+        self._cells_cache = (None, None)
         self._configs = self._set_configs(**kwargs)
         self._history = History()
         self._analyze_table()
 
-    @property
-    def _default_configs(self):
-        return {'use_title_row': True,
-                'use_prefixing': True,
-                'use_footnotes': True,
-                'use_spanning_cells': True,
-                'use_header_extension': True,
-                'use_max_data_area': False,
-                'standardize_empty_data': True,
-                'row_header': None,
-                'col_header': None}
-
     def _analyze_table(self):
         """
         Performs the analysis of the input table and is run automatically on initialization of the table object.
+
+        The analysis is performed on a copy of the table, and its results are adopted by the table only once the
+        analysis has finished. The algorithms don't modify the table, see :mod:`~tabledataextractor.table.algorithms`.
         """
+        if self.configs['orientation'] == 'transposed':
+            self.history._table_transposed = True
+
         # check if input array is empty
-        if empty_cells(self.raw_table).all():
+        raw_table_cells = SparseCells.from_table(self.raw_table, self.configs.empty_parser, values=False)
+        if not len(raw_table_cells):
             msg = 'Input table is empty.'
             log.critical(msg)
             raise InputError(msg)
 
         # clean-up the input array
-        self._pre_cleaned_table = pre_clean(self.raw_table)
-        log.debug("Table shape changed from {} to {}.".format(np.shape(self.raw_table),
-                                                             np.shape(self.pre_cleaned_table)))
+        pre_cleaned_table = pre_clean(self.raw_table, cells=raw_table_cells)
+        log.debug("Table shape changed from {} to {}.".format(np.shape(self.raw_table), np.shape(pre_cleaned_table)))
+
+        if self.configs['orientation'] == 'auto':
+            analyzed = self._analyze_orientations(pre_cleaned_table)
+        else:
+            analyzed = self._analyzed(pre_cleaned_table, transposed=self.history.table_transposed)
+        self._adopt(analyzed)
+
+    def _analyzed(self, pre_cleaned_table, transposed):
+        """
+        Returns a shallow copy of the table, with its own history, analyzed in the given orientation.
+
+        :param pre_cleaned_table: Pre-cleaned table, see :func:`~tabledataextractor.table.algorithms.pre_clean`
+        :type pre_cleaned_table: numpy.array
+        :param transposed: Whether `pre_cleaned_table` is the transposed input table
+        :type transposed: bool
+        :return: ~tabledataextractor.table.table.Table
+        """
+        analyzed = copy.copy(self)
+        analyzed._history = History()
+        analyzed._history._table_transposed = transposed
+        analyzed._analyze_pre_cleaned_table(pre_cleaned_table)
+        return analyzed
+
+    def _adopt(self, analyzed):
+        """Adopts the results of the analysis of a copy of the table, and clears the cached results."""
+        self._pre_cleaned_table = analyzed._pre_cleaned_table
+        self._footnotes = analyzed._footnotes
+        self._cc1, self._cc2 = analyzed._cc1, analyzed._cc2
+        self._history = analyzed._history
+        self._label_codes = None
+        self._category_table = None
+        self._row_categories = _NOT_BUILT
+        self._subtables = None
+
+    def _analyze_pre_cleaned_table(self, pre_cleaned_table):
+        """
+        Performs the analysis of the table after pre-cleaning, in the current orientation of the table.
+        The results of the algorithms are stored in the table, and their flags in the history of the table.
+
+        :param pre_cleaned_table: Pre-cleaned table, see :func:`~tabledataextractor.table.algorithms.pre_clean`
+        :type pre_cleaned_table: numpy.array
+        """
+        self._pre_cleaned_table = pre_cleaned_table
 
         if self.configs['use_spanning_cells']:
-            self._pre_cleaned_table = duplicate_spanning_cells(self, self._pre_cleaned_table)
+            spanned = duplicate_spanning_cells(self, self._pre_cleaned_table)
+            self.history._spanning_cells_extended = not np.array_equal(spanned, self._pre_cleaned_table)
+            self._pre_cleaned_table = spanned
 
+        prefixing = NO_PREFIXING
         if self.configs['use_prefixing']:
-            self._pre_cleaned_table = prefix_duplicate_labels(self, self._pre_cleaned_table)
+            self._pre_cleaned_table, prefixing = prefix_duplicate_labels(self, self._pre_cleaned_table)
+        self.history._prefixing_performed, self.history._prefixed_rows = prefixing
 
         # footnotes handling
         self._footnotes = []
@@ -112,7 +204,8 @@ class Table:
         # Main MIPS algorithm, finding the data and header regions
         try:
             #: Critical cells `CC1` and `CC2`
-            self._cc1, self._cc2 = find_cc1_cc2(self, self._cc4, self._pre_cleaned_table)
+            self._cc1, self._cc2, self.history._title_row_removed = mips(self, self._cc4, self._pre_cleaned_table,
+                                                                          prefixing=prefixing)
         except (MIPSError, TypeError):
             msg = "ERROR: Main MIPS Algorithm failed. Maybe the input table is bad!"
             log.critical(msg)
@@ -121,8 +214,11 @@ class Table:
             log.debug("Table Cell CC1 = {}; Table Cell CC2 = {}".format(self._cc1, self._cc2))
 
         if self.configs['use_header_extension']:
-            self._cc1 = header_extension_up(self, self._cc1)
-            self._cc2 = header_extension_down(self, self._cc1, self._cc2, self._cc4)
+            cc1 = header_extension_up(self, self._cc1)
+            self.history._header_extended_up = cc1 != self._cc1
+            self._cc1 = cc1
+            self._cc2, self.history._header_extended_down = header_extension_down(self, self._cc1, self._cc2,
+                                                                                  self._cc4, prefixing=prefixing)
             log.debug("Header extension, new cc1 = {}, new cc2 = {}".format(self._cc1, self._cc2))
 
         # check if critical cell `CC3` can be found
@@ -131,6 +227,52 @@ class Table:
         except MIPSError:
             raise
 
+    def _analyze_orientations(self, pre_cleaned_table):
+        """
+        Analyzes the table in the original and in the transposed orientation and keeps the result with the higher
+        :func:`~tabledataextractor.table.algorithms.orientation_score`. The original orientation is kept unless the
+        score of the transposed table is higher by more than
+        :data:`~tabledataextractor.table.algorithms.ORIENTATION_MARGIN`, which includes ties.
+        Pre-cleaning is shared, since the pre-cleaned transposed table is the transposed pre-cleaned table.
+
+        :param pre_cleaned_table: Pre-cleaned table in the original orientation
+        :type pre_cleaned_table: numpy.array
+        :return: ~tabledataextractor.table.table.Table -- analyzed copy of the table, in the winning orientation
+        """
+        transposed_future = None
+        if self.configs['parallel_orientation']:
+            configs = self.configs.replace(orientation='original', parallel_orientation=False)
+            transposed_future = orientation_executor().submit(_analyze_orientation, pre_cleaned_table.T, configs)
+
+        results = [self._orientation_candidate(pre_cleaned_table, transposed=False)]
+        if transposed_future is not None:
+            # only the error of the original orientation is reported
+            results.append((transposed_future.result(), None))
+        else:
+            results.append(self._orientation_candidate(np.copy(pre_cleaned_table.T), transposed=True))
+        candidates = [candidate for candidate, _ in results]
+
+        scores = [orientation_score(candidate) if candidate is not None else None for candidate in candidates]
+        log.info("Orientation scores, original: {}, transposed: {}".format(*scores))
+        if scores[0] is None and scores[1] is None:
+            # neither orientation works, report the error of the original orientation
+            raise results[0][1]
+        transposed = scores[0] is None or (scores[1] is not None and scores[1] > scores[0] + ORIENTATION_MARGIN)
+        winner = candidates[1] if transposed else candidates[0]
+        winner._history._table_transposed = transposed
+        return winner
+
+    def _orientation_candidate(self, pre_cleaned_table, transposed):
+        """
+        Returns a shallow copy of the table, analyzed in the given orientation, and `None`; or `None` and the error if
+        the analysis fails.
+        """
+        try:
+            return self._analyzed(pre_cleaned_table, transposed), None
+        except TDEError as e:
+            log.info("Analysis failed in {} orientation: {}".format('transposed' if transposed else 'original', e))
+            return None, e
+
     @property
     def footnotes(self):
         """
@@ -165,63 +307,69 @@ class Table:
         """
         Cell labels.
 
-        :type: list
+        :type: numpy.array
         """
-        temp = np.empty_like(self._pre_cleaned_table, dtype="<U60")
-        temp[:, :] = '/'
+        return label_strings(self.label_codes)
 
-        if self.configs['use_title_row']:
-            temp[self.title_row, :] = 'TableTitle'
+    @property
+    def label_codes(self):
+        """
+        Cell labels as a matrix of integer codes, computed once per analysis of the table.
+        The codes are defined in :mod:`~tabledataextractor.table.labels`.
 
-        temp[self._cc1[0]:self._cc2[0] + 1, self._cc1[1]:self._cc2[1] + 1] = 'StubHeader'
-        temp[self._cc3[0]:self._cc4[0] + 1, self._cc1[1]:self._cc2[1] + 1] = 'RowHeader'
-        temp[self._cc1[0]:self._cc2[0] + 1, self._cc3[1]:self._cc4[1] + 1] = 'ColHeader'
-        temp[self._cc3[0]:self._cc4[0] + 1, self._cc3[1]:self._cc4[1] + 1] = 'Data'
+        :type: numpy.array
+        """
+        if self._label_codes is None:
+            self._label_codes = self._find_label_codes()
+        return self._label_codes
+
+    def _find_label_codes(self):
+        """Labels the regions, footnotes and notes of the table."""
+        codes = region_codes(np.shape(self._pre_cleaned_table), self._cc1, self._cc2, self._cc3, self._cc4,
+                             title_row=self.title_row)
 
         for footnote in self.footnotes:
-            temp[footnote.prefix_cell[0], footnote.prefix_cell[1]] = 'FNprefix'
+            codes[footnote.prefix_cell] = labels.FN_PREFIX
             if footnote.text_cell is not None:
-                temp[footnote.text_cell[0], footnote.text_cell[1]] = 'FNtext' if \
-                    temp[footnote.text_cell[0], footnote.text_cell[1]] == '/' else 'FNprefix & FNtext'
+                codes[footnote.text_cell] = labels.FN_TEXT if codes[footnote.text_cell] == labels.NONE else \
+                    labels.FN_PREFIX | labels.FN_TEXT
             for ref_cell in footnote.reference_cells:
-                temp[ref_cell[0], ref_cell[1]] = 'FNref' if temp[ref_cell[0], ref_cell[1]] == '/' else \
-                    temp[ref_cell[0], ref_cell[1]] + ' & FNref'
+                if codes[ref_cell] & labels.FN_REF_MASK != labels.FN_REF_MASK:
+                    codes[ref_cell] += labels.FN_REF
 
         # all non-empty unlabelled cells at this point are labelled 'Note'
-        for note_cell in find_note_cells(self, temp):
-            temp[note_cell] = 'Note'
-        return temp
+        codes[find_note_cells(self, codes)] = labels.NOTE
+        return codes
 
     @property
     def configs(self):
         """
         Configuration keywords set at the creation of the :class:`~tabledataextractor.table.table.Table` instance.
+        The configuration is immutable and shared by all tables with the same configuration keywords.
 
-        :type: dict
+        :type: ~tabledataextractor.table.config.Config
         """
         return self._configs
 
     @property
     def raw_table(self):
         """
-        Input table, as provided to `TableDataExtractor`.
+        Input table, as provided to `TableDataExtractor`. The input is read only once.
 
         :type: numpy.array
         """
-        try:
+        if self._raw_table is None:
             temp = from_any.create_table(self._file_path, self._table_number)
-        except TypeError:
-            raise
-        else:
             assert isinstance(temp, np.ndarray) and temp.dtype == '<U60'
             if temp.ndim == 1:
                 msg = 'Input table has only one row or column.'
                 log.critical(msg)
                 raise InputError(msg)
-            if not self.history.table_transposed:
-                return temp
-            else:
-                return temp.T
+            self._raw_table = temp
+        if not self.history.table_transposed:
+            return self._raw_table
+        else:
+            return self._raw_table.T
 
     @property
     def pre_cleaned_table(self):
@@ -236,22 +384,47 @@ class Table:
     @property
     def pre_cleaned_table_empty(self):
         """
-        Mask array with `True` for all empty cells of the ``pre_cleaned_table``.
+        Mask array with `True` for all empty cells of the ``pre_cleaned_table``, as defined by the ``empty_cell``
+        configuration keyword. The mask is built on demand from the ``pre_cleaned_table_cells`` and is not kept.
 
         :type: numpy.array
         """
-        return empty_cells(self._pre_cleaned_table)
+        return self.pre_cleaned_table_cells.empty
+
+    @property
+    def pre_cleaned_table_cells(self):
+        """
+        Sparse store of the non-empty cells of the ``pre_cleaned_table``, as defined by the ``empty_cell``
+        configuration keyword, see :class:`~tabledataextractor.table.cells.SparseCells`. Built once for every
+        version of the ``pre_cleaned_table``.
+
+        :type: ~tabledataextractor.table.cells.SparseCells
+        """
+        table = self._pre_cleaned_table
+        cached_table, cells = self._cells_cache
+        if cached_table is not table:
+            cells = SparseCells.from_table(table, self.configs.empty_parser)
+            self._cells_cache = (table, cells)
+        return cells
+
+    def _empty(self, array):
+        """Returns a mask with `True` for all empty cells of `array`, as defined by the configuration."""
+        return self.configs.empty_parser.match_mask(array, method='fullmatch')
 
     @property
     def category_table(self):
         """
         Standardized table, where each row corresponds to a single data point of the original table.
         The columns are the row and column categories where the data point belongs to.
+        The category table is built only once.
 
         :type: list
         """
+        if self._category_table is not None:
+            return self._category_table
         if self._cc1 and self._cc2 and self._cc3 and self._cc4:
-            return build_category_table(to_pandas(self))
+            self._category_table = build_category_rows(self.data, self.row_header, self.col_header)
+            return self._category_table
         else:
             msg = "Category table not built. Critical cells have not been found."
             raise MIPSError(msg)
@@ -303,35 +476,92 @@ class Table:
         :type: numpy.ndarray
         """
         if self._cc1 and self._cc2 and self._cc3 and self._cc4:
-            data_region = self._pre_cleaned_table[self._cc3[0]:self._cc4[0] + 1, self._cc3[1]:self._cc4[1] + 1]
+            rows, columns = slice(self._cc3[0], self._cc4[0] + 1), slice(self._cc3[1], self._cc4[1] + 1)
+            data_region = self._pre_cleaned_table[rows, columns]
             if self.configs['standardize_empty_data']:
-                data_region = standardize_empty(data_region)
+                data_region = standardize_empty(data_region, self.pre_cleaned_table_cells.region_empty(rows, columns))
             return data_region
         else:
             msg = "No data region. Critical cells have not been found."
             raise MIPSError(msg)
 
+    @property
+    def row_header_factors(self):
+        """
+        Factorized row header, a category tree according to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
+        See :func:`~tabledataextractor.table.factors.factorize`.
+
+        :type: str | tuple
+        """
+        header = self.row_header
+        return categorize_header(header, self._empty(header) if header is not None else None)
+
+    @property
+    def col_header_factors(self):
+        """
+        Factorized column header, a category tree according to Embley et al., *DOI: 10.1007/s10032-016-0259-1*.
+        See :func:`~tabledataextractor.table.factors.factorize`.
+
+        :type: str | tuple
+        """
+        header = self.col_header
+        if header is None:
+            return None
+        return categorize_header(header.T, self._empty(header.T))
+
     @property
     def subtables(self):
         """
         List of all subtables.
         Each subtable is an instance of :class:`~tabledataextractor.table.table.Table`.
+        Subtables that cannot be analyzed are left out.
 
         :type: list[~tabledataextractor.table.table.Table]
         """
+        return list(self.iter_subtables())
+
+    def iter_subtables(self, max_workers=None, executor=None):
+        """
+        Lazily analyzes the subtables and yields them one by one, as instances of
+        :class:`~tabledataextractor.table.table.Table`.
+        The subtables are analyzed directly from the `pre-cleaned table`, with the configuration of the table in the
+        orientation of the `pre-cleaned table`. Once all subtables have been analyzed, they are cached, and the
+        analysis is not repeated.
+
+        A failure of the analysis of one subtable is logged and does not affect the other subtables.
+
+        :param max_workers: If given, the subtables are analyzed concurrently, in a new pool with this number of worker
+                            processes
+        :type max_workers: int
+        :param executor: If given, the subtables are analyzed concurrently with this executor, which can be shared
+                         between tables and is not shut down; takes precedence over `max_workers`
+        :type executor: concurrent.futures.Executor
+        :return: generator of :class:`~tabledataextractor.table.table.Table`
+        """
+        if self._subtables is not None:
+            yield from self._subtables
+            return
+
+        # the subtables are cut from the pre-cleaned table, which is already in the analyzed orientation
+        analyze = functools.partial(_analyze_subtable, configs=self.configs.replace(orientation='original'))
+        own_executor = None
+        if executor is None and max_workers:
+            executor = own_executor = ProcessPoolExecutor(max_workers=max_workers)
+        if executor is not None:
+            results = executor.map(analyze, split_table(self))
+        else:
+            results = map(analyze, split_table(self))
+
         tables = []
-        g = split_table(self)
-        while True:
-                subtable = next(g, None)
-                if subtable is None:
-                    break
-                else:
-                    try:
-                        tables.append(Table(subtable))
-                    except MIPSError as e:
-                        log.exception("Subtable MIPS failure {}".format(e.args))
-                        break
-        return tables
+        try:
+            for table in results:
+                if table is not None:
+                    tables.append(table)
+                    yield table
+        finally:
+            if own_executor is not None:
+                own_executor.shutdown()
+        self._subtables = tables
 
     @property
     def row_categories(self):
@@ -343,21 +573,24 @@ class Table:
 
         :type: ~tabledataextractor.table.table.TrivialTable
         """
-        # this outer try statement is necessary to catch some weird errors with empty category tables
+        if self._row_categories is _NOT_BUILT:
+            self._row_categories = self._build_row_categories()
+        return self._row_categories
+
+    def _build_row_categories(self):
+        """Builds the `row_categories` table from the stub header and the row header."""
+        stub_header = self.stub_header
+        row_header = self.row_header
+        if stub_header.shape[1] == 0 or self.data.size == 0:
+            return None
         try:
-            if len(self.stub_header.T) != 0 and len(self.stub_header.T) == len(self.category_table[0][1]):
-                raw_table = find_row_header_table(self.category_table, self.stub_header)
-                try:
-                    table = TrivialTable(raw_table, clean_row_header=True, row_header=0,
-                                         col_header=len(self.stub_header) - 1)
-                except TDEError as e:
-                    return None
-                if not empty_cells(table.data).any():
-                    return table
-            else:
-                return None
-        except IndexError:
+            table = TrivialTable(np.vstack((stub_header, row_header)), clean_row_header=True, row_header=0,
+                                 col_header=len(stub_header) - 1, empty_cell=self.configs['empty_cell'])
+        except TDEError:
             return None
+        if not table._empty(table.data).any():
+            return table
+        return None
 
     def contains(self, pattern):
         """
@@ -383,6 +616,7 @@ class Table:
         """
         self._history = History()
         self.history._table_transposed = True
+        self._configs = self._configs.replace(orientation='transposed')
         self._analyze_table()
 
     @property
@@ -396,45 +630,71 @@ class Table:
         return find_cc3(self, self._cc2)
 
     def _set_configs(self, **kwargs):
-        """Sets the configuration parameters based on the user input."""
-        configs = self._default_configs
-        for key, value in kwargs.items():
-            if key in self._default_configs:
-                configs[key] = value
-            else:
-                msg = 'Keyword "{}" does not exist.'.format(key)
-                log.critical(msg)
-                raise InputError(msg)
-        log.info('Configuration parameters are: {}'.format(configs))
-        return configs
+        """Returns the shared configuration for the user input, see :mod:`~tabledataextractor.table.config`."""
+        return self._config_class.create(**kwargs)
 
     def _copy_footnotes(self, footnote):
         """
         Updates the pre-cleaned table with updated reference cells for a given footnote.
         """
-        if not np.array_equal(self._pre_cleaned_table, footnote.pre_cleaned_table):
+        # the table can only have changed if references to the footnote have been found
+        if footnote.reference_cells and not np.array_equal(self._pre_cleaned_table, footnote.pre_cleaned_table):
             self._pre_cleaned_table = np.copy(footnote.pre_cleaned_table)
             self.history._footnotes_copied = True
             log.debug("METHOD. Footnotes copied into cells.")
 
-    def print(self):
+    def print(self, file=None, max_rows=None, max_columns=None):
         """
         Prints the `raw table` (input), `cleaned table` (processed by `TableDataExtractor`) and `labels`
         (regions of the table) nicely.
+
+        :param file: Stream to print to, `sys.stdout` by default
+        :param max_rows: Maximum number of rows to show for each table, all rows if `None`
+        :type max_rows: int
+        :param max_columns: Maximum number of columns to show for each table, all columns if `None`
+        :type max_columns: int
         """
-        log.debug("Printing table: {}".format(self._file_path))
-        print_table(self.raw_table)
-        print_table(self._pre_cleaned_table)
-        print_table(self.labels)
+        log.debug("Printing table: {}".format(self._source))
+        print_table(self.raw_table, file=file, max_rows=max_rows, max_columns=max_columns)
+        print_table(self._pre_cleaned_table, file=file, max_rows=max_rows, max_columns=max_columns)
+        print_table(self.labels, file=file, max_rows=max_rows, max_columns=max_columns)
 
-    def print_raw_table(self):
+    def print_raw_table(self, file=None, max_rows=None, max_columns=None):
         """Prints raw input table nicely."""
-        print_table(self.raw_table)
+        print_table(self.raw_table, file=file, max_rows=max_rows, max_columns=max_columns)
 
-    def to_csv(self, file_path):
-        """Saves the `raw_table` to a `.csv` file."""
-        log.info("Saving raw table to .csv to file: {}".format(self._file_path))
-        write_to_csv(self.raw_table, file_path=file_path)
+    def to_csv(self, file_path, artefact='raw_table', compression=None):
+        """
+        Saves the `raw_table`, or another artefact of the table, to a `.csv` file.
+
+        :param file_path: Output location
+        :type file_path: str
+        :param artefact: ``'raw_table'``, ``'pre_cleaned_table'``, ``'labels'``, ``'category_table'`` or
+                         ``'footnotes'``
+        :type artefact: str
+        :param compression: ``'gzip'``, ``'zstd'`` or `None`; inferred from the file extension if `None`
+        :type compression: str
+        """
+        log.info("Saving {} to .csv to file: {}".format(artefact, self._source))
+        if artefact == 'raw_table':
+            write_to_csv(self.raw_table, file_path=file_path, compression=compression)
+        else:
+            export(self, file_path, artefact=artefact, output_format='csv', compression=compression)
+
+    def to_jsonl(self, file_path, artefact='category_table', compression=None):
+        """
+        Saves the `category_table`, or another artefact of the table, to a `.jsonl` file, one record per line.
+
+        :param file_path: Output location
+        :type file_path: str
+        :param artefact: ``'raw_table'``, ``'pre_cleaned_table'``, ``'labels'``, ``'category_table'`` or
+                         ``'footnotes'``
+        :type artefact: str
+        :param compression: ``'gzip'``, ``'zstd'`` or `None`; inferred from the file extension if `None`
+        :type compression: str
+        """
+        log.info("Saving {} to .jsonl to file: {}".format(artefact, self._source))
+        export(self, file_path, artefact=artefact, output_format='jsonl', compression=compression)
 
     def to_pandas(self):
         """
@@ -443,26 +703,54 @@ class Table:
 
         :return: pandas.DataFrame
         """
-        log.info("Converting table to Pandas DataFrame: {}".format(self._file_path))
+        log.info("Converting table to Pandas DataFrame: {}".format(self._source))
         return to_pandas(self)
 
+    def to_sqlite(self, file_path, source=None, wal=False):
+        """
+        Saves the `Table` to an `SQLite` database, see :mod:`~tabledataextractor.output.to_sqlite`.
+
+        :param file_path: Path to the database
+        :type file_path: str
+        :param source: Name of the table in the database, the input of the table by default
+        :type source: str
+        :param wal: Use write-ahead logging
+        :type wal: bool
+        :return: id of the table in the database
+        """
+        log.info("Saving table to SQLite database {}: {}".format(file_path, self._source))
+        connection = to_sqlite.connect(file_path, wal=wal)
+        try:
+            table_id, = to_sqlite.write_to_sqlite([(self, source or self._source, self._table_number)], connection)
+        finally:
+            connection.close()
+        return table_id
+
     def __str__(self):
         """As the user wants to see it"""
-        log.debug("Printing table: {}".format(self._file_path))
+        log.debug("Printing table: {}".format(self._source))
         t = list_as_PrettyTable(self.category_table)
         return str(t)
 
     def __repr__(self):
-        """As the developer wants to see it"""
-        intro = "Table({}, table_number={}, transposed={})".format(self._file_path, self._table_number,
+        """
+        As the developer wants to see it.
+        Large tables are truncated to ``REPR_MAX_ROWS`` and ``REPR_MAX_COLUMNS``, see
+        :mod:`~tabledataextractor.output.print`.
+        """
+        intro = "Table({}, table_number={}, transposed={})".format(self._source, self._table_number,
                                                                    self.history.table_transposed)
-        log.debug("Repr. table: {}".format(self._file_path))
-        array_width = np.shape(self._pre_cleaned_table)[1]
-        input_string = as_string(self.raw_table)
+        log.debug("Repr. table: {}".format(self._source))
+        input_string = as_string(self.raw_table, max_rows=REPR_MAX_ROWS, max_columns=REPR_MAX_COLUMNS)
+        pre_cleaned_table = truncate(self._pre_cleaned_table, REPR_MAX_ROWS, REPR_MAX_COLUMNS)
+        labels = truncate(self.labels, REPR_MAX_ROWS, REPR_MAX_COLUMNS)
         results_string = as_string(
-            np.concatenate((self._pre_cleaned_table, np.full((1, array_width), "", dtype='<U60'), self.labels)))
-        t = list_as_PrettyTable(self.category_table)
-        return intro + "\n\n" + input_string + results_string + str(t)
+            np.concatenate((pre_cleaned_table, np.full((1, pre_cleaned_table.shape[1]), "", dtype='<U60'), labels)))
+        try:
+            t = str(list_as_PrettyTable(self.category_table, max_rows=REPR_MAX_ROWS))
+        except MIPSError:
+            t = ''
+        return intro + "\n\n" + input_string + results_string + t
 
 
 class TrivialTable(Table):
@@ -480,22 +768,26 @@ class TrivialTable(Table):
             The column up to which the row header is defined.
         * ``col_header = 0``
             The row up to which the column header is defined.
+        * ``empty_cell = r'^([\\s\\-\\–\\—\\"]+)?$'``
+            Regular expression that defines an empty cell, when fully matched.
 
 
     """
+    _config_class = TrivialConfig
+
     def __init__(self, file_path, table_number=1, **kwargs):
         super().__init__(file_path=file_path, table_number=table_number, **kwargs)
 
-    @property
-    def _default_configs(self):
-        return {'standardize_empty_data': False, 'clean_row_header': False, 'row_header': 0, 'col_header': 0}
-
     def _analyze_table(self):
         """
         Performs the analysis of the input table and is run automatically on initialization of the table object.
         """
+        self._label_codes = None
+        self._category_table = None
+        self._row_categories = _NOT_BUILT
+
         # check if input array is empty
-        if empty_cells(self.raw_table).all():
+        if not len(SparseCells.from_table(self.raw_table, self.configs.empty_parser, values=False)):
             msg = 'Input table is empty.'
             log.critical(msg)
             raise InputError(msg)
@@ -523,20 +815,9 @@ class TrivialTable(Table):
         else:
             return self._cc2[0]+1, self._cc2[1]+1
 
-    @property
-    def labels(self):
-        """
-        Cell labels.
-
-        :type: numpy.array
-        """
-        temp = np.empty_like(self._pre_cleaned_table, dtype="<U60")
-        temp[:, :] = '/'
-        temp[self._cc1[0]:self._cc2[0] + 1, self._cc1[1]:self._cc2[1] + 1] = 'StubHeader'
-        temp[self._cc3[0]:self._cc4[0] + 1, self._cc1[1]:self._cc2[1] + 1] = 'RowHeader'
-        temp[self._cc1[0]:self._cc2[0] + 1, self._cc3[1]:self._cc4[1] + 1] = 'ColHeader'
-        temp[self._cc3[0]:self._cc4[0] + 1, self._cc3[1]:self._cc4[1] + 1] = 'Data'
-        return temp
+    def _find_label_codes(self):
+        """Labels the regions of the table."""
+        return region_codes(np.shape(self._pre_cleaned_table), self._cc1, self._cc2, self._cc3, self._cc4)
 
     @property
     def col_header(self):
@@ -591,5 +872,43 @@ class TrivialTable(Table):
         """None"""
         return None
 
+    def iter_subtables(self, max_workers=None, executor=None):
+        """Yields nothing, since a `TrivialTable` doesn't have subtables."""
+        return iter(())
+
+
+def _analyze_orientation(array, configs):
+    """
+    Analyzes a table in a worker process, for ``orientation = 'auto'``. Returns `None` if the analysis fails.
+
+    :param array: Pre-cleaned table
+    :type array: numpy.ndarray
+    :param configs: Configuration of the table
+    :type configs: ~tabledataextractor.table.config.Config
+    :return: ~tabledataextractor.table.table.Table
+    """
+    try:
+        return Table(array, **configs)
+    except TDEError as e:
+        log.info("Analysis failed in transposed orientation: {}".format(e))
+        return None
+
+
+def _analyze_subtable(array, configs):
+    """
+    Analyzes a single subtable. Returns `None` if the analysis fails, to isolate the failure to this subtable.
+
+    :param array: Subtable array
+    :type array: numpy.ndarray
+    :param configs: Configuration of the subtable
+    :type configs: ~tabledataextractor.table.config.Config
+    :return: ~tabledataextractor.table.table.Table
+    """
+    try:
+        return Table(array, **configs)
+    except Exception as e:
+        log.exception("Subtable analysis failure {}".format(e.args))
+        return None
+
 
 
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the command-line batch converter.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import csv
+import json
+import os
+import tempfile
+
+from tabledataextractor import Table
+from tabledataextractor.cli import main, find_inputs, parse_configs
+
+log = logging.getLogger(__name__)
+
+
+class TestCli(unittest.TestCase):
+
+    inputs = ['./tests/data/table_example1.csv', './tests/data/te_06.csv']
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_find_inputs(self):
+        paths = list(find_inputs(['./tests/data/te_0[12].csv', './tests/data/table_example1.csv']))
+        self.assertListEqual(['./tests/data/te_01.csv', './tests/data/te_02.csv', './tests/data/table_example1.csv'],
+                             paths)
+        self.assertEqual(len([name for name in os.listdir('./tests/data') if name.endswith('.csv')]),
+                         len(list(find_inputs(['./tests/data']))))
+
+    def test_parse_configs(self):
+        self.assertDictEqual({'use_title_row': False, 'row_header': 0},
+                             parse_configs(['use_title_row=False', 'row_header = 0']))
+
+    def test_jsonl(self):
+        output = os.path.join(self.directory.name, 'results.jsonl')
+        self.assertEqual(0, main(self.inputs + ['-o', output, '-j', '2', '-q']))
+        with open(output, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(2, len(records))
+        for path, record in zip(self.inputs, records):
+            table = Table(path)
+            self.assertEqual(path, record['source'])
+            self.assertListEqual(table.category_table, record['category_table'])
+            self.assertListEqual(table.labels.tolist(), record['labels'])
+            self.assertListEqual(list(table._cc3), record['critical_cells']['cc3'])
+
+    def test_csv(self):
+        output = os.path.join(self.directory.name, 'results.csv')
+        self.assertEqual(0, main(self.inputs[:1] + ['-o', output, '-q', '-c', 'use_title_row=False']))
+        table = Table(self.inputs[0], use_title_row=False)
+        with open(output, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(table.pre_cleaned_table.size, len(rows))
+        data = [row for row in rows if row['label'] == 'Data']
+        self.assertListEqual([data_point[0] for data_point in table.category_table], [row['value'] for row in data])
+        self.assertListEqual(table.category_table[0][2], json.loads(data[0]['column_categories']))
+
+    def test_errors(self):
+        broken = os.path.join(self.directory.name, 'broken.csv')
+        with open(broken, 'w', encoding='utf-8') as f:
+            f.write(',,\n,,\n')
+        output = os.path.join(self.directory.name, 'results.jsonl')
+        self.assertEqual(1, main([broken, self.inputs[0], '-o', output, '-q']))
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(1, len(f.readlines()))
+
+
+if __name__ == '__main__':
+    unittest.main()
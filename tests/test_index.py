@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the search index over a corpus of tables.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import os
+import tempfile
+
+from tabledataextractor import Table
+from tabledataextractor.index import TableIndex
+from tabledataextractor.output import to_sqlite
+
+log = logging.getLogger(__name__)
+
+
+class TestTableIndex(unittest.TestCase):
+
+    paths = ['./tests/data/table_example1.csv', './tests/data/table_example2.csv', './tests/data/table_example3.csv']
+
+    def setUp(self):
+        self.tables = [(Table(path), path, 1) for path in self.paths]
+
+    def test_search(self):
+        with TableIndex() as index:
+            index.add_many(self.tables)
+            self.assertEqual(3, len(index))
+            self.assertListEqual([(self.paths[0], 1)], index.search(column_category='Rutile'))
+            self.assertListEqual([(self.paths[0], 1)], index.search(row_category='GGA', data='4.64'))
+            self.assertListEqual([], index.search(row_category='Rutile'))
+            self.assertListEqual([(self.paths[0], 1)], index.search(query='column_categories: anat*'))
+            with self.assertRaises(ValueError):
+                index.search()
+
+    def test_replace_and_remove(self):
+        with TableIndex() as index:
+            index.add_many(self.tables)
+            index.add(self.tables[0][0], self.paths[0])
+            self.assertEqual(3, len(index))
+            self.assertListEqual([(self.paths[0], 1)], index.search(column_category='Rutile'))
+            self.assertTrue(index.remove(self.paths[0]))
+            self.assertFalse(index.remove(self.paths[0]))
+            self.assertListEqual([], index.search(column_category='Rutile'))
+
+    def test_persistent(self):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            with TableIndex(path) as index:
+                index.add(*self.tables[0])
+            with TableIndex(path) as index:
+                self.assertListEqual([(self.paths[0], 1)], index.search(column_category='Rutile'))
+        finally:
+            os.remove(path)
+
+    def test_shared_database(self):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            connection = to_sqlite.connect(path)
+            to_sqlite.write_to_sqlite(self.tables, connection)
+            with TableIndex(path) as index:
+                index.add_many(self.tables)
+                self.assertEqual(3, len(index))
+                self.assertListEqual([(self.paths[0], 1)], index.search(column_category='Rutile'))
+            self.assertEqual(3, connection.execute("SELECT count(*) FROM tables").fetchone()[0])
+            connection.close()
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the input from Python lists, Numpy arrays and Pandas DataFrames.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import numpy as np
+import pandas as pd
+
+from tabledataextractor import Table
+from tabledataextractor.input import from_list, from_array, from_pandas
+
+log = logging.getLogger(__name__)
+
+
+class TestInputArray(unittest.TestCase):
+
+    path = './tests/data/table_example1.csv'
+
+    def test_ragged_list(self):
+        self.assertListEqual([['a', 'b', 'c'], ['1', '', ''], ['2', '3', '']],
+                             from_list.read([['a', 'b', 'c'], ['1'], ['2', '3']]).tolist())
+
+    def test_array_no_copy(self):
+        array = Table(self.path).raw_table
+        self.assertIs(array, from_array.read(array))
+
+    def test_object_array(self):
+        array = np.array([['a', None], [1, 2.5]], dtype=object)
+        self.assertListEqual([['a', ''], ['1', '2.5']], from_array.read(array).tolist())
+
+    def test_array_table(self):
+        table = Table(self.path)
+        table_array = Table(np.array(table.raw_table.tolist(), dtype='<U20'))
+        self.assertListEqual(table.category_table, table_array.category_table)
+        self.assertListEqual(table.labels.tolist(), table_array.labels.tolist())
+
+    def test_dataframe_labels(self):
+        columns = pd.MultiIndex.from_arrays([['Rutile', 'Rutile', 'Anatase'], ['a', 'c', 'a']])
+        index = pd.Index(['This study', 'GGA'], name='Method')
+        df = pd.DataFrame([[4.64, 2.99, None], [4.67, 2.97, 3.80]], index=index, columns=columns)
+        expected = [['', 'Rutile', 'Rutile', 'Anatase'],
+                    ['Method', 'a', 'c', 'a'],
+                    ['This study', '4.64', '2.99', ''],
+                    ['GGA', '4.67', '2.97', '3.8']]
+        self.assertListEqual(expected, from_pandas.read(df).tolist())
+        self.assertListEqual(expected[2:], from_pandas.read(df, header=False).tolist())
+        self.assertListEqual([row[1:] for row in expected], from_pandas.read(df, index=False).tolist())
+
+    def test_dataframe_default_labels(self):
+        df = pd.DataFrame([['a', 'b'], ['1', '2']])
+        self.assertListEqual([['a', 'b'], ['1', '2']], from_pandas.read(df).tolist())
+
+    def test_dataframe_table(self):
+        table = Table(self.path)
+        df = pd.DataFrame(table.raw_table[1:], columns=table.raw_table[0])
+        table_df = Table(df)
+        self.assertListEqual(table.category_table, table_df.category_table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,8 +10,12 @@ Ed Beard (ejb207@cam.ac.uk)
 import unittest
 import logging
 import os
+import io
+import numpy as np
 
 from tabledataextractor import Table
+from tabledataextractor.input import from_csv
+from tabledataextractor.exceptions import InputError
 
 log = logging.getLogger(__name__)
 
@@ -80,3 +84,26 @@ class TestInputCsv(unittest.TestCase):
 
         self.assertEqual(len(table.category_table), 10)
 
+    def test_chunks(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'table_example1.csv')
+        self.assertTrue(np.array_equal(from_csv.read(path), from_csv.read(path, chunk_size=2)))
+
+    def test_ragged_rows(self):
+        text = 'a,b,c\n\n1,2,3\n4,5\n6,7,8,9\n'
+        self.assertListEqual([['a', 'b', 'c'], ['1', '2', '3']], from_csv.read(io.StringIO(text)).tolist())
+        self.assertListEqual([['a', 'b', 'c', ''], ['1', '2', '3', ''], ['4', '5', '', ''], ['6', '7', '8', '9']],
+                             from_csv.read(io.StringIO(text), ragged='pad', chunk_size=1).tolist())
+        with self.assertRaises(InputError):
+            from_csv.read(io.StringIO(text), ragged='error')
+
+    def test_sniff_dialect(self):
+        text = 'a;b;c\n1;"2;3";4\n5;6;7\n'
+        self.assertListEqual([['a', 'b', 'c'], ['1', '2;3', '4'], ['5', '6', '7']],
+                             from_csv.read(io.StringIO(text), dialect='sniff').tolist())
+
+    def test_empty_file(self):
+        self.assertTupleEqual((0, 0), from_csv.read(io.StringIO('\n\n')).shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
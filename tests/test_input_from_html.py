@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the input from .html files.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import os
+import tempfile
+from bs4 import BeautifulSoup
+
+from tabledataextractor.input import from_html
+from tabledataextractor.exceptions import InputError
+
+log = logging.getLogger(__name__)
+
+
+class TestTableIndex(unittest.TestCase):
+
+    html = b'<html><head><script>var s = "<table>";</script><!-- <table> --></head><body>\r\n' \
+           b'<TABLE border="1"><tr><td>a</td><td><table><tr><td>in</td></tr></table></td></tr>\r\n' \
+           b'<tr><td>1</td><td>2</td></tr></TABLE><p>Text</p>\r\n' \
+           b'<table><tr><th>x</th><th>y</th></tr><tr><td>5</td><td>6\r\n7</td></tr></table></body></html>'
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.html')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.html)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_index(self):
+        offsets = from_html.index_tables(self.path)
+        self.assertEqual(3, len(offsets))
+        for start, end in offsets:
+            self.assertTrue(self.html[start:end].lower().startswith(b'<table'))
+            self.assertTrue(self.html[start:end].lower().endswith(b'</table>'))
+        self.assertIs(offsets, from_html.index_tables(self.path))
+
+    def test_same_as_full_parse(self):
+        with open(self.path, encoding='UTF-8') as f:
+            tables = BeautifulSoup(f, features='lxml').find_all("table")
+        for table_number, html_table in enumerate(tables, start=1):
+            self.assertListEqual(from_html.makearray(html_table).tolist(),
+                                 from_html.read_file(self.path, table_number).tolist())
+
+    def test_out_of_range(self):
+        with self.assertRaises(InputError):
+            from_html.read_file(self.path, table_number=4)
+
+    def test_cache_bounded(self):
+        from_html._index_tables.cache_clear()
+        from_html.index_tables(self.path)
+        info = from_html._index_tables.cache_info()
+        self.assertEqual(from_html.TABLE_INDEX_CACHE_SIZE, info.maxsize)
+        self.assertEqual(1, info.currsize)
+
+    def test_modified_file(self):
+        from_html.index_tables(self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'<table><tr><td>new</td><td>table</td></tr></table>')
+        os.utime(self.path, ns=(0, 0))
+        self.assertListEqual([['new', 'table']], from_html.read_file(self.path).tolist())
+
+    def test_tables_only(self):
+        html = self.html.decode('UTF-8')
+        for table_number in range(1, 4):
+            self.assertListEqual(from_html.read_string(html, table_number, tables_only=False).tolist(),
+                                 from_html.read_string(html, table_number).tolist())
+        soup = from_html.parse(html)
+        self.assertIsNone(soup.find('script'))
+        self.assertIsNone(soup.find('p'))
+        self.assertEqual(3, len(soup.find_all('table')))
+
+
+class TestMakeArray(unittest.TestCase):
+
+    def test_spanning_header(self):
+        html = '<table><tr><th rowspan="2">Material</th><th colspan="2">Lattice</th></tr>' \
+               '<tr><th>a</th><th>c</th></tr><tr><td>Rutile</td><td>4.59</td><td>2.96</td></tr></table>'
+        expected = [['Material', 'Lattice', 'Lattice'], ['Material', 'a', 'c'], ['Rutile', '4.59', '2.96']]
+        self.assertListEqual(expected, from_html.read_string(html).tolist())
+
+    def test_grid_size_from_colspan(self):
+        html = '<table><tr><td colspan="4">Title</td></tr><tr><td>a</td><td>b</td></tr></table>'
+        expected = [['Title', 'Title', 'Title', 'Title'], ['a', 'b', '', '']]
+        self.assertListEqual(expected, from_html.read_string(html).tolist())
+
+    def test_rectangular_span(self):
+        html = '<table><tr><td rowspan="2" colspan="2">B</td><td>1</td></tr><tr><td>2</td></tr></table>'
+        self.assertListEqual([['B', 'B', '1'], ['B', 'B', '2']], from_html.read_string(html).tolist())
+
+    def test_rowspan_clipped(self):
+        html = '<table><tr><td rowspan="100">A</td><td>1</td></tr><tr><td>2</td></tr></table>'
+        self.assertListEqual([['A', '1'], ['A', '2']], from_html.read_string(html).tolist())
+
+    def test_row_covered_by_rowspan(self):
+        html = '<table><tr><td rowspan="2">v0</td></tr><tr></tr><tr><td>v1</td></tr></table>'
+        self.assertListEqual([['v0'], ['v0'], ['v1']], from_html.read_string(html).tolist())
+        html = '<table><tr><td rowspan="3">A</td><td>1</td></tr><tr></tr><tr><td>3</td></tr></table>'
+        self.assertListEqual([['A', '1'], ['A', ''], ['A', '3']], from_html.read_string(html).tolist())
+
+    def test_empty_rows_removed(self):
+        html = '<table><tr></tr><tr><td>a</td><td>b</td></tr><tr></tr><tr><td>1</td><td>2</td></tr><tr></tr></table>'
+        self.assertListEqual([['a', 'b'], ['1', '2']], from_html.read_string(html).tolist())
+
+    def test_invalid_spans(self):
+        html = '<table><tr><td colspan="x">a</td><td colspan="0">b</td><td colspan="2;">c</td></tr></table>'
+        self.assertListEqual([['a', 'b', 'c', 'c']], from_html.read_string(html).tolist())
+
+    def test_nested_table(self):
+        html = '<table><tr><td>a</td><td><table><tr><td>x</td><td>y</td></tr></table></td></tr>' \
+               '<tr><td>1</td><td>2</td></tr></table>'
+        self.assertListEqual([['a', 'xy'], ['1', '2']], from_html.read_string(html).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the input from html and csv text, bytes and file objects.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import io
+import os
+import tempfile
+
+from tabledataextractor import Table
+from tabledataextractor.input import from_any
+from tabledataextractor.exceptions import InputError
+
+log = logging.getLogger(__name__)
+
+
+class TestInputText(unittest.TestCase):
+
+    csv_path = './tests/data/table_example1.csv'
+    html_text = '<html><body><table><tr><th rowspan="2">Material</th><th colspan="2">Lattice</th></tr>' \
+                '<tr><th>a</th><th>c</th></tr><tr><td>Rutile</td><td>4.59</td><td>2.96</td></tr>' \
+                '<tr><td>Anatase</td><td>3.78</td><td>9.51</td></tr></table></body></html>'
+
+    def setUp(self):
+        with open(self.csv_path, encoding='utf-8') as f:
+            self.csv_text = f.read()
+        fd, self.html_path = tempfile.mkstemp(suffix='.html')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(self.html_text)
+
+    def tearDown(self):
+        os.remove(self.html_path)
+
+    def test_csv_string(self):
+        table = Table(self.csv_path)
+        self.assertListEqual(table.raw_table.tolist(), Table(self.csv_text).raw_table.tolist())
+        self.assertListEqual(table.category_table, Table(self.csv_text).category_table)
+
+    def test_html_string(self):
+        table = Table(self.html_path)
+        self.assertListEqual(table.raw_table.tolist(), Table(self.html_text).raw_table.tolist())
+
+    def test_bytes(self):
+        table = Table(self.html_path)
+        self.assertListEqual(table.raw_table.tolist(), Table(self.html_text.encode('utf-8')).raw_table.tolist())
+
+    def test_file_objects(self):
+        table = Table(self.csv_path)
+        self.assertListEqual(table.raw_table.tolist(), Table(io.StringIO(self.csv_text)).raw_table.tolist())
+        self.assertListEqual(table.raw_table.tolist(),
+                             Table(io.BytesIO(self.csv_text.encode('utf-8'))).raw_table.tolist())
+
+    def test_inline_html(self):
+        html = '<p>Text</p><TABLE><tr><th>a</th><th colspan="2">b</th></tr><tr><td>1</td><td>2</td><td>3</td></tr>' \
+               '</TABLE><table><tr><td>x</td><td>y</td></tr><tr><td>5</td><td>6</td></tr></table>'
+        self.assertListEqual([['a', 'b', 'b'], ['1', '2', '3']], from_any.create_table(html).tolist())
+        self.assertListEqual([['x', 'y'], ['5', '6']], from_any.create_table(html, table_number=2).tolist())
+        with self.assertRaises(InputError):
+            from_any.create_table(html, table_number=3)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            from_any.create_table(42)
+        with self.assertRaises(TypeError):
+            from_any.create_table('no_such_file.txt')
+
+    def test_raw_table_read_once(self):
+        table = Table(io.StringIO(self.csv_text))
+        self.assertIs(table.raw_table, table.raw_table)
+        self.assertTrue(len(repr(table)) > 0)
+
+    def test_describe(self):
+        self.assertEqual('<3 bytes>', from_any.describe(b'a,b'))
+        self.assertLessEqual(len(from_any.describe(self.html_text)), 80)
+        self.assertNotIn('\n', from_any.describe(self.csv_text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the export of table artefacts to csv and jsonl files.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+from tabledataextractor import Table
+from tabledataextractor.output import export
+
+log = logging.getLogger(__name__)
+
+
+class TestExport(unittest.TestCase):
+
+    path = './tests/data/table_example_footnotes.csv'
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.table = Table(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_infer(self):
+        self.assertEqual('gzip', export.infer_compression('a.jsonl.GZ'))
+        self.assertIsNone(export.infer_compression('a.csv'))
+        self.assertEqual('jsonl', export.infer_format('a.jsonl.zst'))
+        self.assertEqual('csv', export.infer_format('a.csv.gz'))
+
+    def test_csv_arrays(self):
+        for artefact in ('raw_table', 'pre_cleaned_table', 'labels'):
+            file_path = os.path.join(self.directory, artefact + '.csv')
+            self.table.to_csv(file_path, artefact=artefact)
+            with open(file_path, encoding='utf-8', newline='') as f:
+                self.assertListEqual(getattr(self.table, artefact).tolist(), list(csv.reader(f)))
+
+    def test_gzip_jsonl(self):
+        file_path = os.path.join(self.directory, 'category_table.jsonl.gz')
+        self.table.to_jsonl(file_path)
+        with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        expected = [{'data': data, 'row_categories': row_categories, 'column_categories': column_categories}
+                    for data, row_categories, column_categories in self.table.category_table]
+        self.assertListEqual(expected, records)
+
+    def test_gzip_csv(self):
+        file_path = os.path.join(self.directory, 'raw_table.csv.gz')
+        self.table.to_csv(file_path)
+        with gzip.open(file_path, 'rt', encoding='utf-8', newline='') as f:
+            self.assertListEqual(self.table.raw_table.tolist(), list(csv.reader(f)))
+
+    def test_footnotes(self):
+        file_path = os.path.join(self.directory, 'footnotes.csv')
+        self.table.to_csv(file_path, artefact='footnotes')
+        with open(file_path, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertListEqual([footnote.prefix for footnote in self.table.footnotes], [row['prefix'] for row in rows])
+        self.assertListEqual([list(cell) for cell in self.table.footnotes[0].reference_cells],
+                             json.loads(rows[0]['reference_cells']))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            export.export(self.table, os.path.join(self.directory, 'x.csv'), artefact='cells')
+        with self.assertRaises(ValueError):
+            export.open_output(os.path.join(self.directory, 'x.csv'), compression='bz2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the printing of tables.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import io
+import numpy as np
+
+from tabledataextractor import Table
+from tabledataextractor.output.print import as_string, print_table, truncate, REPR_MAX_ROWS
+
+log = logging.getLogger(__name__)
+
+
+class TestPrint(unittest.TestCase):
+
+    table = np.array([['a', 'bbb', ''], ['dddd', 'e', 'f']], dtype='<U60')
+
+    def test_as_string(self):
+        self.assertEqual('a     bbb     \ndddd  e    f  \n\n', as_string(self.table))
+        self.assertEqual('\n\n\n', as_string(np.empty((2, 0), dtype='<U60')))
+
+    def test_print_table(self):
+        f = io.StringIO()
+        print_table(self.table, file=f)
+        self.assertEqual(as_string(self.table) + '\n', f.getvalue())
+
+    def test_truncate(self):
+        table = np.arange(100).astype('<U60').reshape(10, 10)
+        truncated = truncate(table, max_rows=4, max_columns=3)
+        self.assertEqual((5, 4), truncated.shape)
+        self.assertListEqual(['0', '1', '...', '9'], truncated[0].tolist())
+        self.assertListEqual(['...'] * 4, truncated[2].tolist())
+        self.assertListEqual(['90', '91', '...', '99'], truncated[4].tolist())
+        self.assertEqual(as_string(table[:2, :2]), as_string(table[:2, :2], max_rows=2, max_columns=2))
+
+    def test_repr_truncated(self):
+        raw_table = [['', 'A', 'B']] + [['row {}'.format(i), str(i), str(2 * i)] for i in range(120)]
+        representation = repr(Table(raw_table))
+        self.assertIn('...', representation)
+        self.assertLess(representation.count('\n'), 6 * REPR_MAX_ROWS)
+
+
+if __name__ == '__main__':
+    unittest.main()
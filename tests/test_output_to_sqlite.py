@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the output to an SQLite database.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import os
+import sqlite3
+import tempfile
+
+from tabledataextractor import Table
+from tabledataextractor.output import to_sqlite
+
+log = logging.getLogger(__name__)
+
+
+class TestOutputSqlite(unittest.TestCase):
+
+    path = './tests/data/table_example1.csv'
+    path_footnotes = './tests/data/table_example_footnotes.csv'
+
+    def category_table(self, connection, table_id):
+        """Rebuilds the category table from the database."""
+        categories = {}
+        for axis, position, category in connection.execute(
+                "SELECT axis, position, category FROM categories WHERE table_id = ? ORDER BY axis, position, level",
+                (table_id,)):
+            categories.setdefault((axis, position), []).append(category)
+        return [[value, categories[('row', row)], categories[('column', column)]] for value, row, column in
+                connection.execute("SELECT value, row, column FROM data_points WHERE table_id = ? "
+                                   "ORDER BY row, column", (table_id,))]
+
+    def test_category_table(self):
+        table = Table(self.path)
+        connection = to_sqlite.connect(':memory:')
+        table_id, = to_sqlite.write_to_sqlite([(table, self.path, 1)], connection, batch_size=7)
+        self.assertListEqual(table.category_table, self.category_table(connection, table_id))
+        self.assertTupleEqual((self.path, 1, 7, 8, 0, 0, 0, 1, 1, 2, 2, 6, 7),
+                              connection.execute("SELECT * FROM tables").fetchone()[1:])
+        labels = [label for label, in connection.execute("SELECT label FROM cells ORDER BY row, column")]
+        self.assertListEqual(table.labels.ravel().tolist(), labels)
+
+    def test_replace(self):
+        table = Table(self.path)
+        connection = to_sqlite.connect(':memory:')
+        to_sqlite.write_to_sqlite([(table, self.path, 1), (table, 'other', 1)], connection, cells=False)
+        to_sqlite.write_to_sqlite([(table, self.path, 1)], connection, cells=False)
+        self.assertEqual(2, connection.execute("SELECT count(*) FROM tables").fetchone()[0])
+        self.assertEqual(2 * table.data.size, connection.execute("SELECT count(*) FROM data_points").fetchone()[0])
+        self.assertEqual(0, connection.execute("SELECT count(*) FROM cells").fetchone()[0])
+
+    def test_replace_without_foreign_keys(self):
+        table = Table(self.path_footnotes)
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            to_sqlite.connect(path).close()
+            connection = sqlite3.connect(path)
+            for _ in range(2):
+                table_id, = to_sqlite.write_to_sqlite([(table, self.path_footnotes, 1)], connection)
+            to_sqlite.write_to_sqlite([(table, 'other', 1), (table, 'other', 1)], connection)
+            self.assertListEqual(table.category_table, self.category_table(connection, table_id))
+            for name in ('data_points', 'categories', 'footnotes', 'footnote_references', 'cells'):
+                self.assertEqual(0, connection.execute("SELECT count(*) FROM {} WHERE table_id NOT IN "
+                                                       "(SELECT id FROM tables)".format(name)).fetchone()[0])
+            self.assertEqual(2 * table.data.size,
+                             connection.execute("SELECT count(*) FROM data_points").fetchone()[0])
+            connection.close()
+        finally:
+            os.remove(path)
+
+    def test_footnotes(self):
+        table = Table(self.path_footnotes)
+        connection = to_sqlite.connect(':memory:')
+        table_id, = to_sqlite.write_to_sqlite([(table, self.path_footnotes, 1)], connection)
+        footnotes = connection.execute("SELECT prefix, text FROM footnotes WHERE table_id = ? ORDER BY footnote",
+                                       (table_id,)).fetchall()
+        self.assertListEqual([(footnote.prefix, footnote.text) for footnote in table.footnotes], footnotes)
+        n_references = sum(len(footnote.reference_cells) for footnote in table.footnotes)
+        self.assertEqual(n_references, connection.execute("SELECT count(*) FROM footnote_references").fetchone()[0])
+
+    def test_table_to_sqlite(self):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            table = Table(self.path)
+            table_id = table.to_sqlite(path, wal=True)
+            connection = sqlite3.connect(path)
+            self.assertListEqual(table.category_table, self.category_table(connection, table_id))
+            self.assertEqual('wal', connection.execute("PRAGMA journal_mode").fetchone()[0])
+            connection.close()
+        finally:
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+
+if __name__ == '__main__':
+    unittest.main()
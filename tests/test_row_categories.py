@@ -45,6 +45,14 @@ class TestRowCategories(unittest.TestCase):
         table = table.row_categories
         self.assertIsNone(table)
 
+    def test_cached(self):
+        table = Table("./tests/data/row_categories_table.csv")
+        self.assertIs(table.category_table, table.category_table)
+        self.assertIs(table.row_categories, table.row_categories)
+        row_categories = table.row_categories
+        table.transpose()
+        self.assertIsNot(row_categories, table.row_categories)
+
 
 if __name__ == '__main__':
     unittest.main()
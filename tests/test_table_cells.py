@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the sparse store of the non-empty cells of tables.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+
+import numpy as np
+
+from tabledataextractor import Table
+from tabledataextractor.table.algorithms import empty_cells, find_note_cells, EMPTY_CELL
+from tabledataextractor.table.parse import CellParser
+from tabledataextractor.table import labels
+from tabledataextractor.table.cells import SparseCells
+
+log = logging.getLogger(__name__)
+
+
+class TestSparseCells(unittest.TestCase):
+
+    table = np.array([['Title', '', '', ''],
+                      ['', '', '', ''],
+                      ['a', '', 'b', 'c'],
+                      ['', ' ', '1', '-']])
+
+    def setUp(self):
+        self.empty = empty_cells(self.table)
+        self.cells = SparseCells.from_array(self.table, self.empty)
+
+    def test_from_array(self):
+        self.assertEqual(5, len(self.cells))
+        self.assertTupleEqual((4, 4), self.cells.shape)
+        self.assertListEqual([0, 2, 2, 2, 3], self.cells.rows.tolist())
+        self.assertListEqual([0, 0, 2, 3, 2], self.cells.columns.tolist())
+        self.assertListEqual(['Title', 'a', 'b', 'c', '1'], self.cells.values.tolist())
+        self.assertListEqual([0, 1, 1, 4, 5], self.cells.row_starts.tolist())
+        self.assertListEqual(self.empty.tolist(), self.cells.empty.tolist())
+        self.assertListEqual(np.where(self.empty, '', self.table).tolist(), self.cells.to_array().tolist())
+
+    def test_from_table(self):
+        cells = SparseCells.from_table(self.table, CellParser(EMPTY_CELL))
+        self.assertListEqual(self.cells.rows.tolist(), cells.rows.tolist())
+        self.assertListEqual(self.cells.columns.tolist(), cells.columns.tolist())
+        self.assertListEqual(self.cells.values.tolist(), cells.values.tolist())
+        self.assertEqual('<U5', cells.values.dtype)
+        self.assertListEqual(np.where(self.empty, '', self.table).tolist(), cells.to_array().tolist())
+        # blank cells are not empty if the empty string is not matched
+        cells = SparseCells.from_table(self.table, CellParser(r'^-$'))
+        self.assertListEqual((self.table == '-').tolist(), cells.empty.tolist())
+
+    def test_positions_only(self):
+        cells = SparseCells.from_table(self.table, CellParser(EMPTY_CELL), values=False)
+        self.assertIsNone(cells.values)
+        self.assertEqual(5, len(cells))
+        self.assertListEqual(self.cells.row_counts().tolist(), cells.row_counts().tolist())
+        self.assertListEqual(self.cells.column_counts().tolist(), cells.column_counts().tolist())
+        with self.assertRaises(ValueError):
+            cells.to_array()
+
+    def test_region_empty(self):
+        for rows, columns in ((slice(None), slice(None)), (slice(1, 3), slice(2, None)), (slice(0, 1), slice(0, 3)),
+                              (slice(2, None), slice(1, 2)), (slice(3, 2), slice(0, 4)), (slice(0, 4), slice(2, 2))):
+            self.assertListEqual(self.empty[rows, columns].tolist(), self.cells.region_empty(rows, columns).tolist())
+
+    def test_is_empty(self):
+        for row in range(4):
+            for column in range(4):
+                self.assertEqual(bool(self.empty[row, column]), self.cells.is_empty(row, column))
+
+    def test_counts(self):
+        filled = ~self.empty
+        self.assertListEqual(filled.sum(axis=1).tolist(), self.cells.row_counts().tolist())
+        self.assertListEqual(filled[:, 2:].sum(axis=1).tolist(), self.cells.row_counts(2).tolist())
+        self.assertListEqual(filled[:, 1:3].sum(axis=1).tolist(), self.cells.row_counts(1, 3).tolist())
+        self.assertListEqual(filled.sum(axis=0).tolist(), self.cells.column_counts().tolist())
+        self.assertListEqual(filled[1:3].sum(axis=0).tolist(), self.cells.column_counts(1, 3).tolist())
+        self.assertListEqual([0, 0, 0, 0], self.cells.column_counts(3, 2).tolist())
+
+    def test_above_and_below(self):
+        self.assertListEqual(['Title', 'a', 'b', 'c'], self.cells.values[self.cells.above(3)].tolist())
+        self.assertListEqual(['1'], self.cells.values[self.cells.below(2)].tolist())
+        self.assertListEqual([], self.cells.values[self.cells.below(3)].tolist())
+
+    def test_no_cells(self):
+        cells = SparseCells.from_array(np.full((2, 3), '', dtype='<U60'), np.ones((2, 3), dtype=bool))
+        self.assertEqual(0, len(cells))
+        self.assertListEqual([0, 0], cells.row_counts().tolist())
+        self.assertListEqual([0, 0, 0], cells.column_counts().tolist())
+        self.assertTrue(cells.is_empty(1, 2))
+
+
+class TestTableCells(unittest.TestCase):
+
+    def test_cached(self):
+        table = Table('./tests/data/table_example1.csv')
+        cells = table.pre_cleaned_table_cells
+        self.assertIs(cells, table.pre_cleaned_table_cells)
+        self.assertListEqual(table._empty(table.pre_cleaned_table).tolist(), cells.empty.tolist())
+
+    def test_mostly_empty_table(self):
+        # a spreadsheet-like layout, with most of the data cells empty
+        random = np.random.RandomState(0)
+        array = np.full((60, 20), '', dtype='<U60')
+        array[0, 1:] = ['Property {}'.format(column) for column in range(19)]
+        array[1:, 0] = ['S{}'.format(row) for row in range(59)]
+        array[1:, 1:] = np.where(random.rand(59, 19) < 0.15, np.char.mod('%d', random.randint(0, 1000, (59, 19))), '')
+        array[30, 1:15] = 'x'
+        table = Table(array)
+        filled = ~table.pre_cleaned_table_empty
+        self.assertEqual(np.flatnonzero(filled.sum(axis=1) > filled.shape[1] // 2)[-1], table._cc4[0])
+        codes = random.choice([labels.NONE, labels.DATA], size=filled.shape)
+        self.assertListEqual(((codes == labels.NONE) & filled).tolist(), find_note_cells(table, codes).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
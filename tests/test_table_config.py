@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the immutable, shared configuration of tables.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import gc
+import unittest
+import logging
+import pickle
+
+from tabledataextractor import Table, TrivialTable
+from tabledataextractor.exceptions import InputError
+from tabledataextractor.table import config as config_module
+from tabledataextractor.table.config import Config, TrivialConfig
+
+log = logging.getLogger(__name__)
+
+
+class TestConfig(unittest.TestCase):
+
+    def test_defaults(self):
+        config = Config.create()
+        self.assertDictEqual(dict(Config.DEFAULTS), dict(config))
+        self.assertTrue(config['use_title_row'])
+        self.assertIsNone(config['row_header'])
+
+    def test_shared(self):
+        self.assertIs(Config.create(use_title_row=False), Config.create(use_title_row=False))
+        self.assertIs(Config.create(), Config.create(use_title_row=True))
+        self.assertIs(Config.create(use_prefixing=False, row_header=0),
+                      Config.create(row_header=0, use_prefixing=False))
+        table_1 = Table('./tests/data/table_example1.csv', use_prefixing=False)
+        table_2 = Table('./tests/data/table_example2.csv', use_prefixing=False)
+        self.assertIs(table_1.configs, table_2.configs)
+
+    def test_immutable(self):
+        config = Config.create()
+        with self.assertRaises(TypeError):
+            config['use_title_row'] = False
+        with self.assertRaises(AttributeError):
+            config.empty_parser = None
+
+    def test_hashable(self):
+        cache = {Config.create(): 1}
+        self.assertEqual(1, cache[Config(use_title_row=True)])
+        self.assertNotEqual(hash(Config.create()), hash(Config.create(use_title_row=False)))
+        self.assertNotEqual(Config.create(row_header=0), TrivialConfig.create())
+
+    def test_replace(self):
+        config = Config.create(use_prefixing=False)
+        replaced = config.replace(use_title_row=False)
+        self.assertFalse(replaced['use_title_row'])
+        self.assertFalse(replaced['use_prefixing'])
+        self.assertTrue(config['use_title_row'])
+        self.assertIs(replaced, Config.create(use_title_row=False, use_prefixing=False))
+
+    def test_invalid(self):
+        with self.assertRaises(InputError):
+            Config.create(use_titles=False)
+        with self.assertRaises(InputError):
+            Config.create(orientation='diagonal')
+        with self.assertRaises(InputError):
+            Config.create(row_header=-1)
+        with self.assertRaises(InputError):
+            Config.create(use_prefixing='no')
+        with self.assertRaises(InputError):
+            TrivialConfig.create(use_prefixing=False)
+        with self.assertRaises(InputError):
+            Table('./tests/data/table_example1.csv', use_titles=False)
+
+    def test_pickle(self):
+        config = Config.create(use_title_row=False)
+        self.assertIs(config, pickle.loads(pickle.dumps(config)))
+
+    def test_unused_configs_dropped(self):
+        pattern = r'^(\s*|unused)$'
+        config = Config.create(empty_cell=pattern)
+        self.assertIn(config, config_module._INSTANCES.values())
+        del config
+        gc.collect()
+        self.assertNotIn(pattern, [config['empty_cell'] for config in config_module._INSTANCES.values()])
+
+    def test_trivial_table(self):
+        table = TrivialTable('./tests/data/table_example1.csv', row_header=1)
+        self.assertIsInstance(table.configs, TrivialConfig)
+        self.assertEqual(1, table.configs['row_header'])
+
+
+class TestEmptyCell(unittest.TestCase):
+
+    table = [['Material', 'Tc (K)', 'a (Å)', ''],
+             ['n/a', 'n/a', 'n/a', 'n/a'],
+             ['YBCO', '93', '3.82', 'n/a'],
+             ['MgB2', 'nd', '3.09', '—'],
+             ['Nb', '9.3', '×', 'n/a']]
+
+    empty_cell = r'^([\s\-\–\—\"]+|n/a|nd|×)?$'
+
+    def test_default(self):
+        table = Table(self.table)
+        self.assertIn('n/a', table.pre_cleaned_table)
+        self.assertIn('×', table.data)
+
+    def test_custom(self):
+        table = Table(self.table, empty_cell=self.empty_cell)
+        self.assertEqual((4, 3), table.pre_cleaned_table.shape)
+        self.assertListEqual([['93', '3.82'], ['NoValue', '3.09'], ['9.3', 'NoValue']], table.data.tolist())
+
+    def test_mask(self):
+        table = Table(self.table, empty_cell=self.empty_cell)
+        empty = table.pre_cleaned_table_empty
+        self.assertListEqual(table._empty(table.pre_cleaned_table).tolist(), empty.tolist())
+        self.assertEqual(2, empty.sum())
+
+    def test_invalid(self):
+        with self.assertRaises(InputError):
+            Table(self.table, empty_cell='(')
+
+
+if __name__ == '__main__':
+    unittest.main()
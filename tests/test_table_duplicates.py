@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the search for duplicate rows and columns in slices of tables.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+
+import numpy as np
+
+from tabledataextractor import Table
+from tabledataextractor.table.algorithms import duplicate_rows, duplicate_columns, clean_unicode
+from tabledataextractor.table.duplicates import DuplicateIndex, DIRECT_LINES
+
+log = logging.getLogger(__name__)
+
+
+def brute_force(array, rows, columns, axis):
+    """Searches a slice of `array` for duplicate rows (`axis=0`) or columns (`axis=1`) by comparing all pairs."""
+    section = array[rows[0]:rows[1], columns[0]:columns[1]]
+    lines = section if axis == 0 else section.T
+    if lines.ndim < 2 or lines.shape[1] == 0:
+        return False
+    lines = [tuple(line) for line in lines.tolist()]
+    return len(set(lines)) < len(lines)
+
+
+class TestDuplicateIndex(unittest.TestCase):
+
+    def check(self, array, index, n_slices, random):
+        n_rows, n_columns = array.shape
+        for _ in range(n_slices):
+            rows = tuple(sorted(random.randint(0, n_rows + 2, size=2)))
+            columns = tuple(sorted(random.randint(0, n_columns + 2, size=2)))
+            self.assertEqual(brute_force(array, rows, columns, 0), index.duplicate_rows(rows, columns))
+            self.assertEqual(brute_force(array, rows, columns, 1), index.duplicate_columns(rows, columns))
+
+    def test_random_slices(self):
+        random = np.random.RandomState(0)
+        for _ in range(20):
+            shape = random.randint(1, 2 * DIRECT_LINES, size=2)
+            array = random.choice(['', 'a', 'b'], size=shape).astype('<U60')
+            self.check(array, DuplicateIndex(array), 200, random)
+
+    def test_collisions(self):
+        # with all hashes equal, every duplicate that is found has to be verified
+        random = np.random.RandomState(1)
+        array = random.choice(['a', 'b', 'c', 'd'], size=(3 * DIRECT_LINES, 4)).astype('<U60')
+        index = DuplicateIndex(array)
+        index._prefixes = tuple(np.zeros_like(prefix) for prefix in index._prefixes)
+        self.check(array, index, 300, random)
+
+    def test_functions(self):
+        table = np.array([['a', 'b', 'a'],
+                          ['c', 'd', 'c']])
+        self.assertFalse(duplicate_rows(table))
+        self.assertTrue(duplicate_columns(table))
+        self.assertTrue(duplicate_rows(table[0]))
+        self.assertFalse(duplicate_rows(table[0, :2]))
+        self.assertFalse(duplicate_columns(table[0, 0]))
+
+
+class TestCleanUnicode(unittest.TestCase):
+
+    def test_same_as_replace(self):
+        for table in (np.array([['a\xa0b', 'x'], ['\xa0', 'yy']], dtype='<U60'),
+                      np.array([['', '']], dtype='<U60'),
+                      np.array([['ab', 'c']], dtype='<U9')):
+            expected = np.char.replace(table, '\xa0', ' ')
+            cleaned = clean_unicode(table)
+            self.assertEqual(expected.dtype, cleaned.dtype)
+            self.assertListEqual(expected.tolist(), cleaned.tolist())
+
+
+class TestLargeTable(unittest.TestCase):
+
+    def test_large_table(self):
+        n_rows = 5000
+        random = np.random.RandomState(0)
+        table = np.empty((n_rows + 2, 5), dtype='<U60')
+        table[0] = ['', 'Group A', 'Group A', 'Group B', 'Group B']
+        table[1] = ['Sample', 'x', 'y', 'x', 'y']
+        table[2:, 0] = ['S{}'.format(row) for row in range(n_rows)]
+        table[2:, 1:] = np.char.mod('%d', random.randint(0, 100, size=(n_rows, 4)))
+        table = Table(table)
+        self.assertTupleEqual((0, 0), table._cc1)
+        self.assertTupleEqual((1, 0), table._cc2)
+        self.assertTupleEqual((n_rows + 1, 4), table._cc4)
+        self.assertEqual(4 * n_rows, len(table.category_table))
+        self.assertListEqual([table.data[0, 0], ['S0'], ['Group A', 'x']], table.category_table[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
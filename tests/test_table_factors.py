@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the header factorization.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import numpy as np
+
+from tabledataextractor import Table
+from tabledataextractor.table.factors import factorize, to_string, PRODUCT, UNIT
+from tabledataextractor.table.algorithms import build_category_table
+
+log = logging.getLogger(__name__)
+
+
+def expand(tree):
+    """Expands a category tree into the set of its paths, as tuples of labels."""
+    if isinstance(tree, str):
+        return {(tree,)}
+    if tree[0] == PRODUCT:
+        paths = {()}
+        for factor in tree[1:]:
+            paths = {path + rest for path in paths for rest in expand(factor)}
+        return paths
+    return set().union(*(expand(term) for term in tree[1:]))
+
+
+class TestFactorize(unittest.TestCase):
+
+    def test_product(self):
+        header = np.array([['A', 'a'], ['A', 'b'], ['B', 'a'], ['B', 'b']])
+        self.assertEqual(('*', ('+', 'A', 'B'), ('+', 'a', 'b')), factorize(header))
+        self.assertEqual('(A + B) * (a + b)', to_string(factorize(header)))
+
+    def test_sum_of_products(self):
+        header = np.array([['A', 'a'], ['A', 'b'], ['B', 'c']])
+        self.assertEqual('A * (a + b) + B * c', to_string(factorize(header)))
+
+    def test_common_factor(self):
+        header = np.array([['A', 'x'], ['A', 'y'], ['B', 'x'], ['B', 'y'], ['C', 'z']])
+        self.assertEqual('(A + B) * (x + y) + C * z', to_string(factorize(header)))
+
+    def test_three_levels(self):
+        header = np.array([['T', 'A', 'a'], ['T', 'A', 'b'], ['T', 'B', 'a'], ['T', 'B', 'b']])
+        self.assertEqual(('*', 'T', ('+', 'A', 'B'), ('+', 'a', 'b')), factorize(header))
+
+    def test_empty_cells_and_duplicates(self):
+        header = np.array([['', 'a'], ['', 'b'], ['', 'a']])
+        self.assertEqual(('+', 'a', 'b'), factorize(header))
+        self.assertIsNone(factorize(np.empty((0, 2), dtype='<U60')))
+
+    def test_paths_ending_early(self):
+        header = np.array([['A', ''], ['A', 'b']])
+        self.assertEqual(('*', 'A', ('+', UNIT, 'b')), factorize(header))
+        self.assertEqual('A * (1 + b)', to_string(factorize(header)))
+        self.assertSetEqual({('A',), ('A', 'b')}, expand(factorize(header)))
+
+    def test_expands_to_paths(self):
+        random = np.random.RandomState(0)
+        for _ in range(200):
+            header = random.choice(['', 'A', 'B', 'C'], size=(random.randint(1, 8), random.randint(1, 4)))
+            paths = {tuple(label for label in row if label) for row in header.tolist()}
+            tree = factorize(header)
+            self.assertSetEqual(paths - {()}, expand(tree) - {()} if tree is not None else set())
+
+    def test_empty_cell_config(self):
+        header = np.array([['-', 'a'], ['-', 'b']])
+        self.assertEqual('a + b', to_string(factorize(header, header == '-')))
+        table = [['', '', 'P', 'n/a', 'Q'],
+                 ['', '', 'a', 'b', 'a'],
+                 ['x', 'c', '1', '2', '5'],
+                 ['y', 'd', '3', '4', '6']]
+        self.assertEqual('(P + Q) * a + n/a * b', to_string(Table(table).col_header_factors))
+        self.assertEqual('(P + Q) * a + b', to_string(Table(table, empty_cell=r'^(\s*|n/a)$').col_header_factors))
+
+    def test_table(self):
+        table = Table('./tests/data/table_example1.csv')
+        self.assertEqual('(Rutile + Anatase) * (a = b (A) + c (A) + u)', to_string(table.col_header_factors))
+        self.assertEqual('Computational * (This study + GGA [25] + GGA [26] + HF [27]) + Experimental * Expt. [23]',
+                         to_string(table.row_header_factors))
+        self.assertEqual((table.row_header_factors, table.col_header_factors),
+                         build_category_table(table.pre_cleaned_table, table._cc1, table._cc2, table._cc3, table._cc4))
+
+
+if __name__ == '__main__':
+    unittest.main()
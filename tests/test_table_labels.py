@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the label codes of the table.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import numpy as np
+
+from tabledataextractor import Table
+from tabledataextractor.table import labels
+
+log = logging.getLogger(__name__)
+
+
+class TestLabels(unittest.TestCase):
+
+    def test_label_codes(self):
+        table = Table("./tests/data/table_example_footnotes.csv")
+        codes = table.label_codes
+        self.assertEqual(labels.DTYPE, codes.dtype)
+        self.assertIs(codes, table.label_codes)
+        self.assertListEqual(table.labels.tolist(), labels.label_strings(codes).tolist())
+        self.assertEqual(table.data.size, np.count_nonzero(codes & labels.REGION_MASK == labels.DATA))
+
+    def test_label_names(self):
+        self.assertEqual('/', labels.LABEL_NAMES[labels.NONE])
+        self.assertEqual('FNtext', labels.LABEL_NAMES[labels.FN_TEXT])
+        self.assertEqual('FNprefix & FNtext', labels.LABEL_NAMES[labels.FN_PREFIX | labels.FN_TEXT])
+        self.assertEqual('Data & FNref & FNref', labels.LABEL_NAMES[labels.DATA + 2 * labels.FN_REF])
+
+    def test_labels_reset_on_transpose(self):
+        table = Table("./tests/data/table_example1.csv")
+        shape = table.label_codes.shape
+        table.transpose()
+        self.assertTupleEqual(shape[::-1], table.label_codes.shape)
+        self.assertTrue(np.array_equal(table.labels, labels.label_strings(table.label_codes)))
+
+
+if __name__ == '__main__':
+    unittest.main()
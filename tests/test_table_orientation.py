@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the automatic detection of the table orientation.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import os
+import unittest
+import logging
+
+from tabledataextractor import Table
+from tabledataextractor.exceptions import InputError, MIPSError
+from tabledataextractor.table.table import orientation_executor
+
+log = logging.getLogger(__name__)
+
+
+class TestOrientation(unittest.TestCase):
+
+    table = [['', 'Rutile', 'Anatase', 'Brookite'],
+             ['Space group', 'P42/mnm', 'I41/amd', 'Pbca'],
+             ['a', '4.59', '3.78', '9.18'],
+             ['c', '2.96', '9.51', '5.14']]
+
+    def test_auto_transposed(self):
+        table = Table(self.table, orientation='auto')
+        expected = Table(self.table, orientation='transposed')
+        self.assertTrue(table.history.table_transposed)
+        self.assertListEqual(expected.category_table, table.category_table)
+        self.assertListEqual(expected.labels.tolist(), table.labels.tolist())
+        self.assertListEqual(expected.raw_table.tolist(), table.raw_table.tolist())
+
+    def test_auto_original(self):
+        path = './tests/data/table_example1.csv'
+        table = Table(path, orientation='auto')
+        self.assertFalse(table.history.table_transposed)
+        self.assertListEqual(Table(path).category_table, table.category_table)
+
+    def test_auto_fixtures(self):
+        # all test tables are laid out in the original orientation
+        for file_name in sorted(os.listdir('./tests/data')):
+            with self.subTest(file_name=file_name):
+                table = Table(os.path.join('./tests/data', file_name), orientation='auto')
+                self.assertFalse(table.history.table_transposed)
+
+    def test_auto_tie(self):
+        # the scores of both orientations differ only by rounding, the original orientation is kept
+        table = Table('./tests/data/te_08.csv', orientation='auto')
+        self.assertFalse(table.history.table_transposed)
+        self.assertListEqual(Table('./tests/data/te_08.csv').category_table, table.category_table)
+
+    def test_parallel(self):
+        table = Table(self.table, orientation='auto')
+        table_parallel = Table(self.table, orientation='auto', parallel_orientation=True)
+        self.assertTrue(table_parallel.history.table_transposed)
+        self.assertListEqual(table.category_table, table_parallel.category_table)
+
+    def test_shared_executor(self):
+        self.assertIs(orientation_executor(), orientation_executor())
+
+    def test_both_fail(self):
+        table = [['a', 'a', 'a'],
+                 ['a', 'a', 'a']]
+        for parallel in (False, True):
+            with self.assertRaises(MIPSError):
+                Table(table, orientation='auto', parallel_orientation=parallel)
+
+    def test_transpose(self):
+        table = Table(self.table)
+        table.transpose()
+        self.assertListEqual(Table(self.table, orientation='transposed').category_table, table.category_table)
+
+    def test_invalid_orientation(self):
+        with self.assertRaises(InputError):
+            Table(self.table, orientation='sideways')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Tests the regular expression cell parsers.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import numpy as np
+
+from tabledataextractor.table.parse import CellParser, StringParser, compile_pattern, PATTERN_CACHE_SIZE
+
+log = logging.getLogger(__name__)
+
+
+class TestCellParser(unittest.TestCase):
+
+    table = np.array([['a)', 'x', 'a)'], ['', 'b) text', 'a)']], dtype='<U60')
+
+    def test_parse_all_equals_parse(self):
+        parser = CellParser(r'^([a-z])\)\s?(.+)?$')
+        expected = list(parser.parse(self.table))
+        (rows, columns), groups = parser.parse_all(self.table)
+        result = [(row, column, group) for row, column, group in zip(rows.tolist(), columns.tolist(), groups)]
+        self.assertListEqual(expected, result)
+
+    def test_parse_all_one_dimensional(self):
+        parser = CellParser(r'^([a-z])\)')
+        (index,), groups = parser.parse_all(self.table[0])
+        self.assertListEqual([0, 2], index.tolist())
+        self.assertListEqual([('a',), ('a',)], groups.tolist())
+
+    def test_match_mask(self):
+        parser = CellParser(r'^([a-z])\)$')
+        expected = [[True, False, True], [False, False, True]]
+        self.assertListEqual(expected, parser.match_mask(self.table, method='fullmatch').tolist())
+
+    def test_empty_table(self):
+        parser = CellParser(r'^(a)$')
+        self.assertEqual((0, 3), parser.match_mask(np.empty((0, 3), dtype='<U60')).shape)
+
+    def test_pattern_compiled_once(self):
+        self.assertIs(CellParser(r'^(x)$')._prog, StringParser(r'^(x)$')._prog)
+        self.assertIs(compile_pattern(r'^(x)$'), CellParser(r'^(x)$')._prog)
+
+    def test_pattern_cache_bounded(self):
+        for index in range(PATTERN_CACHE_SIZE + 10):
+            compile_pattern(r'^(x{})$'.format(index))
+        self.assertEqual(PATTERN_CACHE_SIZE, compile_pattern.cache_info().currsize)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            StringParser(r'x').parse('x', method='findall')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,7 +13,7 @@ import logging
 from tabledataextractor import Table
 from tabledataextractor.input import from_csv
 from tabledataextractor.output.print import print_table
-from tabledataextractor.table.algorithms import find_cc4, find_cc1_cc2
+from tabledataextractor.table.algorithms import find_cc4, find_cc1_cc2, deduplicate, pre_clean
 import numpy as np
 import os
 
@@ -495,7 +495,41 @@ class TestSingleRowColumnTable(unittest.TestCase):
         self.do_table(input_path, expected, expected_t, expected_cat, expected_cat_t)
 
 
-if __name__ == '__main__':
-    unittest.main()
+class TestDeduplicate(unittest.TestCase):
+
+    def test_rows_and_columns(self):
+        table = np.array([['a', 'b', 'a'],
+                          ['c', 'd', 'c'],
+                          ['a', 'b', 'a'],
+                          ['a', 'b', 'a']])
+        rows = deduplicate(table, axis=0)
+        self.assertListEqual([0, 1], rows.kept)
+        self.assertListEqual([2, 3], rows.removed)
+        columns = deduplicate(table, axis=1)
+        self.assertListEqual([0, 1], columns.kept)
+        self.assertListEqual([2], columns.removed)
+
+    def test_empty(self):
+        self.assertEqual(([], []), deduplicate(np.empty((0, 3), dtype='<U60')))
+        self.assertEqual(([0], [1]), deduplicate(np.empty((2, 0), dtype='<U60')))
+
+    def test_same_as_unique(self):
+        random = np.random.RandomState(0)
+        for _ in range(50):
+            table = random.choice(['', 'a', 'b', 'ab'], size=(random.randint(1, 12), random.randint(1, 6)))
+            table = table[random.randint(0, len(table), size=2 * len(table))]
+            _, indices = np.unique(table, axis=0, return_index=True)
+            rows = deduplicate(table, axis=0)
+            self.assertListEqual(np.sort(indices).tolist(), rows.kept)
+            self.assertListEqual(sorted(set(range(len(table))) - set(rows.kept)), rows.removed)
+
+    def test_pre_clean(self):
+        table = np.array([['', '', '', ''],
+                          ['a', '', 'b', 'b'],
+                          ['c', '', 'd', 'd'],
+                          ['a', '', 'b', 'b']])
+        self.assertListEqual([['a', 'b'], ['c', 'd']], pre_clean(table).tolist())
 
 
+if __name__ == '__main__':
+    unittest.main()
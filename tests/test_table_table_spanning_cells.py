@@ -8,7 +8,10 @@ Tests the spanning cells extension
 import unittest
 import logging
 
+import numpy as np
+
 from tabledataextractor import Table
+from tabledataextractor.table.algorithms import fill_spanning_cells
 
 log = logging.getLogger(__name__)
 
@@ -51,6 +54,41 @@ class TestSpanningCells(unittest.TestCase):
         self.assertListEqual(labels, table.labels.tolist())
 
 
+class TestFillSpanningCells(unittest.TestCase):
+
+    def test_fill(self):
+        table = np.array([['Title', '', '', '', ''],
+                          ['A', '', '', 'B', ''],
+                          ['a', 'b', 'c', 'a', 'b'],
+                          ['', '', '', '', ''],
+                          ['1', '', '3', '', '5']], dtype='<U60')
+        expected = [['Title', '', '', '', ''],
+                    ['A', 'A', 'A', 'B', 'B'],
+                    ['a', 'b', 'c', 'a', 'b'],
+                    ['', '', '', '', ''],
+                    ['1', '1', '3', '3', '5']]
+        self.assertListEqual(expected, fill_spanning_cells(table, start_row=1).tolist())
+
+    def test_boundaries(self):
+        table = np.array([['A', '', '', 'B'],
+                          ['', '', '', ''],
+                          ['a', '', '', 'b']], dtype='<U60')
+        expected = [['A', '', '', 'B'],
+                    ['', '', '', ''],
+                    ['a', '', '', 'b']]
+        self.assertListEqual(expected, fill_spanning_cells(table).tolist())
+
+    def test_wide_header(self):
+        n_columns = 3000
+        table = np.full((4, n_columns), '', dtype='<U60')
+        table[0, ::10] = ['Group {}'.format(i) for i in range(n_columns // 10)]
+        table[1] = ['Item {}'.format(i % 10) for i in range(n_columns)]
+        table[2:] = np.arange(2 * n_columns).reshape(2, n_columns).astype(str)
+        filled = fill_spanning_cells(table)
+        self.assertListEqual(['Group {}'.format(i // 10) for i in range(n_columns)], filled[0].tolist())
+        self.assertListEqual(table[1:].tolist(), filled[1:].tolist())
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -7,8 +7,10 @@ Tests the subtables.
 
 import unittest
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 from tabledataextractor import Table
+from tabledataextractor.table.table import _analyze_subtable
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +61,49 @@ class TestSubtables(unittest.TestCase):
         table = Table("./tests/data/te_07.csv")
         self.assertTrue(not table.subtables)
 
+    def test_subtables_cached(self):
+        """Subtables are analyzed only once"""
+        table = Table("./tests/data/te_06.csv")
+        first = next(table.iter_subtables())
+        subtables = table.subtables
+        self.assertEqual(3, len(subtables))
+        self.assertIsNot(first, subtables[0])
+        for cached, subtable in zip(table.subtables, subtables):
+            self.assertIs(cached, subtable)
+        table.transpose()
+        self.assertIsNot(subtables[0], table.subtables[0])
+
+    def test_configs(self):
+        """Subtables are analyzed with the configuration of the table"""
+        table = Table("./tests/data/te_06.csv", empty_cell=r'^(\s*|n/a)$', use_title_row=False)
+        self.assertEqual(3, len(table.subtables))
+        for subtable in table.subtables:
+            self.assertEqual(table.configs, subtable.configs)
+
+    def test_parallel(self):
+        """Subtables analyzed in worker processes are the same as when analyzed sequentially"""
+        table = Table("./tests/data/te_06.csv")
+        parallel = list(table.iter_subtables(max_workers=2))
+        sequential = Table("./tests/data/te_06.csv").subtables
+        self.assertEqual(len(sequential), len(parallel))
+        for subtable_1, subtable_2 in zip(sequential, parallel):
+            self.assertListEqual(subtable_1.category_table, subtable_2.category_table)
+            self.assertListEqual(subtable_1.labels.tolist(), subtable_2.labels.tolist())
+
+    def test_shared_executor(self):
+        """A shared executor is used for several tables and is not shut down"""
+        sequential = Table("./tests/data/te_06.csv").subtables
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                parallel = list(Table("./tests/data/te_06.csv").iter_subtables(executor=executor))
+                self.assertListEqual([subtable.category_table for subtable in sequential],
+                                     [subtable.category_table for subtable in parallel])
+
+    def test_failure_isolated(self):
+        """Any error in the analysis of a subtable leaves out only that subtable"""
+        table = Table("./tests/data/te_06.csv")
+        self.assertIsNone(_analyze_subtable(3.5, table.configs))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
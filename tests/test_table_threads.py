@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests that the analysis doesn't modify shared state and can be run concurrently in threads.
+
+.. codeauthor:: Juraj Mavračić <jm2111@cam.ac.uk>
+"""
+
+import unittest
+import logging
+import glob
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from tabledataextractor import Table
+from tabledataextractor.exceptions import TDEError
+from tabledataextractor.table.algorithms import duplicate_spanning_cells, prefix_duplicate_labels, \
+    header_extension_down, header_extension_up, find_cc4, mips
+
+log = logging.getLogger(__name__)
+
+
+def analyze(path):
+    """Returns the results of the analysis of a table, or the type of the error."""
+    try:
+        table = Table(path)
+        return table.category_table, table.labels.tolist(), repr(table.history)
+    except TDEError as e:
+        return type(e)
+
+
+class TestThreads(unittest.TestCase):
+
+    paths = sorted(glob.glob('./tests/data/*.csv'))
+
+    def test_configs_read_only(self):
+        table = Table('./tests/data/te_04.csv')
+        with self.assertRaises(TypeError):
+            table.configs['use_title_row'] = False
+
+    def test_algorithms_do_not_modify_table(self):
+        table = Table('./tests/data/te_04.csv')
+        configs = dict(table.configs)
+        history = repr(table.history)
+        pre_cleaned_table = table.pre_cleaned_table.copy()
+        duplicate_spanning_cells(table, table.pre_cleaned_table)
+        prefix_duplicate_labels(table, table.pre_cleaned_table)
+        mips(table, find_cc4(table), table.pre_cleaned_table, configs=dict(configs, use_title_row=False))
+        cc1 = header_extension_up(table, table._cc1)
+        header_extension_down(table, cc1, table._cc2, table._cc4)
+        self.assertDictEqual(configs, dict(table.configs))
+        self.assertEqual(history, repr(table.history))
+        self.assertListEqual(pre_cleaned_table.tolist(), table.pre_cleaned_table.tolist())
+
+    def test_thread_pool(self):
+        expected = [analyze(path) for path in self.paths]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(analyze, self.paths * 3))
+        self.assertListEqual(expected * 3, results)
+
+    def test_transpose_shared(self):
+        table = Table('./tests/data/table_example1.csv')
+        transposed = Table('./tests/data/table_example1.csv', orientation='transposed')
+        table.transpose()
+        self.assertEqual('transposed', table.configs['orientation'])
+        self.assertListEqual(transposed.category_table, table.category_table)
+
+    def test_pickle(self):
+        table = Table('./tests/data/table_example1.csv')
+        unpickled = pickle.loads(pickle.dumps(table))
+        self.assertDictEqual(dict(table.configs), dict(unpickled.configs))
+        with self.assertRaises(TypeError):
+            unpickled.configs['use_title_row'] = False
+        self.assertListEqual(table.category_table, unpickled.category_table)
+
+
+if __name__ == '__main__':
+    unittest.main()